@@ -0,0 +1,162 @@
+"""
+Airtable 레코드 로컬 캐시 모듈 (증분 동기화)
+- 첫 실행: 조건에 맞는 레코드 전체를 받아 디스크에 저장
+- 이후 실행: 마지막 동기화 이후 수정/생성된 레코드만 받아서 병합
+  (LAST_MODIFIED_TIME() / CREATED_TIME() 수식 필터)
+- 조건에서 빠진 레코드(답안지유형 변경 등)는 최근 수정분 중 조건에 안 맞는 ID만 조회해서 매번 제거
+- 삭제된 레코드는 조건에 맞는 레코드 ID 전체 목록(필드 1개만)과 비교해야 알 수 있음
+  → 레코드 N개면 요청 ceil(N/100)회이므로 증분 동기화 DELETION_SCAN_EVERY 번마다,
+    또는 마지막 확인 후 DELETION_SCAN_MAX_AGE 가 지났을 때만 실행 (check_deletions=True 면 항상)
+  그 사이에 삭제된 레코드는 다음 확인 때까지 캐시에 남음
+
+캐시 파일은 sheet_cache 와 같은 방식으로 잠금 + 원자적 교체
+"""
+
+import os
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sheet_cache import file_lock
+
+
+CACHE_VERSION = 1
+SYNC_OVERLAP = 60  # 시계 오차 대비, 마지막 동기화 시각보다 이만큼 앞부터 다시 조회 (초)
+DELETION_SCAN_EVERY = 12            # 증분 동기화 N번마다 삭제 확인 (레코드 ID 전체 조회)
+DELETION_SCAN_MAX_AGE = 24 * 3600   # 마지막 삭제 확인 후 이 시간이 지나면 확인 (초)
+_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.000Z'
+
+
+def _airtable_time(moment: datetime) -> str:
+    """Airtable 수식용 UTC ISO 시각"""
+    return moment.strftime(_TIME_FORMAT)
+
+
+def _scan_due(entry: dict, now: datetime) -> bool:
+    """삭제 확인(레코드 ID 전체 조회)을 할 차례인지 (횟수 또는 경과 시간 기준)"""
+    if entry.get('syncs_since_scan', 0) + 1 >= DELETION_SCAN_EVERY:
+        return True
+    try:
+        scanned_at = datetime.strptime(entry['deletion_scan_at'], _TIME_FORMAT).replace(tzinfo=timezone.utc)
+    except (KeyError, TypeError, ValueError):
+        return True  # 확인 기록이 없는 이전 캐시
+    return (now - scanned_at).total_seconds() >= DELETION_SCAN_MAX_AGE
+
+
+class AirtableCache:
+    """테이블별 레코드 캐시 {레코드 ID: 필드}"""
+
+    def __init__(self, cache_dir: str, base_id: str, table_id: str):
+        """
+        Args:
+            cache_dir: 캐시 파일을 저장할 폴더 (없으면 생성)
+            base_id: Airtable Base ID
+            table_id: Airtable Table ID
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"airtable_{base_id}_{table_id}.json")
+
+    def read(self, fields: List[str], formula: str) -> Optional[dict]:
+        """같은 필드/조건으로 저장된 캐시면 반환"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (entry.get('version') != CACHE_VERSION or entry.get('fields') != fields
+                or entry.get('formula') != formula):
+            return None
+        return entry
+
+    def write(self, fields: List[str], formula: str, synced_at: str, records: Dict[str, dict],
+              deletion_scan_at: str = None, syncs_since_scan: int = 0):
+        """캐시 파일 기록 (임시 파일 → os.replace 로 원자적 교체)"""
+        import tempfile
+
+        entry = {
+            'version': CACHE_VERSION,
+            'fields': fields,
+            'formula': formula,
+            'synced_at': synced_at,
+            'deletion_scan_at': deletion_scan_at,  # 마지막 삭제 확인 시각
+            'syncs_since_scan': syncs_since_scan,  # 그 뒤의 증분 동기화 횟수
+            'records': records,
+        }
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.airtable_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def sync(self, table, fields: List[str], formula: str, full: bool = False,
+             check_deletions: bool = False) -> Tuple[Dict[str, dict], int]:
+        """
+        캐시를 테이블과 맞추고 병합된 레코드 반환
+
+        Args:
+            table: pyairtable Table
+            fields: 조회할 필드
+            formula: 조회 조건 수식
+            full: True면 캐시를 무시하고 전체 다시 받기
+            check_deletions: True면 차례가 아니어도 삭제 확인 (레코드 ID 전체 조회, 요청 ceil(N/100)회)
+
+        Returns:
+            ({레코드 ID: 필드}, 이번에 받은 레코드 수)
+        """
+        started = datetime.now(timezone.utc)
+        fetched = 0
+
+        with file_lock(self.path + '.lock'):
+            entry = None if full else self.read(fields, formula)
+            if entry is None:
+                records = {}
+                for page in table.iterate(fields=fields, formula=formula):
+                    fetched += len(page)
+                    for record in page:
+                        records[record['id']] = record.get('fields', {})
+                scan_at, syncs = _airtable_time(started), 0
+                print(f"📥 Airtable 전체 동기화: {len(records)}개 레코드")
+            else:
+                records = entry['records']
+                since = entry['synced_at']
+
+                # 마지막 동기화 이후 수정/생성된 레코드만
+                recent = (f"OR(IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{since}')), "
+                          f"IS_AFTER(CREATED_TIME(), DATETIME_PARSE('{since}')))")
+                for page in table.iterate(fields=fields, formula=f"AND({recent}, {formula})"):
+                    fetched += len(page)
+                    for record in page:
+                        records[record['id']] = record.get('fields', {})
+
+                if check_deletions or _scan_due(entry, started):
+                    # 삭제/조건 이탈 감지: 조건에 맞는 레코드 ID 전체 (필드 1개)
+                    current = set()
+                    for page in table.iterate(fields=fields[:1], formula=formula):
+                        current.update(record['id'] for record in page)
+                    removed = [record_id for record_id in records if record_id not in current]
+                    scan_at, syncs = _airtable_time(started), 0
+                    scan_note = "삭제 확인"
+                else:
+                    # 조건 이탈만 감지: 최근 수정분 중 조건에 안 맞는 레코드 ID (필드 1개)
+                    left = set()
+                    for page in table.iterate(fields=fields[:1], formula=f"AND({recent}, NOT({formula}))"):
+                        left.update(record['id'] for record in page)
+                    removed = [record_id for record_id in left if record_id in records]
+                    scan_at, syncs = entry.get('deletion_scan_at'), entry.get('syncs_since_scan', 0) + 1
+                    scan_note = f"삭제 확인은 {DELETION_SCAN_EVERY - syncs}회 후 (--check-deletions 로 지금 확인)"
+                for record_id in removed:
+                    del records[record_id]
+                print(f"🔄 Airtable 증분 동기화 ({since} 이후): 변경 {fetched}개, 제거 {len(removed)}개, "
+                      f"전체 {len(records)}개 - {scan_note}")
+
+            synced_at = _airtable_time(started - timedelta(seconds=SYNC_OVERLAP))
+            try:
+                self.write(fields, formula, synced_at, records, scan_at, syncs)
+            except OSError as e:
+                print(f"⚠️ Airtable 캐시 저장 실패: {e}")
+        return records, fetched
@@ -2,9 +2,11 @@
 Airtable 데이터 읽기 모듈
 - Airtable API를 통해 종목 데이터를 가져옴
 - 답안지유형별로 그룹화하여 반환
+- 필요한 9개 필드만, 답안지유형 조건에 맞는 레코드만 서버에서 걸러서 받음
+  (페이지 단위로 받으면서 바로 StockItem 으로 변환)
+- cache_dir 지정 시 로컬 캐시에 마지막 동기화 이후 변경분만 받아 병합 (airtable_cache)
 """
 
-from pyairtable import Api
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
@@ -42,59 +44,126 @@ class CountryGroup:
 class AirtableReader:
     """Airtable 데이터 리더"""
     
-    def __init__(self, api_key: str, base_id: str, table_id: str):
+    # 조회할 필드 (StockItem 에 매핑되는 것만)
+    FIELDS = ['종목명', '핵심키워드', '편입일', '답안지유형', '상태', '국가', '대분류', '소분류', '핵심일정']
+    # 리포트에 쓰는 답안지유형
+    TYPES = ['시대흐름', '슈퍼픽', '일정매매']
+    
+    def __init__(self, api_key: str, base_id: str, table_id: str, timeout: float = None,
+                 cache_dir: str = None, full_sync: bool = False, check_deletions: bool = False):
         """
         Args:
             api_key: Airtable Personal Access Token
             base_id: Base ID (예: appA4t9o1QMTDZul7)
             table_id: Table ID (예: tbllRbqwpfEY8dV2O)
+            timeout: Airtable API 요청 타임아웃 (초). None이면 제한 없음
+            cache_dir: 레코드 로컬 캐시 폴더 (지정 시 변경된 레코드만 조회)
+            full_sync: True면 캐시를 무시하고 전체 다시 받아 캐시 갱신
+            check_deletions: True면 이번 동기화에서 삭제된 레코드 확인 (레코드 ID 전체 조회)
         """
         self.api_key = api_key
         self.base_id = base_id
         self.table_id = table_id
+        self.timeout = timeout
+        self.full_sync = full_sync
+        self.check_deletions = check_deletions
+        self.cache = None
+        if cache_dir:
+            from airtable_cache import AirtableCache
+            self.cache = AirtableCache(cache_dir, base_id, table_id)
         self.api = None
         self.table = None
+        self.stocks: List[StockItem] = None  # 조회한 종목 (실행당 1회 조회)
+        self.rows_fetched: Dict[str, int] = {}  # 테이블별 읽은 레코드 수 (지표용)
         
     def connect(self):
         """Airtable에 연결"""
-        self.api = Api(self.api_key)
+        # 네트워크가 필요한 경우에만 로드 (시작 속도 개선)
+        from pyairtable import Api
+        
+        from request_governor import get_governor
+        
+        # 재시도는 pyairtable 기본 전략 대신 공용 요청 조절기 (초당 5회 제한 + 백오프)가 담당
+        self.api = Api(self.api_key, timeout=(self.timeout, self.timeout) if self.timeout else None,
+                       retry_strategy=None)
+        get_governor().mount(self.api.session, 'airtable')
         self.table = self.api.table(self.base_id, self.table_id)
         print(f"✅ Airtable 연결 성공")
         
+    def type_formula(self) -> str:
+        """서버 필터 수식: 종목명이 있고 답안지유형에 리포트 유형 중 하나가 포함된 레코드"""
+        conditions = ", ".join(f"FIND('{t}', {{답안지유형}})" for t in self.TYPES)
+        return f"AND({{종목명}} != '', OR({conditions}))"
+    
+    def _to_stock(self, fields: Dict[str, Any]) -> StockItem:
+        """레코드 필드 → StockItem"""
+        # 답안지유형은 Multiple select이므로 리스트로 처리
+        답안지유형 = fields.get('답안지유형', [])
+        if isinstance(답안지유형, str):
+            답안지유형 = [답안지유형]
+        
+        return StockItem(
+            종목명=fields.get('종목명', ''),
+            핵심키워드=fields.get('핵심키워드', ''),
+            편입일=self._format_date(fields.get('편입일', '')),
+            답안지유형=답안지유형,
+            상태=fields.get('상태', ''),
+            국가=fields.get('국가', ''),
+            대분류=fields.get('대분류', ''),
+            소분류=fields.get('소분류', ''),
+            핵심일정=fields.get('핵심일정', '')
+        )
+    
+    def _iterate_fields(self):
+        """조건에 맞는 레코드 필드를 페이지 단위로 받으면서 하나씩 반환"""
+        fetched = 0
+        for page in self.table.iterate(fields=self.FIELDS, formula=self.type_formula()):
+            fetched += len(page)
+            self.rows_fetched['airtable'] = fetched
+            for record in page:
+                yield record.get('fields', {})
+    
+    def load_stocks(self, refresh: bool = False) -> List[StockItem]:
+        """
+        필요한 필드/레코드만 조회하여 StockItem 으로 보관
+        
+        Args:
+            refresh: True면 보관된 종목을 버리고 다시 조회
+        """
+        if self.stocks is None or refresh:
+            if self.cache is not None:
+                # 캐시 동기화 (변경분만 조회) 후 병합된 레코드 사용
+                records, fetched = self.cache.sync(self.table, self.FIELDS, self.type_formula(),
+                                                   full=self.full_sync, check_deletions=self.check_deletions)
+                self.rows_fetched['airtable'] = fetched
+                field_list = records.values()
+            else:
+                self.rows_fetched['airtable'] = 0
+                field_list = self._iterate_fields()
+            
+            stocks = []
+            for fields in field_list:
+                stock = self._to_stock(fields)
+                # 종목명이 있는 것만 추가
+                if stock.종목명:
+                    stocks.append(stock)
+            self.stocks = stocks
+        return self.stocks
+    
+    def prefetch(self):
+        """연결 + 종목 조회 (concurrent_fetch 에서 다른 소스와 동시에 실행)"""
+        if self.table is None:
+            self.connect()
+        self.load_stocks()
+        
     def get_all_stocks(self) -> List[StockItem]:
         """
-        모든 종목 데이터를 가져옴
+        답안지유형이 리포트 유형 중 하나인 종목 데이터를 가져옴
         
         Returns:
             StockItem 리스트
         """
-        records = self.table.all()
-        stocks = []
-        
-        for record in records:
-            fields = record.get('fields', {})
-            
-            # 답안지유형은 Multiple select이므로 리스트로 처리
-            답안지유형 = fields.get('답안지유형', [])
-            if isinstance(답안지유형, str):
-                답안지유형 = [답안지유형]
-            
-            stock = StockItem(
-                종목명=fields.get('종목명', ''),
-                핵심키워드=fields.get('핵심키워드', ''),
-                편입일=self._format_date(fields.get('편입일', '')),
-                답안지유형=답안지유형,
-                상태=fields.get('상태', ''),
-                국가=fields.get('국가', ''),
-                대분류=fields.get('대분류', ''),
-                소분류=fields.get('소분류', ''),
-                핵심일정=fields.get('핵심일정', '')
-            )
-            
-            # 종목명이 있는 것만 추가
-            if stock.종목명:
-                stocks.append(stock)
-        
+        stocks = self.load_stocks()
         print(f"📊 총 {len(stocks)}개 종목 로드 완료")
         return stocks
     
@@ -179,12 +248,16 @@ class AirtableReader:
                 '일정매매': List[StockItem]
             }
         """
-        all_stocks = self.get_all_stocks()
-        
-        # 유형별 필터링
-        시대흐름 = self.filter_by_type(all_stocks, '시대흐름')
-        슈퍼픽 = self.filter_by_type(all_stocks, '슈퍼픽')
-        일정매매 = self.filter_by_type(all_stocks, '일정매매')
+        # 유형별 분류 (한 번 순회, 종목은 여러 유형에 동시에 속할 수 있음)
+        buckets: Dict[str, List[StockItem]] = {t: [] for t in self.TYPES}
+        for stock in self.get_all_stocks():
+            for type_name in stock.답안지유형:
+                bucket = buckets.get(type_name)
+                if bucket is not None:
+                    bucket.append(stock)
+        시대흐름 = buckets['시대흐름']
+        슈퍼픽 = buckets['슈퍼픽']
+        일정매매 = buckets['일정매매']
         
         print(f"\n📦 유형별 종목 수:")
         print(f"  - 시대흐름: {len(시대흐름)}개")
@@ -0,0 +1,141 @@
+"""
+날짜 구간 일괄 생성 모듈 (급등이슈 / 강세테마 --from / --to)
+- 시트는 한 번만 조회하고, 날짜별 행은 메모리 스냅샷의 날짜 인덱스에서 바로 찾음
+- Chromium 은 한 번만 실행해서 모든 날짜 렌더링에 재사용
+- 파이프라인: 시트 조회 ↔ 브라우저 실행, 다음 날짜 그룹화 ↔ 현재 날짜 렌더링을 동시에 진행
+- 이어하기: 모든 페이지 이미지가 이미 있는 날짜는 건너뜀 (생성한 날짜와 따로 보고)
+  (중단되어 일부 페이지만 있는 날짜는 다시 생성)
+
+리더는 prefetch / get_date_index / get_today_data / group_data,
+렌더러는 generate_async(browser=...) / page_paths 를 제공해야 함 (SheetReader + HtmlRenderer 등)
+
+사용법:
+    python main.py --from 2025.12.01 --to 2025.12.05
+    python main_theme.py --from 2025.11.01      # 시트 최신 날짜까지
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from date_index import DateIndex, format_date, parse_sheet_date
+
+
+def parse_range(date_from: str = None, date_to: str = None) -> Tuple[Optional[date], Optional[date]]:
+    """
+    --from / --to 값 파싱 (없는 쪽은 None = 시트의 처음/끝까지)
+
+    Raises:
+        ValueError: 날짜 형식을 알 수 없거나 시작이 끝보다 늦을 때
+    """
+    bounds = []
+    for text in (date_from, date_to):
+        value = parse_sheet_date(text) if text else None
+        if text and value is None:
+            raise ValueError(f"날짜 형식을 알 수 없습니다: {text}")
+        bounds.append(value)
+    start, end = bounds
+    if start and end and start > end:
+        raise ValueError(f"시작 날짜가 끝 날짜보다 늦습니다: {date_from} > {date_to}")
+    return start, end
+
+
+def select_dates(index: DateIndex, start: date = None, end: date = None) -> List[date]:
+    """시트에 있는 날짜 중 구간 안의 날짜 (오래된 순)"""
+    return index.dates_between(start, end)
+
+
+def is_complete(paths: List[str]) -> bool:
+    """날짜의 모든 페이지 이미지가 이미 있는지"""
+    return bool(paths) and all(os.path.exists(p) for p in paths)
+
+
+async def backfill_async(reader, renderer, start: date, end: date,
+                         output_prefix: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """
+    구간 안의 날짜별 이미지 생성
+
+    Args:
+        reader: 시트 리더 (연결 전이어도 됨, prefetch 에서 연결)
+        renderer: HTML 렌더러
+        start, end: 날짜 구간 (None이면 시트의 처음/끝까지)
+        output_prefix: 출력 경로 앞부분 (예: output/급등이슈 → output/급등이슈_20251203.png)
+
+    Returns:
+        ({생성한 날짜: 이미지 경로 리스트}, {건너뛴 날짜: 기존 이미지 경로 리스트})
+    """
+    import asyncio
+
+    # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+    from playwright.async_api import async_playwright
+
+    loop = asyncio.get_event_loop()
+    # 리더는 스레드 안전하지 않으므로 작업 스레드 1개에서 순서대로 실행
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='backfill')
+
+    def load_dates() -> List[date]:
+        reader.prefetch()
+        return select_dates(reader.get_date_index(), start, end)
+
+    def prepare(day: date) -> List[Any]:
+        raw_data = reader.get_today_data(format_date(day))
+        return reader.group_data(raw_data) if raw_data else []
+
+    rendered: Dict[str, List[str]] = {}
+    skipped: Dict[str, List[str]] = {}
+    try:
+        async with async_playwright() as p:
+            # 시트 조회(스레드)와 브라우저 실행을 동시에
+            launch = asyncio.ensure_future(p.chromium.launch())
+            try:
+                days = await loop.run_in_executor(executor, load_dates)
+            except BaseException:
+                # 시트 조회 실패: 이미 실행 중인 브라우저를 기다려 닫고 원래 오류를 전달
+                browser = (await asyncio.gather(launch, return_exceptions=True))[0]
+                if not isinstance(browser, BaseException):
+                    await browser.close()
+                raise
+            browser = await launch
+            print(f"\n🗓️ 대상 날짜: {len(days)}일"
+                  + (f" ({format_date(days[0])} ~ {format_date(days[-1])})" if days else ""))
+
+            # 다음 날짜 그룹화를 현재 날짜 렌더링과 겹쳐서 실행
+            pending = loop.run_in_executor(executor, prepare, days[0]) if days else None
+            try:
+                for i, day in enumerate(days):
+                    cards = await pending
+                    pending = loop.run_in_executor(executor, prepare, days[i + 1]) if i + 1 < len(days) else None
+
+                    label = format_date(day)
+                    output_path = f"{output_prefix}_{label.replace('.', '')}"
+                    paths = renderer.page_paths(cards, output_path)
+                    if not cards:
+                        print(f"⚠️ {label}: 카드가 없어 건너뜁니다")
+                        continue
+                    if is_complete(paths):
+                        print(f"⏭️ {label}: 이미 생성됨 ({len(paths)}페이지)")
+                        skipped[label] = paths
+                        continue
+
+                    print(f"\n🎨 {label}: {len(cards)}개 카드 렌더링")
+                    rendered[label] = await renderer.generate_async(cards, label, output_path, browser=browser)
+                    if renderer.deadline.blown_stage:
+                        # 마감 시간 초과: 남은 날짜는 다음 실행에서 이어서 생성
+                        print(f"⏰ 마감 시간 초과 - {len(days) - i - 1}일은 다음 실행에서 이어서 생성합니다")
+                        break
+            finally:
+                if pending is not None:
+                    # 중단 시 진행 중인 그룹화가 끝나기를 기다려 스레드 정리
+                    await asyncio.gather(pending, return_exceptions=True)
+                await browser.close()
+    finally:
+        executor.shutdown(wait=False)
+    return rendered, skipped
+
+
+def run_backfill(reader, renderer, start: date, end: date,
+                 output_prefix: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """동기 래퍼"""
+    import asyncio
+    return asyncio.run(backfill_async(reader, renderer, start, end, output_prefix))
@@ -0,0 +1,171 @@
+"""
+카드 그룹화 공용 모듈 (급등이슈 시트1 / 강세테마 시트3)
+- 테마형: 같은 그룹명끼리 묶고 종목 등락률 합계 순으로 정렬, N개 초과 시 여러 카드로 분리
+- 개별이슈형: 등락률 순으로 정렬 후 M개씩 카드로 분리
+- 그룹 합계는 행을 넣는 한 번의 순회에서 같이 계산 (정렬 키마다 다시 합산하지 않음)
+
+리더별 차이 (카드당 종목 수, '기타' 그룹 맨 뒤 규칙, 거래대금 같은 추가 열)는
+GroupingConfig 와 리더의 종목 생성 함수로 지정
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional
+
+
+class GroupingConfig(NamedTuple):
+    """그룹화 설정"""
+    theme_chunk: int = 5                  # 테마 카드당 최대 종목 수
+    individual_chunk: int = 3             # 개별이슈 카드당 최대 종목 수
+    last_group: Optional[str] = None      # 합계와 관계없이 맨 뒤에 둘 그룹명 (예: '기타')
+    theme_type: str = '테마'               # B열(타입) 테마형 값
+    individual_types: FrozenSet[str] = frozenset({'개별', '개별이슈'})  # B열 개별이슈형 값
+    individual_group: str = '개별이슈'      # 개별이슈 카드의 그룹명
+
+
+class _ThemeGroup:
+    """테마 그룹 (행을 넣으면서 합계 누적)"""
+    __slots__ = ('name', 'main_issue', 'stocks', 'rate_sum')
+
+    def __init__(self, name: str, main_issue: str):
+        self.name = name
+        self.main_issue = main_issue  # 첫 번째 행의 이슈를 메인으로
+        self.stocks = []
+        self.rate_sum = 0.0
+
+
+def chunk_list(items: List, size: int) -> List[List]:
+    """리스트를 size 단위로 분할"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def group_cards(rows: List[Dict[str, Any]], make_stock: Callable[[Dict[str, Any]], Any],
+                card_class: Callable[..., Any], config: GroupingConfig = GroupingConfig()) -> List[Any]:
+    """
+    원본 행을 카드 단위로 그룹화
+
+    Args:
+        rows: get_today_data() 행 목록 ('type', 'group', 'issue' 키 필요)
+        make_stock: 행 → 종목 (rate_value 속성 필요)
+        card_class: 카드 클래스 (card_type, group_name, main_issue, stocks 인자)
+        config: 그룹화 설정
+
+    Returns:
+        카드 리스트 (테마 카드 → 개별이슈 카드 순)
+    """
+    theme_groups: Dict[str, _ThemeGroup] = {}
+    individual_items = []
+
+    for row in rows:
+        row_type = row['type'].strip()
+        if row_type == config.theme_type:
+            stock = make_stock(row)
+            group = theme_groups.get(row['group'])
+            if group is None:
+                group = theme_groups[row['group']] = _ThemeGroup(row['group'], row['issue'])
+            group.stocks.append(stock)
+            group.rate_sum += stock.rate_value
+        elif row_type in config.individual_types:
+            individual_items.append(make_stock(row))
+
+    by_rate = attrgetter('rate_value')
+    cards = []
+
+    # 테마 그룹: 등락률 합계 높은 순 (last_group 은 맨 뒤, 같은 합계는 시트 순서 유지)
+    ordered = sorted(theme_groups.values(),
+                     key=lambda g: (g.name == config.last_group, -g.rate_sum))
+    for group in ordered:
+        stocks = sorted(group.stocks, key=by_rate, reverse=True)
+        if len(stocks) <= config.theme_chunk:
+            cards.append(card_class(card_type='theme', group_name=group.name,
+                                    main_issue=group.main_issue, stocks=stocks))
+            print(f"  📦 테마 카드: {group.name} ({len(stocks)}종목)")
+        else:
+            # 분리해도 이슈 설명은 동일하게 유지
+            for i, chunk in enumerate(chunk_list(stocks, config.theme_chunk)):
+                cards.append(card_class(card_type='theme', group_name=group.name,
+                                        main_issue=group.main_issue, stocks=chunk))
+                print(f"  📦 테마 카드: {group.name} #{i+1} ({len(chunk)}종목)")
+
+    # 개별이슈: 등락률 높은 순으로 정렬 후 청킹
+    if individual_items:
+        individual_items.sort(key=by_rate, reverse=True)
+        for i, chunk in enumerate(chunk_list(individual_items, config.individual_chunk)):
+            cards.append(card_class(card_type='individual', group_name=config.individual_group,
+                                    stocks=chunk))
+            print(f"  📦 개별이슈 카드 #{i+1}: {len(chunk)}종목")
+
+    print(f"\n🎴 총 카드 수: {len(cards)}장")
+    return cards
+
+
+if __name__ == "__main__":
+    # 속성 점검: 무작위 입력에 대해 그룹화 규칙이 항상 성립하는지 확인
+    import io
+    import math
+    import random
+    from contextlib import redirect_stdout
+    from dataclasses import dataclass, field
+
+    @dataclass
+    class Stock:
+        name: str
+        rate_value: float
+
+    @dataclass
+    class Card:
+        card_type: str
+        group_name: str
+        main_issue: str = ""
+        stocks: List[Stock] = field(default_factory=list)
+
+    def make_stock(row):
+        return Stock(row['stock'], row['change_value'])
+
+    rng = random.Random(0)
+    for trial in range(500):
+        config = GroupingConfig(theme_chunk=rng.randint(1, 6), individual_chunk=rng.randint(1, 4),
+                                last_group=rng.choice([None, '기타']))
+        rows = [
+            {
+                'type': rng.choice(['테마', '개별', '개별이슈', '', '기타타입']),
+                'group': rng.choice(['반도체', '2차전지', '기타', '로봇']),
+                'stock': f"종목{i}",
+                'change_value': round(rng.uniform(-30, 30), 2),
+                'issue': f"이슈{i}",
+            }
+            for i in range(rng.randint(0, 40))
+        ]
+        with redirect_stdout(io.StringIO()):
+            cards = group_cards(rows, make_stock, Card, config)
+
+        theme_rows = [r for r in rows if r['type'] == '테마']
+        individual_rows = [r for r in rows if r['type'] in config.individual_types]
+        theme_cards = [c for c in cards if c.card_type == 'theme']
+        individual_cards = [c for c in cards if c.card_type == 'individual']
+
+        # 1. 테마/개별 행은 정확히 한 번씩 카드에 들어감 (그 외 타입은 제외)
+        assert sorted(s.name for c in theme_cards for s in c.stocks) == sorted(r['stock'] for r in theme_rows)
+        assert sorted(s.name for c in individual_cards for s in c.stocks) == sorted(r['stock'] for r in individual_rows)
+        # 2. 테마 카드가 개별이슈 카드보다 먼저, 카드 크기는 1 ~ 설정값
+        assert cards == theme_cards + individual_cards
+        assert all(1 <= len(c.stocks) <= config.theme_chunk for c in theme_cards)
+        assert all(1 <= len(c.stocks) <= config.individual_chunk for c in individual_cards)
+        # 3. 그룹별 카드 수 = ceil(종목 수 / 카드당 종목 수), 메인 이슈는 그룹 첫 행
+        groups: Dict[str, List[dict]] = {}
+        for r in theme_rows:
+            groups.setdefault(r['group'], []).append(r)
+        for name, members in groups.items():
+            group_cards_ = [c for c in theme_cards if c.group_name == name]
+            assert len(group_cards_) == math.ceil(len(members) / config.theme_chunk)
+            assert all(c.main_issue == members[0]['issue'] for c in group_cards_)
+            rates = [s.rate_value for c in group_cards_ for s in c.stocks]
+            assert rates == sorted(rates, reverse=True)
+        # 4. 그룹 순서: 합계 내림차순, last_group 은 맨 뒤
+        order = list(dict.fromkeys(c.group_name for c in theme_cards))
+        keys = [(name == config.last_group, -sum(r['change_value'] for r in groups[name])) for name in order]
+        assert all(a[0] < b[0] or (a[0] == b[0] and a[1] <= b[1] + 1e-9) for a, b in zip(keys, keys[1:]))
+        # 5. 개별이슈는 등락률 내림차순
+        rates = [s.rate_value for c in individual_cards for s in c.stocks]
+        assert rates == sorted(rates, reverse=True)
+
+    print("✅ 카드 그룹화 속성 점검 통과 (무작위 500회)")
@@ -0,0 +1,171 @@
+"""
+API 응답 녹화/재생 모듈 (구글 시트 / Airtable)
+- 녹화(--record): 리더가 받은 모든 API 응답을 카세트 폴더에 요청별 JSON 파일로 저장
+- 재생(--replay): 같은 요청이 오면 네트워크 대신 카세트의 응답을 돌려줌
+  (gspread / pyairtable 코드 경로는 그대로, 인증/속도 제한만 생략)
+- 재생 시 지연 주입 가능: 고정 초 또는 'recorded' (녹화 당시 응답 시간)
+
+요청 매칭 키 = 메서드 + URL(쿼리 포함) + 본문 (인증 헤더는 제외)
+같은 요청을 다시 녹화하면 마지막 응답으로 덮어씀
+
+사용법:
+    python main.py --record cassettes/1203 --date 2025.12.03
+    python main.py --replay cassettes/1203 --date 2025.12.03 --replay-latency recorded
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import threading
+from typing import Optional, Union
+
+
+# 재생 응답에서 빼는 헤더 (본문은 이미 풀린 상태로 저장됨)
+_DROP_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+
+class CassetteMiss(LookupError):
+    """재생 모드에서 녹화되지 않은 요청"""
+
+
+def request_key(method: str, url: str, body: Union[bytes, str, None]) -> str:
+    """요청 매칭 키 (파일 이름으로 사용)"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha1()
+    digest.update(method.upper().encode('ascii'))
+    digest.update(b' ')
+    digest.update(url.encode('utf-8'))
+    digest.update(b'\n')
+    digest.update(body or b'')
+    return digest.hexdigest()[:20]
+
+
+def parse_latency(value: Optional[str]) -> Union[float, str, None]:
+    """--replay-latency 값 ('recorded' 또는 초)"""
+    if value is None or value == 'recorded':
+        return value
+    return float(value)
+
+
+class Cassette:
+    """요청별 응답 파일 모음"""
+
+    def __init__(self, directory: str, mode: str, latency: Union[float, str, None] = None):
+        """
+        Args:
+            directory: 카세트 폴더
+            mode: 'record' 또는 'replay'
+            latency: 재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        if mode == 'replay' and not os.path.isdir(directory):
+            raise FileNotFoundError(f"카세트 폴더를 찾을 수 없습니다: {directory}")
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def _path(self, request) -> str:
+        return os.path.join(self.directory, request_key(request.method, request.url, request.body) + '.json')
+
+    def record(self, request, response):
+        """응답 저장 (임시 파일 → os.replace 로 원자적 교체)"""
+        content = response.content
+        try:
+            body = {'text': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            body = {'base64': base64.b64encode(content).decode('ascii')}
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS},
+            'elapsed': response.elapsed.total_seconds(),
+            **body,
+        }
+        path = self._path(request)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        with self._lock:
+            self.recorded += 1
+
+    def replay(self, request):
+        """녹화된 응답을 requests.Response 로 반환"""
+        from requests.models import Response
+        from requests.structures import CaseInsensitiveDict
+
+        path = self._path(request)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            raise CassetteMiss(f"카세트에 없는 요청: {request.method} {request.url}")
+
+        delay = entry.get('elapsed', 0.0) if self.latency == 'recorded' else (self.latency or 0.0)
+        if delay:
+            time.sleep(delay)
+
+        response = Response()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response._content = (entry['text'].encode('utf-8') if 'text' in entry
+                             else base64.b64decode(entry['base64']))
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        with self._lock:
+            self.replayed += 1
+        return response
+
+    def report(self):
+        """녹화/재생 요약 출력"""
+        if self.replaying:
+            print(f"📼 카세트 재생: {self.replayed}개 응답 ({self.directory})")
+        else:
+            print(f"📼 카세트 녹화: {self.recorded}개 응답 ({self.directory})")
+
+
+def replay_credentials():
+    """재생 모드용 자격 증명 (토큰 교환/서비스 계정 파일 없이 사용)"""
+    from google.oauth2.credentials import Credentials
+
+    return Credentials(token='cassette-replay')
+
+
+def use_cassette(record_dir: str = None, replay_dir: str = None, latency: str = None) -> Optional[Cassette]:
+    """
+    공용 요청 조절기에 카세트 장착 (둘 다 없으면 아무것도 하지 않음)
+
+    Args:
+        record_dir: 녹화할 카세트 폴더
+        replay_dir: 재생할 카세트 폴더
+        latency: 재생 지연 ('recorded' 또는 초)
+    """
+    from request_governor import get_governor
+
+    if record_dir and replay_dir:
+        raise ValueError("--record 와 --replay 는 함께 사용할 수 없습니다")
+    if not record_dir and not replay_dir:
+        return None
+    if record_dir:
+        cassette = Cassette(record_dir, 'record')
+    else:
+        cassette = Cassette(replay_dir, 'replay', parse_latency(latency))
+    get_governor().cassette = cassette
+    print(f"📼 카세트 {'재생' if cassette.replaying else '녹화'} 모드: {cassette.directory}")
+    return cassette
@@ -0,0 +1,129 @@
+"""
+동시 데이터 조회 모듈
+- 구글 시트(시트1/2/3)와 Airtable 조회를 순서대로 하지 않고 동시에 실행
+- gspread / pyairtable 은 블로킹 클라이언트이므로 스레드 풀에서 실행하고
+  asyncio 로 결과를 기다림 (동시 실행 수 제한)
+- 전체 조회 시간 = 각 소스 시간의 합 → 가장 느린 소스의 시간
+
+각 리더의 prefetch() (연결 + 원본 조회)를 실행한 뒤에는
+get_today_data() / get_ranking_data() / get_grouped_data() 가 추가 API 호출 없이 동작
+(run_all.py 는 구글 시트 일괄 조회 함수와 Airtable 리더를 소스로 넘겨 동시에 조회)
+
+사용법:
+    errors = await fetch_sources({'급등이슈': issue_reader, '답안지': airtable_reader})
+    raw_data = issue_reader.get_today_data()
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_MAX_WORKERS = 4  # 동시에 실행할 조회 수 (구글 시트 3 + Airtable 1)
+
+
+async def gather_in_threads(calls: Dict[str, Callable[[], Any]], max_workers: int = DEFAULT_MAX_WORKERS,
+                            deadline=None) -> Dict[str, Any]:
+    """
+    블로킹 함수들을 스레드 풀에서 동시에 실행하고 결과를 모음
+
+    Args:
+        calls: {이름: 인자 없는 함수}
+        max_workers: 최대 동시 실행 수
+        deadline: RunDeadline (있으면 'fetch' 단계 예산 안에서만 기다림)
+
+    Returns:
+        {이름: 결과 또는 발생한 예외}
+    """
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch')
+    try:
+        futures = {name: loop.run_in_executor(executor, func) for name, func in calls.items()}
+        gathered = asyncio.gather(*futures.values(), return_exceptions=True)
+        if deadline is not None:
+            results = await deadline.wait_for('fetch', gathered)
+        else:
+            results = await gathered
+    finally:
+        # 제한 시간 초과 시 남은 스레드를 기다리지 않음
+        executor.shutdown(wait=False)
+    return dict(zip(futures, results))
+
+
+async def fetch_sources(readers: Dict[str, Any], max_workers: int = DEFAULT_MAX_WORKERS,
+                        deadline=None) -> Dict[str, Optional[BaseException]]:
+    """
+    소스들의 조회를 동시에 실행하고 소스별 소요 시간 출력
+
+    Args:
+        readers: {이름: 리더 또는 인자 없는 함수}
+                 리더(SheetReader, SheetReaderRanking, SheetReaderTheme, AirtableReader)는 prefetch() 실행
+        max_workers: 최대 동시 실행 수
+        deadline: RunDeadline (있으면 'fetch' 단계 예산 안에서만 기다림, 초과 시 StageTimeout)
+
+    Returns:
+        {이름: 실패 시 예외, 성공 시 None}
+    """
+    timings: Dict[str, float] = {}
+
+    def timed(name, reader):
+        fetch = reader.prefetch if hasattr(reader, 'prefetch') else reader
+
+        def run():
+            start = time.perf_counter()
+            try:
+                fetch()
+            finally:
+                timings[name] = time.perf_counter() - start
+        return run
+
+    start = time.perf_counter()
+    results = await gather_in_threads(
+        {name: timed(name, reader) for name, reader in readers.items()},
+        max_workers=max_workers,
+        deadline=deadline
+    )
+    elapsed = time.perf_counter() - start
+
+    errors = {}
+    for name, result in results.items():
+        if isinstance(result, BaseException):
+            errors[name] = result
+            print(f"  ❌ {name} 조회 실패 ({timings.get(name, 0):.1f}초): {result}")
+        else:
+            errors[name] = None
+            print(f"  📥 {name} 조회 완료 ({timings.get(name, 0):.1f}초)")
+    print(f"⚡ 동시 조회 {len(readers)}개 소스: {elapsed:.1f}초"
+          f" (순차 합계 {sum(timings.values()):.1f}초)")
+    return errors
+
+
+if __name__ == "__main__":
+    import os
+    import asyncio
+
+    from airtable_reader import AirtableReader
+    from sheet_reader import SheetReader
+    from sheet_reader_ranking import SheetReaderRanking
+    from sheet_reader_theme import SheetReaderTheme
+
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    CREDENTIALS_PATH = os.path.join(BASE_DIR, "service_account.json.json")
+    SPREADSHEET_ID = "1dX8Diej7AQixm7fBrnrdUybxW2Au9QzyATYRBKZN_jk"
+
+    readers = {
+        '급등이슈': SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID),
+        '등락률상위': SheetReaderRanking(CREDENTIALS_PATH, SPREADSHEET_ID),
+        '강세테마': SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID),
+    }
+    api_key = os.environ.get("AIRTABLE_API_KEY", "")
+    if api_key:
+        readers['답안지'] = AirtableReader(
+            api_key,
+            os.environ.get("AIRTABLE_BASE_ID", "appA4t9o1QMTDZul7"),
+            os.environ.get("AIRTABLE_TABLE_ID", "tbllRbqwpfEY8dV2O")
+        )
+
+    asyncio.run(fetch_sources(readers))
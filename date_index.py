@@ -0,0 +1,121 @@
+"""
+날짜 인덱스 모듈
+- 시트 A열(날짜) 문자열을 실제 날짜(datetime.date)로 파싱
+- 날짜 → 행 위치 목록을 스냅샷당 한 번만 만들어 두고
+  최신 날짜 / 특정 날짜 / 기간 조회를 행 전체 스캔 없이 처리
+
+지원 형식: 2025.12.04, 2025.12.4, 25.12.4, 2025-12-04, 2025/12/04, 12.04 (연도 없음)
+연도 없는 MM.DD 는 바로 위 행의 연도를 이어받고, 월이 줄어들면 다음 해로 넘어간 것으로 봄
+(첫 행부터 연도가 없으면 오늘 기준으로 미래가 되지 않는 가장 가까운 연도)
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional
+
+from normalize import split_date
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_sheet_date(text: str, previous: date = None, today: date = None) -> Optional[date]:
+    """
+    시트 날짜 문자열 파싱
+
+    Args:
+        text: A열 값 (예: "2025.12.4", "25.12.04", "12.04")
+        previous: 바로 위 행의 날짜 (연도 없는 값의 연도 추정용)
+        today: 기준 날짜 (기본값 오늘)
+
+    Returns:
+        날짜. 파싱할 수 없으면 None
+    """
+    # 같은 날짜 문자열이 수백 행 반복되므로 형식 분해는 캐시됨
+    parts = split_date(str(text))
+    if parts is None:
+        return None
+    year, month, day = parts
+    if year is not None:
+        return _safe_date(year, month, day)
+
+    if previous is not None:
+        # 날짜순으로 추가되는 시트이므로 월이 줄어들면 해가 바뀐 것
+        year = previous.year + 1 if month < previous.month else previous.year
+        return _safe_date(year, month, day)
+
+    today = today or date.today()
+    parsed = _safe_date(today.year, month, day)
+    if parsed is not None and parsed > today:
+        parsed = _safe_date(today.year - 1, month, day)
+    return parsed
+
+
+def format_date(value: date) -> str:
+    """시트/파일명에 쓰는 표준 형식 (2025.12.04)"""
+    return value.strftime("%Y.%m.%d")
+
+
+class DateIndex:
+    """날짜 → 행 위치(0부터, 헤더 제외) 인덱스"""
+
+    def __init__(self, date_values: List[str], today: date = None):
+        """
+        Args:
+            date_values: 데이터 행의 A열 값 (헤더 제외, 시트 순서대로)
+            today: 연도 없는 값의 기준 날짜 (기본값 오늘)
+        """
+        self.positions: Dict[date, List[int]] = {}
+        previous = None
+        for i, value in enumerate(date_values):
+            parsed = parse_sheet_date(value, previous, today)
+            if parsed is None:
+                continue
+            self.positions.setdefault(parsed, []).append(i)
+            previous = parsed
+        self.dates: List[date] = sorted(self.positions)  # 오래된 순
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, value: date) -> bool:
+        return value in self.positions
+
+    def latest(self) -> Optional[date]:
+        """가장 최근 날짜"""
+        return self.dates[-1] if self.dates else None
+
+    def rows_for(self, value: date) -> List[int]:
+        """특정 날짜의 행 위치 목록"""
+        return self.positions.get(value, [])
+
+    def dates_between(self, start: date = None, end: date = None) -> List[date]:
+        """start ~ end (양끝 포함) 사이의 날짜 목록 (오래된 순)"""
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = bisect_right(self.dates, end) if end else len(self.dates)
+        return self.dates[lo:hi]
+
+    def rows_between(self, start: date = None, end: date = None) -> List[int]:
+        """start ~ end (양끝 포함) 사이 날짜의 행 위치 목록 (시트 순서)"""
+        rows = []
+        for value in self.dates_between(start, end):
+            rows.extend(self.positions[value])
+        return sorted(rows)
+
+
+if __name__ == "__main__":
+    # 연도 전환 확인: 12월 → 1월 (연도 없는 값)
+    index = DateIndex(['2025.12.30', '12.31', '01.02', '1.2', '26.01.05', '잘못된값'],
+                      today=date(2026, 1, 5))
+    assert index.latest() == date(2026, 1, 5)
+    assert index.rows_for(date(2025, 12, 31)) == [1]
+    assert index.rows_for(date(2026, 1, 2)) == [2, 3]
+    assert index.rows_between(date(2026, 1, 1), None) == [2, 3, 4]
+    assert parse_sheet_date('12.31', today=date(2026, 1, 5)) == date(2025, 12, 31)
+    assert parse_sheet_date('2025-12-04') == date(2025, 12, 4)
+    assert parse_sheet_date('2025.02.30') is None
+    print("✅ 날짜 인덱스 확인 완료")
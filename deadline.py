@@ -0,0 +1,182 @@
+"""
+실행 마감 시간(deadline) 모듈
+- 전체 제한 시간을 fetch / group / render 단계에 비율대로 배분
+- 앞 단계에서 남은 시간은 뒤 단계로 이월
+- 동기 호출은 별도 스레드에서 실행하며 제한 시간 초과 시 StageTimeout 발생
+- 비동기 호출(페이지 렌더링)은 asyncio.wait_for 로 제한
+"""
+
+import math
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+# 기본 단계별 시간 배분 비율
+DEFAULT_SHARES = {
+    'fetch': 0.4,
+    'group': 0.1,
+    'render': 0.5,
+}
+
+
+class StageTimeout(Exception):
+    """단계 제한 시간 초과"""
+
+    def __init__(self, stage: str, budget: float):
+        self.stage = stage
+        self.budget = budget
+        super().__init__(f"'{stage}' 단계가 제한 시간 {budget:.1f}초를 초과했습니다")
+
+
+def parse_shares(text: str) -> Dict[str, float]:
+    """
+    단계별 배분 비율 문자열 파싱 (argparse type= 으로 사용, 잘못된 값은 사용법 오류)
+
+    Args:
+        text: 예) "fetch=0.3,group=0.1,render=0.6" (지정하지 않은 단계는 기본 비율)
+
+    Raises:
+        argparse.ArgumentTypeError: 알 수 없는 단계, '단계=값' 형식이 아님, 값이 0 이하/숫자가 아님
+    """
+    shares = dict(DEFAULT_SHARES)
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        stage, sep, value = part.partition('=')
+        stage = stage.strip()
+        if not sep:
+            raise argparse.ArgumentTypeError(f"'단계=비율' 형식이 아닙니다: {part.strip()}")
+        if stage not in DEFAULT_SHARES:
+            raise argparse.ArgumentTypeError(
+                f"알 수 없는 단계: {stage} (사용 가능: {', '.join(DEFAULT_SHARES)})")
+        try:
+            share = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{stage} 비율이 숫자가 아닙니다: {value.strip()}") from None
+        if not math.isfinite(share) or share <= 0:
+            raise argparse.ArgumentTypeError(f"{stage} 비율은 0보다 커야 합니다: {value.strip()}")
+        shares[stage] = share
+    return shares
+
+
+class RunDeadline:
+    """실행 전체 마감 시간과 단계별 예산"""
+
+    def __init__(self, total_seconds: float = None, shares: Dict[str, float] = None):
+        """
+        Args:
+            total_seconds: 전체 제한 시간 (초). None이면 제한 없음
+            shares: 단계별 배분 비율 (기본값 DEFAULT_SHARES)
+        """
+        self.enabled = bool(total_seconds)
+        self.total_seconds = total_seconds
+        self.shares = shares or dict(DEFAULT_SHARES)
+        self.started_at = time.monotonic()
+        self.ends_at = self.started_at + total_seconds if self.enabled else None
+        self.blown_stage: Optional[str] = None
+        self._stage_ends: Dict[str, float] = {}
+        self._budgets: Dict[str, float] = {}
+
+    def remaining(self) -> Optional[float]:
+        """전체 남은 시간 (초)"""
+        if not self.enabled:
+            return None
+        return max(0.0, self.ends_at - time.monotonic())
+
+    def begin(self, stage: str) -> Optional[float]:
+        """
+        단계 시작: 남은 시간을 아직 실행하지 않은 단계들의 비율대로 나눠 예산 확정
+
+        Returns:
+            이 단계의 예산 (초)
+        """
+        if not self.enabled:
+            return None
+        if stage in self._stage_ends:
+            # 이미 시작한 단계는 같은 예산을 이어서 사용
+            return max(0.0, self._stage_ends[stage] - time.monotonic())
+        pending = [s for s in self.shares if s not in self._stage_ends]
+        total_share = sum(self.shares[s] for s in pending) or 1.0
+        budget = self.remaining() * self.shares.get(stage, 0.0) / total_share
+        self._stage_ends[stage] = time.monotonic() + budget
+        self._budgets[stage] = budget
+        return budget
+
+    def stage_remaining(self, stage: str) -> Optional[float]:
+        """단계의 남은 예산 (초). 시작 전이면 지금 시작한 것으로 간주"""
+        if not self.enabled:
+            return None
+        return self.begin(stage)
+
+    def _blown(self, stage: str) -> StageTimeout:
+        """초과 단계 기록"""
+        if self.blown_stage is None:
+            self.blown_stage = stage
+        return StageTimeout(stage, self._budgets.get(stage, 0.0))
+
+    def call(self, stage: str, func: Callable, *args, **kwargs):
+        """
+        동기 함수를 단계 예산 안에서 실행 (초과 시 StageTimeout)
+
+        블로킹 네트워크 호출은 중간에 끊을 수 없으므로 데몬 스레드에서 실행하고
+        제한 시간이 지나면 결과를 기다리지 않고 넘어감
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        budget = self.begin(stage)
+        result = {}
+
+        def target():
+            try:
+                result['value'] = func(*args, **kwargs)
+            except BaseException as e:
+                result['error'] = e
+
+        worker = threading.Thread(target=target, name=f"deadline-{stage}", daemon=True)
+        worker.start()
+        worker.join(budget)
+        if worker.is_alive():
+            raise self._blown(stage)
+        if 'error' in result:
+            raise result['error']
+        return result.get('value')
+
+    async def wait_for(self, stage: str, awaitable):
+        """비동기 작업을 단계 남은 예산 안에서 실행 (초과 시 StageTimeout)"""
+        if not self.enabled:
+            return await awaitable
+
+        import asyncio
+
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.stage_remaining(stage))
+        except asyncio.TimeoutError:
+            raise self._blown(stage) from None
+
+    def timeout_ms(self, stage: str) -> Optional[float]:
+        """Playwright 등에 넘길 남은 예산 (밀리초, 0은 '무제한'이므로 최소 1ms)"""
+        remaining = self.stage_remaining(stage)
+        return None if remaining is None else max(1.0, remaining * 1000)
+
+    @contextmanager
+    def stage(self, name: str):
+        """중단할 수 없는 구간의 예산 초과 여부만 기록"""
+        self.begin(name)
+        yield
+        if self.enabled and time.monotonic() > self._stage_ends[name]:
+            self._blown(name)
+
+    def report(self):
+        """마감 시간 결과 출력"""
+        if not self.enabled:
+            return
+        elapsed = time.monotonic() - self.started_at
+        if self.blown_stage:
+            print(f"⏰ 마감 시간 초과: '{self.blown_stage}' 단계가 예산을 넘었습니다"
+                  f" (경과 {elapsed:.1f}초 / 제한 {self.total_seconds:.0f}초)")
+        else:
+            print(f"⏱️ 마감 시간 내 완료 (경과 {elapsed:.1f}초 / 제한 {self.total_seconds:.0f}초)")
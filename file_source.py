@@ -0,0 +1,130 @@
+"""
+로컬 파일 데이터 소스 모듈 (CSV / XLSX)
+- 구글 시트 대신 엑셀/CSV 로 내보낸 파일에서 같은 열 구성으로 읽음
+- 한 행씩 읽어서 SheetSnapshot 으로 만듦 (API 호출/할당량 없음)
+
+경로 지정 방식:
+    data.xlsx        워크북의 워크시트 순서 = 시트1/시트2/시트3 (시트가 1개면 그 시트 사용)
+    급등이슈.csv       CSV 파일 하나 (모든 리더가 같은 파일 사용)
+    exports/         폴더 안의 '시트1.csv' / '시트2.xlsx' 처럼 워크시트 이름의 파일
+
+XLSX 는 openpyxl 이 필요함 (pip install openpyxl)
+"""
+
+import os
+import csv
+from datetime import date, datetime
+from typing import Any, Iterator, List
+
+from date_index import format_date
+from sheet_snapshot import SheetSnapshot
+
+
+CSV_ENCODINGS = ('utf-8-sig', 'cp949')  # 엑셀(한글 윈도우)에서 내보낸 CSV 는 cp949 인 경우가 많음
+EXTENSIONS = ('.csv', '.xlsx')
+
+
+def cell_text(value: Any, number_format: str = 'General') -> str:
+    """엑셀 셀 값 → 구글 시트 표시 값과 같은 문자열"""
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return format_date(value)
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        if '%' in number_format:
+            return f"{value * 100:.2f}%"
+        if float(value).is_integer():
+            return str(int(value))
+        return str(value)
+    return str(value)
+
+
+def _trim(rows: Iterator[List[str]]) -> Iterator[List[str]]:
+    """끝의 빈 셀 제거, 완전히 빈 행은 건너뜀"""
+    for row in rows:
+        while row and row[-1] == '':
+            row.pop()
+        if row:
+            yield row
+
+
+def read_csv(path: str) -> SheetSnapshot:
+    """CSV 파일을 한 행씩 읽어 스냅샷 생성 (UTF-8 실패 시 CP949)"""
+    for encoding in CSV_ENCODINGS:
+        try:
+            with open(path, 'r', encoding=encoding, newline='') as f:
+                return SheetSnapshot.from_values(list(_trim(csv.reader(f))))
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"CSV 인코딩을 알 수 없습니다: {path}")
+
+
+def read_xlsx(path: str, worksheet_index: int = 0) -> SheetSnapshot:
+    """XLSX 워크시트를 읽기 전용 모드로 한 행씩 읽어 스냅샷 생성"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("XLSX 파일을 읽으려면 openpyxl 이 필요합니다 (pip install openpyxl)")
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheets = workbook.worksheets
+        if len(worksheets) == 1:
+            worksheet = worksheets[0]
+        elif worksheet_index < len(worksheets):
+            worksheet = worksheets[worksheet_index]
+        else:
+            raise IndexError(f"워크시트 {worksheet_index + 1}번이 없습니다 (전체 {len(worksheets)}개): {path}")
+        rows = (
+            [cell_text(cell.value, getattr(cell, 'number_format', 'General')) for cell in row]
+            for row in worksheet.iter_rows()
+        )
+        return SheetSnapshot.from_values(list(_trim(rows)))
+    finally:
+        workbook.close()
+
+
+class FileSource:
+    """구글 시트 워크시트 대신 쓰는 로컬 파일"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: CSV / XLSX 파일 또는 워크시트 이름별 파일이 있는 폴더
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {path}")
+        self.path = path
+
+    def resolve(self, worksheet_label: str) -> str:
+        """워크시트에 해당하는 파일 경로"""
+        if not os.path.isdir(self.path):
+            return self.path
+        for ext in EXTENSIONS:
+            candidate = os.path.join(self.path, worksheet_label + ext)
+            if os.path.exists(candidate):
+                return candidate
+        raise FileNotFoundError(f"'{worksheet_label}' 데이터 파일이 없습니다: {self.path}")
+
+    def snapshot(self, worksheet_index: int, worksheet_label: str) -> SheetSnapshot:
+        """
+        워크시트 스냅샷
+
+        Args:
+            worksheet_index: 워크시트 번호 (0-indexed, 워크북일 때 사용)
+            worksheet_label: 워크시트 이름 (폴더일 때 파일 이름으로 사용)
+        """
+        path = self.resolve(worksheet_label)
+        if path.lower().endswith('.xlsx'):
+            # 폴더 안의 워크시트별 파일은 첫 번째 시트만 사용
+            snapshot = read_xlsx(path, 0 if os.path.isdir(self.path) else worksheet_index)
+        elif path.lower().endswith('.csv'):
+            snapshot = read_csv(path)
+        else:
+            raise ValueError(f"지원하지 않는 파일 형식입니다 (CSV/XLSX): {path}")
+        print(f"📂 파일에서 읽음: {os.path.basename(path)} ({len(snapshot)}행)")
+        return snapshot
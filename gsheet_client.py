@@ -0,0 +1,184 @@
+"""
+구글 시트 공용 클라이언트 모듈
+- 서비스 계정 인증/클라이언트 생성을 프로세스당 한 번만 수행하고 모든 리더가 공유
+  (gspread 클라이언트 하나 = keep-alive HTTP 세션 하나)
+- 액세스 토큰을 만료 직전까지 디스크에 캐시하여
+  짧게 실행되는 cron 작업마다 OAuth 토큰 교환을 반복하지 않음
+- 같은 스프레드시트는 한 번만 열어서 공유 (open_by_key 메타데이터 조회 1회)
+  열 때 받은 메타데이터의 워크시트 목록도 보관 (SpreadsheetLoader 가 제목 조회 요청을 다시 하지 않음)
+- 세션에 요청 조절기(request_governor)를 붙여 429/5xx 는 백오프 후 재시도
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from request_governor import get_governor
+
+
+TOKEN_REFRESH_MARGIN = 300  # 만료 5분 전부터는 캐시된 토큰을 쓰지 않음 (초)
+TOKEN_CACHE_DIR = os.environ.get(
+    'ISSUE_AUTOMATION_TOKEN_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'issue_automation')
+)
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+_spreadsheets: Dict[Tuple[int, str], Any] = {}
+_spreadsheet_class = None
+
+
+def _utcnow() -> datetime:
+    """google-auth 와 같은 naive UTC 시각"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _token_cache_path(credentials, scopes: List[str]) -> str:
+    """서비스 계정 + 권한 범위별 토큰 캐시 파일 경로"""
+    key = credentials.service_account_email + '|' + ' '.join(sorted(scopes))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(TOKEN_CACHE_DIR, f"token_{digest}.json")
+
+
+def _load_cached_token(credentials, path: str) -> bool:
+    """캐시된 토큰이 충분히 남아 있으면 자격 증명에 적용"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        expiry = datetime.fromisoformat(cached['expiry'])
+    except (OSError, ValueError, KeyError):
+        return False
+    if (expiry - _utcnow()).total_seconds() <= TOKEN_REFRESH_MARGIN:
+        return False
+    credentials.token = cached['token']
+    credentials.expiry = expiry
+    return True
+
+
+def _save_token(credentials, path: str):
+    """토큰 캐시 기록 (본인만 읽을 수 있는 파일, os.replace 로 원자적 교체)"""
+    if not credentials.token or credentials.expiry is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'token': credentials.token, 'expiry': credentials.expiry.isoformat()}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️ 토큰 캐시 저장 실패: {e}")
+
+
+def _save_on_refresh(credentials, path: str):
+    """
+    토큰이 갱신될 때마다 캐시에 기록
+
+    실행 중 만료/401 로 AuthorizedSession 이 credentials.refresh() 를 부르는 경우도 포함
+    (기록하지 않으면 다음 실행이 만료된 토큰을 읽고 다시 토큰 교환을 함)
+    """
+    refresh = credentials.refresh
+
+    def refresh_and_save(request):
+        refresh(request)
+        _save_token(credentials, path)
+
+    credentials.refresh = refresh_and_save
+
+
+def load_credentials(credentials_path: str, scopes: List[str]):
+    """서비스 계정 자격 증명 (캐시된 토큰이 유효하면 토큰 교환 생략, 갱신된 토큰은 캐시에 기록)"""
+    from google.oauth2.service_account import Credentials
+    from google.auth.transport.requests import Request
+
+    credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
+    path = _token_cache_path(credentials, scopes)
+    _save_on_refresh(credentials, path)
+    if not _load_cached_token(credentials, path):
+        credentials.refresh(Request())
+    return credentials
+
+
+def get_client(credentials_path: str, scopes: List[str], timeout: float = None):
+    """
+    프로세스 공용 gspread 클라이언트
+
+    Args:
+        credentials_path: 서비스 계정 JSON 파일 경로
+        scopes: 권한 범위
+        timeout: 구글 API 요청 타임아웃 (초). None이면 기존 설정 유지
+    """
+    key = (os.path.abspath(credentials_path), tuple(sorted(scopes)))
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import gspread
+
+            cassette = get_governor().cassette
+            if cassette is not None and cassette.replaying:
+                # 카세트 재생: 서비스 계정 파일/토큰 교환 없이 녹화된 응답만 사용
+                from cassette import replay_credentials
+                credentials = replay_credentials()
+            else:
+                credentials = load_credentials(credentials_path, list(scopes))
+            client = gspread.authorize(credentials)
+            # 모든 시트 요청이 공용 속도 제한/재시도를 거치도록
+            get_governor().mount(client.http_client.session, 'sheets')
+            _clients[key] = client
+        if timeout:
+            client.set_timeout(timeout)
+    return client
+
+
+def _cached_spreadsheet_class():
+    """열 때 받은 워크시트 속성을 보관하는 gspread.Spreadsheet 하위 클래스 (gspread 는 필요할 때만 로드)"""
+    global _spreadsheet_class
+    if _spreadsheet_class is None:
+        import gspread
+
+        class CachedSpreadsheet(gspread.Spreadsheet):
+            worksheet_properties: List[dict] = None  # 워크시트 속성 (index, title, sheetId ...)
+
+            def fetch_sheet_metadata(self, params=None):
+                metadata = super().fetch_sheet_metadata(params)
+                if params is None and 'sheets' in metadata:
+                    # 생성자의 기본 조회(전체 메타데이터)에 워크시트 목록이 들어 있음
+                    self.worksheet_properties = [s['properties'] for s in metadata['sheets']]
+                return metadata
+
+        _spreadsheet_class = CachedSpreadsheet
+    return _spreadsheet_class
+
+
+def _open_by_key(client, spreadsheet_id: str):
+    """client.open_by_key 와 같은 동작 (요청 1회) + 워크시트 목록 보관"""
+    from gspread.exceptions import APIError, SpreadsheetNotFound
+
+    try:
+        return _cached_spreadsheet_class()(client.http_client, {'id': spreadsheet_id})
+    except APIError as e:
+        if e.response.status_code == 404:
+            raise SpreadsheetNotFound(e.response) from e
+        if e.response.status_code == 403:
+            raise PermissionError from e
+        raise
+
+
+def open_spreadsheet(credentials_path: str, spreadsheet_id: str, scopes: List[str], timeout: float = None):
+    """
+    공용 클라이언트로 스프레드시트 열기 (같은 ID는 한 번만 조회)
+
+    Returns:
+        (gspread 클라이언트, Spreadsheet)
+    """
+    client = get_client(credentials_path, scopes, timeout)
+    key = (id(client), spreadsheet_id)
+    with _lock:
+        sheet = _spreadsheets.get(key)
+        if sheet is None:
+            sheet = _open_by_key(client, spreadsheet_id)
+            _spreadsheets[key] = sheet
+    return client, sheet
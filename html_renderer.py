@@ -6,21 +6,26 @@ HTML 기반 이미지 생성 모듈
 
 import os
 import json
-import asyncio
 from typing import List
-from playwright.async_api import async_playwright
 
 from sheet_reader import CardData
+from mem_profile import MemoryProfiler
+from deadline import RunDeadline, StageTimeout
 
 
 class HtmlRenderer:
     """HTML 템플릿을 이미지로 렌더링"""
     
-    def __init__(self, assets_dir: str):
+    CARDS_PER_PAGE = 6  # 페이지당 카드 수
+    
+    def __init__(self, assets_dir: str, profiler: MemoryProfiler = None, deadline: RunDeadline = None):
         self.assets_dir = assets_dir
         self.template_path = os.path.join(assets_dir, "template.html")
+        self.profiler = profiler or MemoryProfiler(enabled=False)
+        self.deadline = deadline or RunDeadline()
         
-    async def generate_async(self, cards: List[CardData], date_str: str, output_path: str) -> List[str]:
+    async def generate_async(self, cards: List[CardData], date_str: str, output_path: str,
+                             browser=None) -> List[str]:
         """
         비동기 이미지 생성
         
@@ -28,63 +33,84 @@ class HtmlRenderer:
             cards: 카드 데이터 리스트
             date_str: 날짜 문자열
             output_path: 출력 파일 경로 (확장자 제외)
+            browser: 이미 실행된 Chromium (backfill.py / run_all.py 에서 공유). None이면 새로 실행
             
         Returns:
             생성된 이미지 파일 경로 리스트
         """
-        # 페이지당 6개 카드
-        cards_per_page = 6
-        pages = [cards[i:i + cards_per_page] for i in range(0, len(cards), cards_per_page)]
+        if browser is not None:
+            return await self._render_pages(browser, cards, date_str, output_path)
         
-        output_files = []
+        # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+        from playwright.async_api import async_playwright
         
         async with async_playwright() as p:
             # 브라우저 실행
             browser = await p.chromium.launch()
+            try:
+                return await self._render_pages(browser, cards, date_str, output_path)
+            finally:
+                await browser.close()
+        
+    def page_paths(self, cards: List[CardData], output_path: str) -> List[str]:
+        """카드 수에 따른 페이지별 이미지 경로 (1페이지면 번호 없음)"""
+        page_count = (len(cards) + self.CARDS_PER_PAGE - 1) // self.CARDS_PER_PAGE
+        if page_count == 1:
+            return [f"{output_path}.png"]
+        return [f"{output_path}_{n + 1}.png" for n in range(page_count)]
+        
+    async def _render_pages(self, browser, cards: List[CardData], date_str: str, output_path: str) -> List[str]:
+        """페이지별 렌더링 (마감 시간 초과 시 완료된 페이지까지만)"""
+        pages = [cards[i:i + self.CARDS_PER_PAGE] for i in range(0, len(cards), self.CARDS_PER_PAGE)]
+        output_files = []
+        
+        for page_num, (page_cards, file_path) in enumerate(zip(pages, self.page_paths(cards, output_path))):
+            try:
+                async with self.profiler.page(os.path.basename(file_path)):
+                    await self.deadline.wait_for('render', self._render_page(browser, page_num, page_cards, date_str, file_path))
+            except StageTimeout as e:
+                # 마감 시간 초과: 완료된 페이지까지만 결과로 반환
+                print(f"⏰ {e} - 완료된 {len(output_files)}/{len(pages)}페이지만 저장합니다")
+                break
             
-            for page_num, page_cards in enumerate(pages):
-                # 새 페이지 생성 (1280px 너비, 높이 여유있게)
-                page = await browser.new_page()
-                await page.set_viewport_size({"width": 1320, "height": 2000})
-                
-                # HTML 생성
-                html_content = self._generate_html(page_cards, date_str)
-                
-                # 임시 HTML 파일 저장
-                temp_html = os.path.join(self.assets_dir, f"temp_page_{page_num}.html")
-                with open(temp_html, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                # 페이지 로드 (Tailwind + 구글폰트 로딩 대기)
-                await page.goto(f"file:///{temp_html.replace(os.sep, '/')}")
-                await page.wait_for_timeout(2000)  # CDN 폰트 로딩 대기
-                
-                # 스크린샷 저장
-                if len(pages) > 1:
-                    file_path = f"{output_path}_{page_num + 1}.png"
-                else:
-                    file_path = f"{output_path}.png"
-                
-                # 페이지 요소만 캡처
-                element = await page.query_selector("#page")
-                if element:
-                    await element.screenshot(path=file_path)
-                else:
-                    await page.screenshot(path=file_path)
-                
-                output_files.append(file_path)
-                print(f"💾 저장 완료: {file_path}")
-                
-                # 임시 파일 삭제
-                os.remove(temp_html)
-                await page.close()
-            
-            await browser.close()
+            output_files.append(file_path)
+            print(f"💾 저장 완료: {file_path}")
         
         return output_files
+        
+    async def _render_page(self, browser, page_num: int, page_cards: List[CardData], date_str: str, file_path: str):
+        """페이지 1장 렌더링 후 스크린샷 저장"""
+        # 새 페이지 생성 (1280px 너비, 높이 여유있게)
+        page = await browser.new_page()
+        await page.set_viewport_size({"width": 1320, "height": 2000})
+        
+        # HTML 생성
+        html_content = self._generate_html(page_cards, date_str)
+        
+        # 임시 HTML 파일 저장
+        temp_html = os.path.join(self.assets_dir, f"temp_page_{page_num}.html")
+        with open(temp_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        try:
+            # 페이지 로드 (Tailwind + 구글폰트 로딩 대기)
+            await page.goto(f"file:///{temp_html.replace(os.sep, '/')}", timeout=self.deadline.timeout_ms('render'))
+            await page.wait_for_timeout(2000)  # CDN 폰트 로딩 대기
+            
+            # 페이지 요소만 캡처
+            element = await page.query_selector("#page")
+            if element:
+                await element.screenshot(path=file_path)
+            else:
+                await page.screenshot(path=file_path)
+        finally:
+            # 임시 파일 삭제
+            os.remove(temp_html)
+            await page.close()
     
     def generate(self, cards: List[CardData], date_str: str, output_path: str) -> List[str]:
         """동기 래퍼"""
+        import asyncio
         return asyncio.run(self.generate_async(cards, date_str, output_path))
     
     def _generate_html(self, cards: List[CardData], date_str: str) -> str:
@@ -6,22 +6,25 @@ HTML 기반 이미지 생성 모듈 - 답안지용
 
 import os
 import json
-import asyncio
 from typing import List, Dict, Any
-from playwright.async_api import async_playwright
 from dataclasses import asdict
 
 from airtable_reader import StockItem, CategoryGroup, CountryGroup
+from mem_profile import MemoryProfiler
+from deadline import RunDeadline, StageTimeout
 
 
 class HtmlRendererAnswerSheet:
     """HTML 템플릿을 이미지로 렌더링 - 답안지용"""
     
-    def __init__(self, assets_dir: str):
+    def __init__(self, assets_dir: str, profiler: MemoryProfiler = None, deadline: RunDeadline = None):
         self.assets_dir = assets_dir
         self.template_path = os.path.join(assets_dir, "template_answersheet.html")
+        self.profiler = profiler or MemoryProfiler(enabled=False)
+        self.deadline = deadline or RunDeadline()
         
-    async def generate_async(self, data: Dict[str, Any], date_str: str, output_path: str) -> List[str]:
+    async def generate_async(self, data: Dict[str, Any], date_str: str, output_path: str,
+                             browser=None) -> List[str]:
         """
         비동기 이미지 생성
         
@@ -29,54 +32,78 @@ class HtmlRendererAnswerSheet:
             data: 답안지 데이터 (시대흐름, 슈퍼픽, 일정매매)
             date_str: 날짜 문자열
             output_path: 출력 파일 경로 (확장자 제외)
+            browser: 이미 실행된 Chromium (run_all.py 에서 리포트끼리 공유). None이면 새로 실행
             
         Returns:
             생성된 이미지 파일 경로 리스트
         """
-        output_files = []
+        if browser is not None:
+            return await self._render_answersheet(browser, data, date_str, output_path)
+        
+        # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+        from playwright.async_api import async_playwright
         
         async with async_playwright() as p:
             # 브라우저 실행
             browser = await p.chromium.launch()
-            page = await browser.new_page()
-            
-            # 뷰포트 설정 (600px 모바일 최적화)
-            await page.set_viewport_size({"width": 650, "height": 8000})
-            
-            # HTML 생성
-            html_content = self._generate_html(data, date_str)
-            
-            # 임시 HTML 파일 저장
-            temp_html = os.path.join(self.assets_dir, "temp_answersheet.html")
-            with open(temp_html, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
+            try:
+                return await self._render_answersheet(browser, data, date_str, output_path)
+            finally:
+                await browser.close()
+    
+    async def _render_answersheet(self, browser, data: Dict[str, Any], date_str: str, output_path: str) -> List[str]:
+        """답안지 렌더링 (마감 시간 초과 시 빈 리스트)"""
+        output_files = []
+        
+        # 출력 파일명
+        output_file = f"{output_path}.png"
+        
+        try:
+            async with self.profiler.page(os.path.basename(output_file)):
+                await self.deadline.wait_for('render', self._render_page(browser, data, date_str, output_file))
+        except StageTimeout as e:
+            # 마감 시간 초과: 저장하지 못한 답안지는 결과에서 제외
+            print(f"⏰ {e}")
+        else:
+            output_files.append(output_file)
+            print(f"💾 저장 완료: {output_file}")
+        
+        return output_files
+    
+    async def _render_page(self, browser, data: Dict[str, Any], date_str: str, output_file: str):
+        """답안지 1장 렌더링 후 스크린샷 저장"""
+        page = await browser.new_page()
+        
+        # 뷰포트 설정 (600px 모바일 최적화)
+        await page.set_viewport_size({"width": 650, "height": 8000})
+        
+        # HTML 생성
+        html_content = self._generate_html(data, date_str)
+        
+        # 임시 HTML 파일 저장
+        temp_html = os.path.join(self.assets_dir, "temp_answersheet.html")
+        with open(temp_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        try:
             # 페이지 로드 (폰트 로딩 대기)
-            await page.goto(f"file:///{temp_html.replace(os.sep, '/')}")
+            await page.goto(f"file:///{temp_html.replace(os.sep, '/')}", timeout=self.deadline.timeout_ms('render'))
             await page.wait_for_timeout(2500)  # CDN 폰트 로딩 대기
             
-            # 출력 파일명
-            output_file = f"{output_path}.png"
-            
             # 캡처 영역만 스크린샷
             element = await page.query_selector("#capture-area")
             if element:
                 await element.screenshot(path=output_file)
             else:
                 await page.screenshot(path=output_file, full_page=True)
-            
-            output_files.append(output_file)
-            print(f"💾 저장 완료: {output_file}")
-            
+        finally:
             # 임시 파일 삭제
             os.remove(temp_html)
             await page.close()
-            await browser.close()
-        
-        return output_files
     
     def generate(self, data: Dict[str, Any], date_str: str, output_path: str) -> List[str]:
         """동기 래퍼"""
+        import asyncio
         return asyncio.run(self.generate_async(data, date_str, output_path))
     
     def _generate_html(self, data: Dict[str, Any], date_str: str) -> str:
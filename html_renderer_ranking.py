@@ -6,27 +6,30 @@ HTML 기반 이미지 생성 모듈 - 등락률 순위용
 
 import os
 import json
-import asyncio
 from typing import List
-from playwright.async_api import async_playwright
 
 from sheet_reader_ranking import MaterialGroup
+from mem_profile import MemoryProfiler
+from deadline import RunDeadline, StageTimeout
 
 
 class HtmlRendererRanking:
     """HTML 템플릿을 이미지로 렌더링 - 등락률 순위용"""
     
-    def __init__(self, assets_dir: str):
+    def __init__(self, assets_dir: str, profiler: MemoryProfiler = None, deadline: RunDeadline = None):
         self.assets_dir = assets_dir
         self.template_path = os.path.join(assets_dir, "template_ranking.html")
+        self.profiler = profiler or MemoryProfiler(enabled=False)
+        self.deadline = deadline or RunDeadline()
         
-    async def generate_async(self, groups: List[MaterialGroup], output_path: str) -> List[str]:
+    async def generate_async(self, groups: List[MaterialGroup], output_path: str, browser=None) -> List[str]:
         """
         비동기 이미지 생성
         
         Args:
             groups: 재료별 그룹 리스트
             output_path: 출력 파일 경로 (확장자 제외)
+            browser: 이미 실행된 Chromium (run_all.py 에서 리포트끼리 공유). None이면 새로 실행
             
         Returns:
             생성된 이미지 파일 경로 리스트
@@ -55,56 +58,78 @@ class HtmlRendererRanking:
         if current_page:
             pages.append(current_page)
         
-        output_files = []
+        if browser is not None:
+            return await self._render_pages(browser, pages, output_path)
+        
+        # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+        from playwright.async_api import async_playwright
         
         async with async_playwright() as p:
             # 브라우저 실행
             browser = await p.chromium.launch()
+            try:
+                return await self._render_pages(browser, pages, output_path)
+            finally:
+                await browser.close()
+    
+    async def _render_pages(self, browser, pages: List[List[MaterialGroup]], output_path: str) -> List[str]:
+        """페이지별 렌더링 (마감 시간 초과 시 완료된 페이지까지만)"""
+        output_files = []
+        
+        for page_num, page_groups in enumerate(pages):
+            # 출력 파일명
+            if len(pages) > 1:
+                output_file = f"{output_path}_{page_num + 1}.png"
+            else:
+                output_file = f"{output_path}.png"
             
-            for page_num, page_groups in enumerate(pages):
-                page = await browser.new_page()
-                
-                # 뷰포트 설정
-                await page.set_viewport_size({"width": 1680, "height": 3000})
-                
-                # HTML 생성
-                html_content = self._generate_html(page_groups)
-                
-                # 임시 HTML 파일 저장
-                temp_html = os.path.join(self.assets_dir, f"temp_ranking_{page_num}.html")
-                with open(temp_html, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                # 페이지 로드 (폰트 로딩 대기)
-                await page.goto(f"file:///{temp_html.replace(os.sep, '/')}")
-                await page.wait_for_timeout(2000)
-                
-                # 출력 파일명
-                if len(pages) > 1:
-                    output_file = f"{output_path}_{page_num + 1}.png"
-                else:
-                    output_file = f"{output_path}.png"
-                
-                # 스크린샷 저장
-                element = await page.query_selector("#capture-area")
-                if element:
-                    await element.screenshot(path=output_file)
-                else:
-                    await page.screenshot(path=output_file)
-                
-                output_files.append(output_file)
-                print(f"💾 저장 완료: {output_file}")
-                
-                # 임시 파일 삭제
-                os.remove(temp_html)
-                await page.close()
+            try:
+                async with self.profiler.page(os.path.basename(output_file)):
+                    await self.deadline.wait_for('render', self._render_page(browser, page_num, page_groups, output_file))
+            except StageTimeout as e:
+                # 마감 시간 초과: 완료된 페이지까지만 결과로 반환
+                print(f"⏰ {e} - 완료된 {len(output_files)}/{len(pages)}페이지만 저장합니다")
+                break
             
-            await browser.close()
+            output_files.append(output_file)
+            print(f"💾 저장 완료: {output_file}")
         
         return output_files
     
+    async def _render_page(self, browser, page_num: int, page_groups: List[MaterialGroup], output_file: str):
+        """페이지 1장 렌더링 후 스크린샷 저장"""
+        page = await browser.new_page()
+        
+        # 뷰포트 설정
+        await page.set_viewport_size({"width": 1680, "height": 3000})
+        
+        # HTML 생성
+        html_content = self._generate_html(page_groups)
+        
+        # 임시 HTML 파일 저장
+        temp_html = os.path.join(self.assets_dir, f"temp_ranking_{page_num}.html")
+        with open(temp_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        try:
+            # 페이지 로드 (폰트 로딩 대기)
+            await page.goto(f"file:///{temp_html.replace(os.sep, '/')}", timeout=self.deadline.timeout_ms('render'))
+            await page.wait_for_timeout(2000)
+            
+            # 스크린샷 저장
+            element = await page.query_selector("#capture-area")
+            if element:
+                await element.screenshot(path=output_file)
+            else:
+                await page.screenshot(path=output_file)
+        finally:
+            # 임시 파일 삭제
+            os.remove(temp_html)
+            await page.close()
+    
     def generate(self, groups: List[MaterialGroup], output_path: str) -> List[str]:
         """동기 래퍼"""
+        import asyncio
         return asyncio.run(self.generate_async(groups, output_path))
     
     def _generate_html(self, groups: List[MaterialGroup]) -> str:
@@ -148,8 +173,8 @@ if __name__ == "__main__":
         MaterialGroup(
             material='건설',
             stocks=[
-                RankingStock('', '건설', '한신공영', 30.00, '30.00', '38,679', '정부 공급 확대 속도 소식에 건설 정상화 기대감에 상승'),
-                RankingStock('', '건설', '동신건설', 29.31, '29.31', '12,704', '건설산업 정상화 정책 기대감에 건설株 상승'),
+                RankingStock('', '건설', '한신공영', 30.00, 38679, '정부 공급 확대 속도 소식에 건설 정상화 기대감에 상승'),
+                RankingStock('', '건설', '동신건설', 29.31, 12704, '건설산업 정상화 정책 기대감에 건설株 상승'),
             ],
             color='#FFF9C4',
             is_single=False
@@ -157,7 +182,7 @@ if __name__ == "__main__":
         MaterialGroup(
             material='로봇',
             stocks=[
-                RankingStock('', '로봇', '링크솔루션', 29.92, '29.92', '77,999', '2025.12.2 링크솔루션 "보스턴다이내믹스 로봇 샘플 25종" 테스트 통과 기대감'),
+                RankingStock('', '로봇', '링크솔루션', 29.92, 77999, '2025.12.2 링크솔루션 "보스턴다이내믹스 로봇 샘플 25종" 테스트 통과 기대감'),
             ],
             color='#E0E0E0',
             is_single=True
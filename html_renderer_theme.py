@@ -5,66 +5,100 @@ HTML 기반 이미지 생성 모듈 (장중 강세테마 동향용)
 
 import os
 import json
-import asyncio
-from typing import List
-from playwright.async_api import async_playwright
+from typing import List, Set
 
 from sheet_reader_theme import CardData
+from mem_profile import MemoryProfiler
+from deadline import RunDeadline, StageTimeout
 
 
 class HtmlRendererTheme:
     """HTML 템플릿을 이미지로 렌더링 (강세테마용)"""
 
-    def __init__(self, assets_dir: str):
+    CARDS_PER_PAGE = 4  # 페이지당 카드 수
+
+    def __init__(self, assets_dir: str, profiler: MemoryProfiler = None, deadline: RunDeadline = None):
         self.assets_dir = assets_dir
         self.template_path = os.path.join(assets_dir, "template_theme.html")
+        self.profiler = profiler or MemoryProfiler(enabled=False)
+        self.deadline = deadline or RunDeadline()
 
-    async def generate_async(self, cards: List[CardData], date_str: str, output_path: str) -> List[str]:
-        """비동기 이미지 생성"""
-        cards_per_page = 4
-        pages = [cards[i:i + cards_per_page] for i in range(0, len(cards), cards_per_page)]
+    async def generate_async(self, cards: List[CardData], date_str: str, output_path: str,
+                             browser=None, page_numbers: Set[int] = None) -> List[str]:
+        """
+        비동기 이미지 생성 (browser 를 넘기면 새로 실행하지 않고 재사용)
 
-        output_files = []
+        page_numbers 를 넘기면 해당 페이지(0부터)만 렌더링 (--watch 에서 바뀐 페이지만)
+        """
+        if browser is not None:
+            return await self._render_pages(browser, cards, date_str, output_path, page_numbers)
+
+        # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+        from playwright.async_api import async_playwright
 
         async with async_playwright() as p:
             browser = await p.chromium.launch()
+            try:
+                return await self._render_pages(browser, cards, date_str, output_path, page_numbers)
+            finally:
+                await browser.close()
+
+    def page_paths(self, cards: List[CardData], output_path: str) -> List[str]:
+        """카드 수에 따른 페이지별 이미지 경로 (1페이지면 번호 없음)"""
+        page_count = (len(cards) + self.CARDS_PER_PAGE - 1) // self.CARDS_PER_PAGE
+        if page_count == 1:
+            return [f"{output_path}.png"]
+        return [f"{output_path}_{n + 1}.png" for n in range(page_count)]
+
+    async def _render_pages(self, browser, cards: List[CardData], date_str: str, output_path: str,
+                            page_numbers: Set[int] = None) -> List[str]:
+        """페이지별 렌더링 (마감 시간 초과 시 완료된 페이지까지만)"""
+        pages = [cards[i:i + self.CARDS_PER_PAGE] for i in range(0, len(cards), self.CARDS_PER_PAGE)]
+        output_files = []
 
-            for page_num, page_cards in enumerate(pages):
-                page = await browser.new_page()
-                await page.set_viewport_size({"width": 1320, "height": 2000})
-
-                html_content = self._generate_html(page_cards, date_str)
-
-                temp_html = os.path.join(self.assets_dir, f"temp_theme_{page_num}.html")
-                with open(temp_html, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+        for page_num, (page_cards, file_path) in enumerate(zip(pages, self.page_paths(cards, output_path))):
+            if page_numbers is not None and page_num not in page_numbers:
+                continue
+            try:
+                async with self.profiler.page(os.path.basename(file_path)):
+                    await self.deadline.wait_for('render', self._render_page(browser, page_num, page_cards, date_str, file_path))
+            except StageTimeout as e:
+                # 마감 시간 초과: 완료된 페이지까지만 결과로 반환
+                print(f"⏰ {e} - 완료된 {len(output_files)}/{len(pages)}페이지만 저장합니다")
+                break
 
-                await page.goto(f"file:///{temp_html.replace(os.sep, '/')}")
-                await page.wait_for_timeout(2000)
+            output_files.append(file_path)
+            print(f"💾 저장 완료: {file_path}")
 
-                if len(pages) > 1:
-                    file_path = f"{output_path}_{page_num + 1}.png"
-                else:
-                    file_path = f"{output_path}.png"
+        return output_files
 
-                element = await page.query_selector("#page")
-                if element:
-                    await element.screenshot(path=file_path)
-                else:
-                    await page.screenshot(path=file_path)
+    async def _render_page(self, browser, page_num: int, page_cards: List[CardData], date_str: str, file_path: str):
+        """페이지 1장 렌더링 후 스크린샷 저장"""
+        page = await browser.new_page()
+        await page.set_viewport_size({"width": 1320, "height": 2000})
 
-                output_files.append(file_path)
-                print(f"💾 저장 완료: {file_path}")
+        html_content = self._generate_html(page_cards, date_str)
 
-                os.remove(temp_html)
-                await page.close()
+        temp_html = os.path.join(self.assets_dir, f"temp_theme_{page_num}.html")
+        with open(temp_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
 
-            await browser.close()
+        try:
+            await page.goto(f"file:///{temp_html.replace(os.sep, '/')}", timeout=self.deadline.timeout_ms('render'))
+            await page.wait_for_timeout(2000)
 
-        return output_files
+            element = await page.query_selector("#page")
+            if element:
+                await element.screenshot(path=file_path)
+            else:
+                await page.screenshot(path=file_path)
+        finally:
+            os.remove(temp_html)
+            await page.close()
 
     def generate(self, cards: List[CardData], date_str: str, output_path: str) -> List[str]:
         """동기 래퍼"""
+        import asyncio
         return asyncio.run(self.generate_async(cards, date_str, output_path))
 
     def _generate_html(self, cards: List[CardData], date_str: str) -> str:
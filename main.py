@@ -6,6 +6,20 @@
     python main.py                    # 오늘 날짜 데이터로 이미지 생성
     python main.py --date 2025.12.03  # 특정 날짜 지정
     python main.py --test             # 테스트 데이터로 실행
+    python main.py --profile-memory   # 단계별/페이지별 메모리 프로파일 출력
+    python main.py --metrics-file /var/lib/node_exporter/textfile/급등이슈.prom  # Prometheus 지표 기록
+    python main.py --deadline 120     # 전체 2분 제한 (초과 시 완료된 페이지만 저장)
+    python main.py --list-dates       # 시트에 있는 날짜 목록 출력
+    python main.py --test --export-json cards.json  # 이미지 대신 카드 JSON 저장
+    python main.py --profile-startup  # 시작 시 임포트 시간 상세 출력
+    python main.py --date-search      # 대상 날짜 행만 조회 (A열 검색)
+    python main.py --tail-rows 300    # 마지막 300행만 조회
+    python main.py --cache-dir .cache # 시트 수정이 없으면 로컬 캐시 사용
+    python main.py --mirror sheet_mirror.db --date 2025.12.03  # 로컬 미러에서 읽기 (오프라인)
+    python main.py --source exports/급등이슈.csv  # 구글 시트 대신 로컬 CSV/XLSX 파일에서 읽기
+    python main.py --record cassettes/run1  # API 응답을 카세트에 녹화
+    python main.py --replay cassettes/run1 --replay-latency recorded  # 녹화된 응답으로 오프라인 실행
+    python main.py --from 2025.12.01 --to 2025.12.05  # 날짜 구간 일괄 생성 (이미 생성된 날짜는 건너뜀)
 
 구글 시트 구조:
     A열: 날짜
@@ -18,11 +32,19 @@
 
 import os
 import sys
+import json
 import argparse
 from datetime import datetime
 
 from sheet_reader import SheetReader, CardData, StockItem
+from normalize import format_rate
 from html_renderer import HtmlRenderer
+from mem_profile import MemoryProfiler
+from metrics import PipelineMetrics
+from backfill import parse_range, run_backfill
+from cassette import use_cassette
+from request_governor import get_governor, is_throttled
+from deadline import RunDeadline, StageTimeout, parse_shares
 
 
 # ===== 설정 =====
@@ -33,7 +55,7 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 
 
 def create_test_data():
-    """테스트용 더미 데이터 생성"""
+    """테스트용 더미 데이터 생성 (등락률은 시트 데이터와 같은 형식으로 정규화)"""
     return [
         # 테마 카드들
         CardData(
@@ -41,11 +63,11 @@ def create_test_data():
             group_name='건설',
             main_issue='정부 주택공급 정책 기대에 침체됐던 건설주 상승세 "꿈틀"',
             stocks=[
-                StockItem('한신공영', '30%'),
-                StockItem('동신건설', '29.31%'),
-                StockItem('일성건설', '11.12%'),
-                StockItem('KD', '18.67%'),
-                StockItem('일성건설', '11.12%'),
+                StockItem('한신공영', format_rate('30%')),
+                StockItem('동신건설', format_rate('29.31%')),
+                StockItem('일성건설', format_rate('11.12%')),
+                StockItem('KD', format_rate('18.67%')),
+                StockItem('일성건설', format_rate('11.12%')),
             ]
         ),
         CardData(
@@ -53,11 +75,11 @@ def create_test_data():
             group_name='고속터미널',
             main_issue='"고속터미널 재개발" 기대감에 "이 회사들" 또또 상한가',
             stocks=[
-                StockItem('천일고속', '29.97%'),
-                StockItem('대성산업', '29.93%'),
-                StockItem('동양고속', '29.87%'),
-                StockItem('신영와코루', '6.89%'),
-                StockItem('신세계', '4.19%'),
+                StockItem('천일고속', format_rate('29.97%')),
+                StockItem('대성산업', format_rate('29.93%')),
+                StockItem('동양고속', format_rate('29.87%')),
+                StockItem('신영와코루', format_rate('6.89%')),
+                StockItem('신세계', format_rate('4.19%')),
             ]
         ),
         CardData(
@@ -65,11 +87,11 @@ def create_test_data():
             group_name='로봇',
             main_issue='K-피지컬 AI, 3대 틈새 "로봇·센서·소프트웨어"',
             stocks=[
-                StockItem('링크솔루션', '29.92%'),
-                StockItem('스맥', '21.2%'),
-                StockItem('케이쓰리아이', '17.28%'),
-                StockItem('피앤에스로보틱스', '8.26%'),
-                StockItem('로보스타', '7.73%'),
+                StockItem('링크솔루션', format_rate('29.92%')),
+                StockItem('스맥', format_rate('21.2%')),
+                StockItem('케이쓰리아이', format_rate('17.28%')),
+                StockItem('피앤에스로보틱스', format_rate('8.26%')),
+                StockItem('로보스타', format_rate('7.73%')),
             ]
         ),
         CardData(
@@ -77,11 +99,11 @@ def create_test_data():
             group_name='바이오',
             main_issue='바이오주 사들이는 큰손들… 기술이전 기대감 솔솔',
             stocks=[
-                StockItem('삼성에피스홀딩스', '24.21%'),
-                StockItem('엘앤케이바이오', '17.29%'),
-                StockItem('지놈앤컴퍼니', '17.29%'),
-                StockItem('와이투솔루션', '14.89%'),
-                StockItem('인벤티지랩', '11.06%'),
+                StockItem('삼성에피스홀딩스', format_rate('24.21%')),
+                StockItem('엘앤케이바이오', format_rate('17.29%')),
+                StockItem('지놈앤컴퍼니', format_rate('17.29%')),
+                StockItem('와이투솔루션', format_rate('14.89%')),
+                StockItem('인벤티지랩', format_rate('11.06%')),
             ]
         ),
         CardData(
@@ -89,11 +111,11 @@ def create_test_data():
             group_name='원전',
             main_issue='美 "한일 대미투자 원전부터" 발언에… 원전주, 동반 강세',
             stocks=[
-                StockItem('우양에이치씨', '14.89%'),
-                StockItem('일진파워', '9.27%'),
-                StockItem('우진', '8.84%'),
-                StockItem('태웅', '7.51%'),
-                StockItem('현대건설', '6.98%'),
+                StockItem('우양에이치씨', format_rate('14.89%')),
+                StockItem('일진파워', format_rate('9.27%')),
+                StockItem('우진', format_rate('8.84%')),
+                StockItem('태웅', format_rate('7.51%')),
+                StockItem('현대건설', format_rate('6.98%')),
             ]
         ),
         CardData(
@@ -101,11 +123,11 @@ def create_test_data():
             group_name='방산',
             main_issue='KAI, 이집트 방산전시회 참가… 아프리카·중동 시장 정조준',
             stocks=[
-                StockItem('SNT모티브', '11.3%'),
-                StockItem('센서뷰', '9.64%'),
-                StockItem('파이버프로', '5.87%'),
-                StockItem('한화에어로스페이스', '5.1%'),
-                StockItem('우리기술', '4.97%'),
+                StockItem('SNT모티브', format_rate('11.3%')),
+                StockItem('센서뷰', format_rate('9.64%')),
+                StockItem('파이버프로', format_rate('5.87%')),
+                StockItem('한화에어로스페이스', format_rate('5.1%')),
+                StockItem('우리기술', format_rate('4.97%')),
             ]
         ),
         # 개별이슈 카드들
@@ -113,38 +135,164 @@ def create_test_data():
             card_type='individual',
             group_name='개별이슈',
             stocks=[
-                StockItem('코칩', '29.98%', '美 엔비디아에 블랙웰 "슈퍼커패시터" 공급... 아마존·오라클에 이어 AI 서버 밸류체인 편입'),
-                StockItem('뉴인텍', '29.85%', '"전기차株" 뉴인텍, 보조금 확대 소식에 ↑'),
+                StockItem('코칩', format_rate('29.98%'), '美 엔비디아에 블랙웰 "슈퍼커패시터" 공급... 아마존·오라클에 이어 AI 서버 밸류체인 편입'),
+                StockItem('뉴인텍', format_rate('29.85%'), '"전기차株" 뉴인텍, 보조금 확대 소식에 ↑'),
             ]
         ),
         CardData(
             card_type='individual',
             group_name='개별이슈',
             stocks=[
-                StockItem('미래컴퍼니', '23.13%', '현금·유보금 축소에 배당 중단까지… 김준구 미래컴퍼니 대표, 위기관리 부실 도마 위에 올라'),
-                StockItem('비츠로넥스텍', '20.66%', '비츠로넥스텍 "음식물쓰레기처리" 재건축단지 핵심 시스템으로 뜬다'),
-                StockItem('비나텍', '19.41%', 'CB 투자자 수익률 70%… 데이터센터 증가 수혜'),
+                StockItem('미래컴퍼니', format_rate('23.13%'), '현금·유보금 축소에 배당 중단까지… 김준구 미래컴퍼니 대표, 위기관리 부실 도마 위에 올라'),
+                StockItem('비츠로넥스텍', format_rate('20.66%'), '비츠로넥스텍 "음식물쓰레기처리" 재건축단지 핵심 시스템으로 뜬다'),
+                StockItem('비나텍', format_rate('19.41%'), 'CB 투자자 수익률 70%… 데이터센터 증가 수혜'),
             ]
         ),
         CardData(
             card_type='individual',
             group_name='개별이슈',
             stocks=[
-                StockItem('아이비전웍스', '13.45%', '2025.12.2 유리기판 최대 난제 "마이크로 크랙" 해결… 정밀 검출 특허 출원'),
-                StockItem('뉴로핏', '11.05%', '조시 코헨 미주 사업총괄 영입… 美 상업화 본격 시동'),
+                StockItem('아이비전웍스', format_rate('13.45%'), '2025.12.2 유리기판 최대 난제 "마이크로 크랙" 해결… 정밀 검출 특허 출원'),
+                StockItem('뉴로핏', format_rate('11.05%'), '조시 코헨 미주 사업총괄 영입… 美 상업화 본격 시동'),
             ]
         ),
     ]
 
 
+def list_dates(mirror_path: str = None, source_path: str = None):
+    """시트에 있는 날짜 목록 출력"""
+    # A열만 읽으면 되므로 범위 조회 모드 사용
+    reader = SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID, date_search=True, mirror_path=mirror_path,
+                         source_path=source_path)
+    reader.connect()
+    for date in reader.get_available_dates():
+        print(date)
+
+
+def export_json(cards, target_date: str, json_path: str) -> str:
+    """카드 데이터를 렌더러와 같은 형식의 JSON으로 저장"""
+    renderer = HtmlRenderer(BASE_DIR)
+    payload = {
+        'date': target_date,
+        'cards': [renderer._card_to_dict(c) for c in cards]
+    }
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"💾 JSON 저장 완료: {json_path}")
+    return json_path
+
+
 def main():
     """메인 실행 함수"""
     # 인자 파싱
     parser = argparse.ArgumentParser(description='오늘의 급등이슈 이미지 자동 생성')
     parser.add_argument('--date', type=str, help='조회할 날짜 (예: 2025.12.03)')
+    parser.add_argument('--from', dest='date_from', type=str, help='구간 일괄 생성 시작 날짜 (없으면 시트의 첫 날짜부터)')
+    parser.add_argument('--to', dest='date_to', type=str, help='구간 일괄 생성 끝 날짜 (없으면 시트의 최신 날짜까지)')
     parser.add_argument('--test', action='store_true', help='테스트 데이터로 실행')
+    parser.add_argument('--profile-memory', action='store_true', help='단계별/페이지별 메모리 프로파일 출력')
+    parser.add_argument('--metrics-file', type=str, help='Prometheus 지표 파일 경로 (textfile collector)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    parser.add_argument('--deadline', type=float, help='전체 제한 시간 (초). 초과 시 완료된 페이지만 저장')
+    parser.add_argument('--deadline-split', type=parse_shares, help='단계별 시간 배분 (예: fetch=0.4,group=0.1,render=0.5)')
+    parser.add_argument('--list-dates', action='store_true', help='시트에 있는 날짜 목록만 출력')
+    parser.add_argument('--export-json', type=str, help='이미지 대신 카드 데이터를 JSON 파일로 저장')
+    parser.add_argument('--profile-startup', action='store_true', help='시작 시 임포트 시간 상세 출력')
+    parser.add_argument('--tail-rows', type=int, help='헤더 + 마지막 N행만 조회 (전체 기록을 받지 않음)')
+    parser.add_argument('--cache-dir', type=str, help='시트 값 로컬 캐시 폴더 (시트가 수정되지 않았으면 다시 받지 않음)')
+    parser.add_argument('--mirror', type=str, help='구글 시트 대신 로컬 SQLite 미러에서 읽기 (main_sync.py 로 생성)')
+    parser.add_argument('--source', type=str, help='구글 시트 대신 로컬 CSV/XLSX 파일(또는 워크시트 이름별 파일 폴더)에서 읽기')
+    parser.add_argument('--date-search', action='store_true', help='A열에서 대상 날짜 구간을 찾아 그 행들만 조회')
+    parser.add_argument('--record', type=str, help='API 응답을 카세트 폴더에 녹화')
+    parser.add_argument('--replay', type=str, help='카세트 폴더의 녹화된 응답으로 실행 (네트워크 없음)')
+    parser.add_argument('--replay-latency', type=str, help="재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)")
     args = parser.parse_args()
     
+    # 카세트 녹화/재생 (--record / --replay 일 때만)
+    cassette = use_cassette(args.record, args.replay, args.replay_latency)
+    
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        profile_startup('main', BASE_DIR)
+        return
+    
+    if args.list_dates:
+        list_dates(args.mirror, args.source)
+        return
+    
+    # 실행 지표 (종료 시 설정된 대상으로 내보냄)
+    metrics = PipelineMetrics('급등이슈')
+    output_files = None
+    try:
+        if args.date_from or args.date_to:
+            output_files = run_range(args, metrics)
+        else:
+            output_files = run(args, metrics)
+        return output_files
+    finally:
+        if cassette is not None:
+            cassette.report()
+        metrics.record_requests(get_governor().stats())
+        metrics.finish(success=bool(output_files))
+        metrics.export(args.metrics_file, args.metrics_push)
+
+
+def run_range(args, metrics: PipelineMetrics):
+    """--from / --to 날짜 구간 일괄 생성 (시트 1회 조회 + 브라우저 1회 실행, 생성된 날짜는 건너뜀)"""
+    print("=" * 50)
+    print("🚀 급등이슈 구간 일괄 생성 시작")
+    print("=" * 50)
+    
+    try:
+        start, end = parse_range(args.date_from, args.date_to)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+    
+    # 날짜마다 다시 조회하지 않도록 범위 조회(--date-search) 없이 전체 스냅샷 1회
+    reader = SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining(),
+                         tail_rows=args.tail_rows, cache_dir=args.cache_dir,
+                         mirror_path=args.mirror, source_path=args.source)
+    renderer = HtmlRenderer(BASE_DIR, deadline=deadline)
+    
+    print("\n📡 구글 시트에서 데이터 가져오는 중 (브라우저 실행과 동시에)...")
+    try:
+        with metrics.stage('backfill'):
+            rendered, skipped = run_backfill(reader, renderer, start, end, os.path.join(OUTPUT_DIR, '급등이슈'))
+    except Exception as e:
+        if is_throttled(e):
+            print(f"❌ 구글 시트 요청 한도 초과 (재시도 후 실패): {e}")
+        else:
+            print(f"❌ 구간 생성 실패: {e}")
+        return None
+    metrics.record_rows(reader.rows_fetched)
+    
+    # 건너뛴 날짜의 기존 이미지는 이번 실행의 렌더링 결과에서 제외
+    output_files = [f for files in rendered.values() for f in files]
+    metrics.record_outputs(output_files)
+    metrics.set('backfill_dates', len(rendered), status='rendered')
+    metrics.set('backfill_dates', len(skipped), status='skipped')
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
+    
+    print("\n" + "=" * 50)
+    print(f"✅ 구간 생성 완료: {len(rendered)}일, {len(output_files)}개 이미지 생성"
+          + (f" / 이미 생성된 {len(skipped)}일 건너뜀" if skipped else ""))
+    print("=" * 50)
+    for label, files in rendered.items():
+        print(f"   📅 {label}: {len(files)}페이지")
+    print("\n")
+    
+    deadline.report()
+    
+    return output_files
+
+
+def run(args, metrics: PipelineMetrics):
+    """데이터 조회 → 그룹화 → 이미지 생성"""
     print("=" * 50)
     print("🚀 오늘의 급등이슈 자동화 시작")
     print("=" * 50)
@@ -152,6 +300,13 @@ def main():
     # 출력 폴더 생성
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
+    # 메모리 프로파일러 (--profile-memory 일 때만 측정)
+    profiler = MemoryProfiler(enabled=args.profile_memory)
+    profiler.start()
+    
+    # 마감 시간 (--deadline 일 때만 적용)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+    
     # 데이터 가져오기
     if args.test:
         print("\n🧪 테스트 모드: 더미 데이터 사용")
@@ -160,16 +315,22 @@ def main():
     else:
         print("\n📡 구글 시트에서 데이터 가져오는 중...")
         try:
-            reader = SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID)
-            reader.connect()
+            reader = SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining(),
+                               tail_rows=args.tail_rows, date_search=args.date_search,
+                               cache_dir=args.cache_dir, mirror_path=args.mirror,
+                               source_path=args.source)
+            with metrics.stage('connect'):
+                deadline.call('fetch', reader.connect)
             
             # 날짜 지정 없으면 시트의 최신 날짜 자동 사용
             target_date = args.date if args.date else None
-            raw_data = reader.get_today_data(target_date)
-            
-            # 실제 사용된 날짜 가져오기
-            if target_date is None:
-                target_date = reader.get_latest_date()
+            with profiler.stage('fetch'), metrics.stage('fetch'):
+                raw_data = deadline.call('fetch', reader.get_today_data, target_date)
+                
+                # 실제 사용된 날짜 가져오기
+                if target_date is None:
+                    target_date = deadline.call('fetch', reader.get_latest_date)
+            metrics.record_rows(reader.rows_fetched)
             
             print(f"📅 대상 날짜: {target_date}")
             
@@ -179,26 +340,47 @@ def main():
                 cards = create_test_data()
                 target_date = "2025.12.03"
             else:
-                cards = reader.group_data(raw_data)
+                with profiler.stage('group'), metrics.stage('group'):
+                    cards = deadline.call('group', reader.group_data, raw_data)
                 
+        except StageTimeout as e:
+            # 마감 시간 초과: 더미 데이터로 대체하지 않고 중단
+            print(f"⏰ {e}")
+            metrics.set('deadline_exceeded', 1, stage=e.stage)
+            deadline.report()
+            return None
         except Exception as e:
+            if is_throttled(e):
+                # 재시도 후에도 요청 한도 초과: 더미 데이터로 대체하지 않고 중단
+                print(f"❌ 구글 시트 요청 한도 초과 (재시도 후 실패): {e}")
+                return None
             print(f"❌ 구글 시트 연결 실패: {e}")
             print("   테스트 모드로 전환합니다...")
             cards = create_test_data()
             target_date = "2025.12.03"
     
     print(f"\n📦 총 {len(cards)}개의 카드 생성 예정")
+    metrics.set('cards_produced', len(cards))
+    metrics.set('groups_produced', len({c.group_name for c in cards}))
+    
+    # JSON 내보내기 모드 (이미지 생성 생략)
+    if args.export_json:
+        return [export_json(cards, target_date, args.export_json)]
     
     # 이미지 생성 (HTML 기반)
     print("\n🎨 이미지 생성 중 (HTML → 스크린샷)...")
-    renderer = HtmlRenderer(BASE_DIR)
+    renderer = HtmlRenderer(BASE_DIR, profiler=profiler, deadline=deadline)
     
     # 출력 파일명
     date_short = target_date.replace(".", "")
     output_path = os.path.join(OUTPUT_DIR, f"급등이슈_{date_short}")
     
     # 생성 실행
-    output_files = renderer.generate(cards, target_date, output_path)
+    with metrics.stage('render'):
+        output_files = renderer.generate(cards, target_date, output_path)
+    metrics.record_outputs(output_files)
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
     
     # 완료 메시지
     print("\n" + "=" * 50)
@@ -208,9 +390,11 @@ def main():
         print(f"   📁 {f}")
     print("\n")
     
+    profiler.report()
+    deadline.report()
+    
     return output_files
 
 
 if __name__ == "__main__":
     main()
-
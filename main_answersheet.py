@@ -3,7 +3,17 @@
 ============================================
 
 사용법:
-    python main_answersheet.py
+    python main_answersheet.py                    # Airtable 데이터로 이미지 생성
+    python main_answersheet.py --profile-memory   # 메모리 프로파일 출력
+    python main_answersheet.py --metrics-file ./metrics/   # Prometheus 지표 기록
+    python main_answersheet.py --deadline 300   # 전체 5분 제한
+    python main_answersheet.py --export-json answersheet.json  # 이미지 대신 JSON 저장
+    python main_answersheet.py --profile-startup  # 시작 시 임포트 시간 상세 출력
+    python main_answersheet.py --cache-dir ./cache/  # 변경된 레코드만 받아 로컬 캐시에 병합
+    python main_answersheet.py --cache-dir ./cache/ --full-sync  # 캐시 전체 다시 받기
+    python main_answersheet.py --cache-dir ./cache/ --check-deletions  # 삭제된 레코드도 지금 확인 (레코드 ID 전체 조회)
+    python main_answersheet.py --record cassettes/run1  # API 응답을 카세트에 녹화
+    python main_answersheet.py --replay cassettes/run1 --replay-latency recorded  # 녹화된 응답으로 오프라인 실행
 
 Airtable 구조:
     종목명 (Single line text)
@@ -19,10 +29,16 @@ Airtable 구조:
 
 import os
 import sys
+import argparse
 from datetime import datetime
 
 from airtable_reader import AirtableReader
 from html_renderer_answersheet import HtmlRendererAnswerSheet
+from mem_profile import MemoryProfiler
+from metrics import PipelineMetrics
+from cassette import use_cassette
+from request_governor import get_governor
+from deadline import RunDeadline, StageTimeout, parse_shares
 
 
 # ===== 설정 =====
@@ -40,8 +56,60 @@ except ImportError:
     AIRTABLE_TABLE_ID = os.environ.get("AIRTABLE_TABLE_ID", "tbllRbqwpfEY8dV2O")
 
 
+def export_json(data, json_path: str) -> str:
+    """답안지 데이터를 렌더러와 같은 형식의 JSON으로 저장"""
+    renderer = HtmlRendererAnswerSheet(BASE_DIR)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write(renderer._convert_to_json(data))
+    print(f"💾 JSON 저장 완료: {json_path}")
+    return json_path
+
+
 def main():
     """메인 실행 함수"""
+    # 인자 파싱
+    parser = argparse.ArgumentParser(description='월클 답안지 이미지 자동 생성')
+    parser.add_argument('--profile-memory', action='store_true', help='단계별/페이지별 메모리 프로파일 출력')
+    parser.add_argument('--metrics-file', type=str, help='Prometheus 지표 파일 경로 (textfile collector)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    parser.add_argument('--deadline', type=float, help='전체 제한 시간 (초). 초과 시 완료된 페이지만 저장')
+    parser.add_argument('--deadline-split', type=parse_shares, help='단계별 시간 배분 (예: fetch=0.4,group=0.1,render=0.5)')
+    parser.add_argument('--export-json', type=str, help='이미지 대신 데이터를 JSON 파일로 저장')
+    parser.add_argument('--profile-startup', action='store_true', help='시작 시 임포트 시간 상세 출력')
+    parser.add_argument('--cache-dir', type=str, help='Airtable 레코드 로컬 캐시 폴더 (마지막 동기화 이후 변경분만 조회)')
+    parser.add_argument('--full-sync', action='store_true', help='--cache-dir 캐시를 무시하고 전체 다시 받기')
+    parser.add_argument('--check-deletions', action='store_true',
+                        help='--cache-dir 증분 동기화에서 삭제된 레코드도 확인 (레코드 100개당 요청 1회, '
+                             '지정하지 않으면 일정 횟수/시간마다만 확인)')
+    parser.add_argument('--record', type=str, help='API 응답을 카세트 폴더에 녹화')
+    parser.add_argument('--replay', type=str, help='카세트 폴더의 녹화된 응답으로 실행 (네트워크 없음)')
+    parser.add_argument('--replay-latency', type=str, help="재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)")
+    args = parser.parse_args()
+    
+    # 카세트 녹화/재생 (--record / --replay 일 때만)
+    cassette = use_cassette(args.record, args.replay, args.replay_latency)
+    
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        profile_startup('main_answersheet', BASE_DIR)
+        return
+    
+    # 실행 지표 (종료 시 설정된 대상으로 내보냄)
+    metrics = PipelineMetrics('답안지')
+    output_files = None
+    try:
+        output_files = run(args, metrics)
+        return output_files
+    finally:
+        if cassette is not None:
+            cassette.report()
+        metrics.record_requests(get_governor().stats())
+        metrics.finish(success=bool(output_files))
+        metrics.export(args.metrics_file, args.metrics_push)
+
+
+def run(args, metrics: PipelineMetrics):
+    """데이터 조회 → 그룹화 → 이미지 생성"""
     print("=" * 50)
     print("🚀 월클 답안지 자동화 시작")
     print("=" * 50)
@@ -49,14 +117,26 @@ def main():
     # 출력 폴더 생성
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
+    # 메모리 프로파일러 (--profile-memory 일 때만 측정)
+    profiler = MemoryProfiler(enabled=args.profile_memory)
+    profiler.start()
+    
+    # 마감 시간 (--deadline 일 때만 적용)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+    
     # 데이터 가져오기
     print("\n📡 Airtable에서 데이터 가져오는 중...")
     try:
-        reader = AirtableReader(AIRTABLE_API_KEY, AIRTABLE_BASE_ID, AIRTABLE_TABLE_ID)
-        reader.connect()
+        reader = AirtableReader(AIRTABLE_API_KEY, AIRTABLE_BASE_ID, AIRTABLE_TABLE_ID, timeout=deadline.remaining(),
+                                cache_dir=args.cache_dir, full_sync=args.full_sync,
+                                check_deletions=args.check_deletions)
+        with metrics.stage('connect'):
+            deadline.call('fetch', reader.connect)
         
         # 유형별로 그룹화된 데이터 가져오기
-        data = reader.get_grouped_data()
+        with profiler.stage('fetch+group'), metrics.stage('fetch'):
+            data = deadline.call('fetch', reader.get_grouped_data)
+        metrics.record_rows(reader.rows_fetched)
         
         if not data:
             print(f"⚠️ 데이터가 없습니다!")
@@ -77,6 +157,12 @@ def main():
             print(f"⚠️ 표시할 종목이 없습니다!")
             return
             
+    except StageTimeout as e:
+        # 마감 시간 초과: 더 진행하지 않고 중단
+        print(f"⏰ {e}")
+        metrics.set('deadline_exceeded', 1, stage=e.stage)
+        deadline.report()
+        return
     except Exception as e:
         print(f"❌ Airtable 연결 실패: {e}")
         import traceback
@@ -84,10 +170,16 @@ def main():
         return
     
     print(f"\n📦 총 {total_count}개의 종목")
+    metrics.set('cards_produced', total_count)
+    metrics.set('groups_produced', sum(len(country.카테고리들) for country in data.get('시대흐름', [])))
+    
+    # JSON 내보내기 모드 (이미지 생성 생략)
+    if args.export_json:
+        return [export_json(data, args.export_json)]
     
     # 이미지 생성 (HTML 기반)
     print("\n🎨 이미지 생성 중 (HTML → 스크린샷)...")
-    renderer = HtmlRendererAnswerSheet(BASE_DIR)
+    renderer = HtmlRendererAnswerSheet(BASE_DIR, profiler=profiler, deadline=deadline)
     
     # 출력 파일명 (오늘 날짜 사용)
     today = datetime.now().strftime("%Y%m%d")
@@ -95,7 +187,11 @@ def main():
     output_path = os.path.join(OUTPUT_DIR, f"답안지_{today}")
     
     # 생성 실행
-    output_files = renderer.generate(data, today_display, output_path)
+    with metrics.stage('render'):
+        output_files = renderer.generate(data, today_display, output_path)
+    metrics.record_outputs(output_files)
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
     
     # 완료 메시지
     print("\n" + "=" * 50)
@@ -105,6 +201,9 @@ def main():
         print(f"   📁 {f}")
     print("\n")
     
+    profiler.report()
+    deadline.report()
+    
     return output_files
 
 
@@ -3,10 +3,23 @@
 ============================================
 
 사용법:
-    python main_ranking.py
+    python main_ranking.py                    # 시트2 데이터로 이미지 생성
+    python main_ranking.py --profile-memory   # 메모리 프로파일 출력
+    python main_ranking.py --metrics-file ./metrics/   # Prometheus 지표 기록
+    python main_ranking.py --deadline 300   # 전체 5분 제한
+    python main_ranking.py --export-json ranking.json  # 이미지 대신 JSON 저장
+    python main_ranking.py --profile-startup  # 시작 시 임포트 시간 상세 출력
+    python main_ranking.py --tail-rows 300    # 마지막 300행만 조회
+    python main_ranking.py --cache-dir .cache # 시트 수정이 없으면 로컬 캐시 사용
+    python main_ranking.py --mirror sheet_mirror.db  # 로컬 미러에서 읽기 (오프라인)
+    python main_ranking.py --source exports/         # 구글 시트 대신 로컬 CSV/XLSX 파일에서 읽기
+    python main_ranking.py --record cassettes/run1  # API 응답을 카세트에 녹화
+    python main_ranking.py --replay cassettes/run1 --replay-latency recorded  # 녹화된 응답으로 오프라인 실행
+    python main_ranking.py --days 1 --top 30  # 오늘(최신 날짜) 등락률 상위 30종목만
+    python main_ranking.py --days 5 --top 50 --top-by volume  # 최근 5거래일 거래대금 상위 50종목
 
 구글 시트 구조 (시트2):
-    A열: 날짜 (사용 안함)
+    A열: 날짜 (--days 지정 시 기간 선택에 사용)
     B열: 재료
     C열: 종목명
     D열: 등락률(%)
@@ -16,10 +29,17 @@
 
 import os
 import sys
+import json
+import argparse
 from datetime import datetime
 
 from sheet_reader_ranking import SheetReaderRanking
 from html_renderer_ranking import HtmlRendererRanking
+from mem_profile import MemoryProfiler
+from metrics import PipelineMetrics
+from cassette import use_cassette
+from request_governor import get_governor
+from deadline import RunDeadline, StageTimeout, parse_shares
 
 
 # ===== 설정 =====
@@ -29,8 +49,74 @@ SPREADSHEET_ID = "1dX8Diej7AQixm7fBrnrdUybxW2Au9QzyATYRBKZN_jk"
 OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 
 
+def positive_int(text: str) -> int:
+    """argparse type: 1 이상의 정수 (--days 0 / --top -3 등은 사용법 오류)"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {text}")
+    return value
+
+
+def export_json(groups, json_path: str) -> str:
+    """재료별 그룹 데이터를 렌더러와 같은 형식의 JSON으로 저장"""
+    renderer = HtmlRendererRanking(BASE_DIR)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump([renderer._group_to_dict(g) for g in groups], f, ensure_ascii=False, indent=2)
+    print(f"💾 JSON 저장 완료: {json_path}")
+    return json_path
+
+
 def main():
     """메인 실행 함수"""
+    # 인자 파싱
+    parser = argparse.ArgumentParser(description='등락률 상위 이미지 자동 생성')
+    parser.add_argument('--profile-memory', action='store_true', help='단계별/페이지별 메모리 프로파일 출력')
+    parser.add_argument('--metrics-file', type=str, help='Prometheus 지표 파일 경로 (textfile collector)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    parser.add_argument('--deadline', type=float, help='전체 제한 시간 (초). 초과 시 완료된 페이지만 저장')
+    parser.add_argument('--deadline-split', type=parse_shares, help='단계별 시간 배분 (예: fetch=0.4,group=0.1,render=0.5)')
+    parser.add_argument('--export-json', type=str, help='이미지 대신 데이터를 JSON 파일로 저장')
+    parser.add_argument('--profile-startup', action='store_true', help='시작 시 임포트 시간 상세 출력')
+    parser.add_argument('--tail-rows', type=int, help='헤더 + 마지막 N행만 조회 (전체 기록을 받지 않음)')
+    parser.add_argument('--cache-dir', type=str, help='시트 값 로컬 캐시 폴더 (시트가 수정되지 않았으면 다시 받지 않음)')
+    parser.add_argument('--mirror', type=str, help='구글 시트 대신 로컬 SQLite 미러에서 읽기 (main_sync.py 로 생성)')
+    parser.add_argument('--source', type=str, help='구글 시트 대신 로컬 CSV/XLSX 파일(또는 워크시트 이름별 파일 폴더)에서 읽기')
+    parser.add_argument('--record', type=str, help='API 응답을 카세트 폴더에 녹화')
+    parser.add_argument('--replay', type=str, help='카세트 폴더의 녹화된 응답으로 실행 (네트워크 없음)')
+    parser.add_argument('--days', type=positive_int, help='A열 기준 최근 N거래일 행만 사용 (1 = 최신 날짜)')
+    parser.add_argument('--top', type=positive_int, help='상위 K개 종목만 이미지에 표시')
+    parser.add_argument('--top-by', choices=['change', 'volume'], default='change',
+                        help='상위 K개 기준: change (등락률, 기본) / volume (거래대금)')
+    parser.add_argument('--replay-latency', type=str, help="재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)")
+    args = parser.parse_args()
+    
+    # 카세트 녹화/재생 (--record / --replay 일 때만)
+    cassette = use_cassette(args.record, args.replay, args.replay_latency)
+    
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        profile_startup('main_ranking', BASE_DIR)
+        return
+    
+    # 실행 지표 (종료 시 설정된 대상으로 내보냄)
+    metrics = PipelineMetrics('등락률상위')
+    output_files = None
+    try:
+        output_files = run(args, metrics)
+        return output_files
+    finally:
+        if cassette is not None:
+            cassette.report()
+        metrics.record_requests(get_governor().stats())
+        metrics.finish(success=bool(output_files))
+        metrics.export(args.metrics_file, args.metrics_push)
+
+
+def run(args, metrics: PipelineMetrics):
+    """데이터 조회 → 그룹화 → 이미지 생성"""
     print("=" * 50)
     print("🚀 등락률 상위 자동화 시작")
     print("=" * 50)
@@ -38,26 +124,46 @@ def main():
     # 출력 폴더 생성
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
+    # 메모리 프로파일러 (--profile-memory 일 때만 측정)
+    profiler = MemoryProfiler(enabled=args.profile_memory)
+    profiler.start()
+    
+    # 마감 시간 (--deadline 일 때만 적용)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+    
     # 데이터 가져오기
     print("\n📡 구글 시트 시트2에서 데이터 가져오는 중...")
     try:
-        reader = SheetReaderRanking(CREDENTIALS_PATH, SPREADSHEET_ID)
-        reader.connect()
+        reader = SheetReaderRanking(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining(),
+                                    tail_rows=args.tail_rows, cache_dir=args.cache_dir, mirror_path=args.mirror,
+                                    source_path=args.source)
+        with metrics.stage('connect'):
+            deadline.call('fetch', reader.connect)
         
-        # 시트2의 모든 데이터 가져오기
-        stocks = reader.get_ranking_data()
+        # 시트2 데이터 가져오기 (--days / --top 지정 시 기간·상위 종목만)
+        with profiler.stage('fetch'), metrics.stage('fetch'):
+            stocks = deadline.call('fetch', reader.get_ranking_data,
+                                   days=args.days, top_k=args.top, top_by=args.top_by)
+        metrics.record_rows(reader.rows_fetched)
         
         if not stocks:
             print(f"⚠️ 시트2에 데이터가 없습니다!")
             return
         
         # 재료별 그룹화
-        groups = reader.group_by_material(stocks)
+        with profiler.stage('group'), metrics.stage('group'):
+            groups = deadline.call('group', reader.group_by_material, stocks)
         
         if not groups:
             print(f"⚠️ 그룹화할 데이터가 없습니다!")
             return
             
+    except StageTimeout as e:
+        # 마감 시간 초과: 더 진행하지 않고 중단
+        print(f"⏰ {e}")
+        metrics.set('deadline_exceeded', 1, stage=e.stage)
+        deadline.report()
+        return
     except FileNotFoundError:
         print(f"❌ 서비스 계정 파일을 찾을 수 없습니다: {CREDENTIALS_PATH}")
         print("   service_account.json.json 파일을 프로젝트 폴더에 추가해주세요.")
@@ -68,17 +174,27 @@ def main():
     
     print(f"\n📦 총 {len(groups)}개의 재료 그룹")
     print(f"📦 총 {sum(len(g.stocks) for g in groups)}개의 종목")
+    metrics.set('groups_produced', len(groups))
+    metrics.set('cards_produced', sum(len(g.stocks) for g in groups))
+    
+    # JSON 내보내기 모드 (이미지 생성 생략)
+    if args.export_json:
+        return [export_json(groups, args.export_json)]
     
     # 이미지 생성 (HTML 기반)
     print("\n🎨 이미지 생성 중 (HTML → 스크린샷)...")
-    renderer = HtmlRendererRanking(BASE_DIR)
+    renderer = HtmlRendererRanking(BASE_DIR, profiler=profiler, deadline=deadline)
     
     # 출력 파일명 (오늘 날짜 사용)
     today = datetime.now().strftime("%Y%m%d")
     output_path = os.path.join(OUTPUT_DIR, f"등락률상위_{today}")
     
     # 생성 실행
-    output_files = renderer.generate(groups, output_path)
+    with metrics.stage('render'):
+        output_files = renderer.generate(groups, output_path)
+    metrics.record_outputs(output_files)
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
     
     # 완료 메시지
     print("\n" + "=" * 50)
@@ -88,6 +204,9 @@ def main():
         print(f"   📁 {f}")
     print("\n")
     
+    profiler.report()
+    deadline.report()
+    
     return output_files
 
 
@@ -0,0 +1,90 @@
+"""
+구글 시트 → 로컬 SQLite 미러 동기화 - 메인 스크립트
+============================================
+
+사용법:
+    python main_sync.py                     # 시트1/2/3 새 행만 미러에 추가
+    python main_sync.py --full              # 미러를 지우고 전체 다시 받기
+    python main_sync.py --db D:/data/mirror.db   # 미러 DB 경로 지정
+    python main_sync.py --metrics-file ./metrics/  # Prometheus 지표 기록
+
+미러 사용 (오프라인 재실행):
+    python main.py --mirror sheet_mirror.db --date 2025.12.03
+    python main_theme.py --mirror sheet_mirror.db --date 2025.12.03
+    python main_ranking.py --mirror sheet_mirror.db
+"""
+
+import os
+import argparse
+
+from metrics import PipelineMetrics
+from request_governor import get_governor
+from sheet_reader import SheetReader
+from sheet_reader_ranking import SheetReaderRanking
+from sheet_reader_theme import SheetReaderTheme
+from spreadsheet_loader import SpreadsheetLoader
+
+
+# ===== 설정 =====
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CREDENTIALS_PATH = os.path.join(BASE_DIR, "service_account.json.json")
+SPREADSHEET_ID = "1dX8Diej7AQixm7fBrnrdUybxW2Au9QzyATYRBKZN_jk"
+MIRROR_PATH = os.path.join(BASE_DIR, "sheet_mirror.db")
+
+# 동기화할 워크시트 (리더와 같은 번호/이름 사용)
+READERS = [SheetReader, SheetReaderRanking, SheetReaderTheme]
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='구글 시트 로컬 SQLite 미러 동기화')
+    parser.add_argument('--db', type=str, default=MIRROR_PATH, help='미러 DB 파일 경로')
+    parser.add_argument('--full', action='store_true', help='기존 미러를 지우고 전체 다시 받기')
+    parser.add_argument('--metrics-file', type=str, help='Prometheus 지표 파일 경로 (textfile collector)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    args = parser.parse_args()
+
+    metrics = PipelineMetrics('동기화')
+    synced = False
+    try:
+        synced = run(args, metrics)
+        return synced
+    finally:
+        metrics.record_requests(get_governor().stats())
+        metrics.finish(success=bool(synced))
+        metrics.export(args.metrics_file, args.metrics_push)
+
+
+def run(args, metrics: PipelineMetrics) -> bool:
+    """워크시트별 새 행을 미러에 추가"""
+    from sheet_mirror import SheetMirror
+
+    print("=" * 50)
+    print("🔄 구글 시트 미러 동기화 시작")
+    print("=" * 50)
+
+    mirror = SheetMirror(args.db)
+    try:
+        loader = SpreadsheetLoader(CREDENTIALS_PATH, SPREADSHEET_ID)
+        with metrics.stage('connect'):
+            loader.connect()
+
+        with metrics.stage('fetch'):
+            for reader_class in READERS:
+                added = mirror.sync(loader.sheet, reader_class.WORKSHEET_INDEX, full=args.full)
+                metrics.set('rows_fetched', added, worksheet=reader_class.WORKSHEET_LABEL)
+    except FileNotFoundError:
+        print(f"❌ 서비스 계정 파일을 찾을 수 없습니다: {CREDENTIALS_PATH}")
+        return False
+    except Exception as e:
+        print(f"❌ 동기화 실패: {e}")
+        return False
+    finally:
+        mirror.close()
+
+    print(f"\n✅ 동기화 완료: {args.db}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,21 @@
     python main_theme.py                    # 시트3 최신 날짜 데이터로 이미지 생성
     python main_theme.py --date 2025.12.03  # 특정 날짜 지정
     python main_theme.py --test             # 테스트 데이터로 실행
+    python main_theme.py --profile-memory   # 단계별/페이지별 메모리 프로파일 출력
+    python main_theme.py --metrics-push http://localhost:9091  # Prometheus 지표 전송
+    python main_theme.py --deadline 120     # 전체 2분 제한 (초과 시 완료된 페이지만 저장)
+    python main_theme.py --list-dates       # 시트3에 있는 날짜 목록 출력
+    python main_theme.py --test --export-json cards.json  # 이미지 대신 카드 JSON 저장
+    python main_theme.py --profile-startup  # 시작 시 임포트 시간 상세 출력
+    python main_theme.py --date-search      # 대상 날짜 행만 조회 (A열 검색)
+    python main_theme.py --tail-rows 300    # 마지막 300행만 조회
+    python main_theme.py --cache-dir .cache # 시트 수정이 없으면 로컬 캐시 사용
+    python main_theme.py --mirror sheet_mirror.db --date 2025.12.03  # 로컬 미러에서 읽기 (오프라인)
+    python main_theme.py --source exports/                           # 구글 시트 대신 로컬 CSV/XLSX 파일에서 읽기
+    python main_theme.py --record cassettes/run1  # API 응답을 카세트에 녹화
+    python main_theme.py --replay cassettes/run1 --replay-latency recorded  # 녹화된 응답으로 오프라인 실행
+    python main_theme.py --from 2025.12.01 --to 2025.12.05  # 날짜 구간 일괄 생성 (이미 생성된 날짜는 건너뜀)
+    python main_theme.py --watch --interval 15 --debounce 5  # 장중 감시: 시트3 수정 시 바뀐 페이지만 다시 생성
 
 구글 시트 구조 (시트3):
     A열: 날짜
@@ -19,11 +34,20 @@
 
 import os
 import sys
+import json
 import argparse
 from datetime import datetime
 
 from sheet_reader_theme import SheetReaderTheme, CardData, StockItem
+from normalize import format_rate
 from html_renderer_theme import HtmlRendererTheme
+from mem_profile import MemoryProfiler
+from metrics import PipelineMetrics
+from backfill import parse_range, run_backfill
+from sheet_watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, DEFAULT_MARKET_HOURS, SheetWatcher, parse_market_hours
+from cassette import use_cassette
+from request_governor import get_governor, is_throttled
+from deadline import RunDeadline, StageTimeout, parse_shares
 
 
 # ===== 설정 =====
@@ -34,18 +58,18 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 
 
 def create_test_data():
-    """테스트용 더미 데이터 생성"""
+    """테스트용 더미 데이터 생성 (등락률은 시트 데이터와 같은 형식으로 정규화)"""
     return [
         CardData(
             card_type='theme',
             group_name='건설',
             main_issue='정부 주택공급 정책 기대에 침체됐던 건설주 상승세 "꿈틀"',
             stocks=[
-                StockItem('한신공영', '30%', '543억'),
-                StockItem('동신건설', '29.31%', '321억'),
-                StockItem('일성건설', '11.12%', '189억'),
-                StockItem('KD', '18.67%', '234억'),
-                StockItem('대우건설', '11.12%', '876억'),
+                StockItem('한신공영', format_rate('30%'), '543억'),
+                StockItem('동신건설', format_rate('29.31%'), '321억'),
+                StockItem('일성건설', format_rate('11.12%'), '189억'),
+                StockItem('KD', format_rate('18.67%'), '234억'),
+                StockItem('대우건설', format_rate('11.12%'), '876억'),
             ]
         ),
         CardData(
@@ -53,11 +77,11 @@ def create_test_data():
             group_name='고속터미널',
             main_issue='"고속터미널 재개발" 기대감에 "이 회사들" 또또 상한가',
             stocks=[
-                StockItem('천일고속', '29.97%', '456억'),
-                StockItem('대성산업', '29.93%', '389억'),
-                StockItem('동양고속', '29.87%', '210억'),
-                StockItem('신영와코루', '6.89%', '98억'),
-                StockItem('신세계', '4.19%', '1,234억'),
+                StockItem('천일고속', format_rate('29.97%'), '456억'),
+                StockItem('대성산업', format_rate('29.93%'), '389억'),
+                StockItem('동양고속', format_rate('29.87%'), '210억'),
+                StockItem('신영와코루', format_rate('6.89%'), '98억'),
+                StockItem('신세계', format_rate('4.19%'), '1,234억'),
             ]
         ),
         CardData(
@@ -65,11 +89,11 @@ def create_test_data():
             group_name='로봇',
             main_issue='K-피지컬 AI, 3대 틈새 "로봇·센서·소프트웨어"',
             stocks=[
-                StockItem('링크솔루션', '29.92%', '678억'),
-                StockItem('스맥', '21.2%', '456억'),
-                StockItem('케이쓰리아이', '17.28%', '1,345억'),
-                StockItem('피앤에스로보틱스', '8.26%', '210억'),
-                StockItem('로보스타', '7.73%', '189억'),
+                StockItem('링크솔루션', format_rate('29.92%'), '678억'),
+                StockItem('스맥', format_rate('21.2%'), '456억'),
+                StockItem('케이쓰리아이', format_rate('17.28%'), '1,345억'),
+                StockItem('피앤에스로보틱스', format_rate('8.26%'), '210억'),
+                StockItem('로보스타', format_rate('7.73%'), '189억'),
             ]
         ),
         CardData(
@@ -77,11 +101,11 @@ def create_test_data():
             group_name='바이오',
             main_issue='바이오주 사들이는 큰손들… 기술이전 기대감 솔솔',
             stocks=[
-                StockItem('삼성에피스홀딩스', '24.21%', '1,789억'),
-                StockItem('엘앤케이바이오', '17.29%', '321억'),
-                StockItem('지놈앤컴퍼니', '17.29%', '245억'),
-                StockItem('와이투솔루션', '14.89%', '167억'),
-                StockItem('인벤티지랩', '11.06%', '123억'),
+                StockItem('삼성에피스홀딩스', format_rate('24.21%'), '1,789억'),
+                StockItem('엘앤케이바이오', format_rate('17.29%'), '321억'),
+                StockItem('지놈앤컴퍼니', format_rate('17.29%'), '245억'),
+                StockItem('와이투솔루션', format_rate('14.89%'), '167억'),
+                StockItem('인벤티지랩', format_rate('11.06%'), '123억'),
             ]
         ),
         CardData(
@@ -89,11 +113,11 @@ def create_test_data():
             group_name='원전',
             main_issue='美 "한일 대미투자 원전부터" 발언에… 원전주, 동반 강세',
             stocks=[
-                StockItem('우양에이치씨', '14.89%', '345억'),
-                StockItem('일진파워', '9.27%', '567억'),
-                StockItem('우진', '8.84%', '234억'),
-                StockItem('태웅', '7.51%', '456억'),
-                StockItem('현대건설', '6.98%', '1,567억'),
+                StockItem('우양에이치씨', format_rate('14.89%'), '345억'),
+                StockItem('일진파워', format_rate('9.27%'), '567억'),
+                StockItem('우진', format_rate('8.84%'), '234억'),
+                StockItem('태웅', format_rate('7.51%'), '456억'),
+                StockItem('현대건설', format_rate('6.98%'), '1,567억'),
             ]
         ),
         CardData(
@@ -101,11 +125,11 @@ def create_test_data():
             group_name='방산',
             main_issue='KAI, 이집트 방산전시회 참가… 아프리카·중동 시장 정조준',
             stocks=[
-                StockItem('SNT모티브', '11.3%', '456억'),
-                StockItem('센서뷰', '9.64%', '123억'),
-                StockItem('파이버프로', '5.87%', '89억'),
-                StockItem('한화에어로스페이스', '5.1%', '2,345억'),
-                StockItem('우리기술', '4.97%', '67억'),
+                StockItem('SNT모티브', format_rate('11.3%'), '456억'),
+                StockItem('센서뷰', format_rate('9.64%'), '123억'),
+                StockItem('파이버프로', format_rate('5.87%'), '89억'),
+                StockItem('한화에어로스페이스', format_rate('5.1%'), '2,345억'),
+                StockItem('우리기술', format_rate('4.97%'), '67억'),
             ]
         ),
         CardData(
@@ -113,35 +137,218 @@ def create_test_data():
             group_name='기타',
             main_issue='기타 이슈 종목 모음',
             stocks=[
-                StockItem('A종목', '5.2%', '120억'),
-                StockItem('B종목', '-3.1%', '80억'),
-                StockItem('C종목', '-7.5%', '1,200억'),
+                StockItem('A종목', format_rate('5.2%'), '120억'),
+                StockItem('B종목', format_rate('-3.1%'), '80억'),
+                StockItem('C종목', format_rate('-7.5%'), '1,200억'),
             ]
         ),
         CardData(
             card_type='individual',
             group_name='개별이슈',
             stocks=[
-                StockItem('코칩', '29.98%', '890억', '美 엔비디아에 블랙웰 "슈퍼커패시터" 공급... AI 서버 밸류체인 편입'),
-                StockItem('뉴인텍', '29.85%', '1,567억', '"전기차株" 뉴인텍, 보조금 확대 소식에 ↑'),
+                StockItem('코칩', format_rate('29.98%'), '890억', '美 엔비디아에 블랙웰 "슈퍼커패시터" 공급... AI 서버 밸류체인 편입'),
+                StockItem('뉴인텍', format_rate('29.85%'), '1,567억', '"전기차株" 뉴인텍, 보조금 확대 소식에 ↑'),
             ]
         ),
     ]
 
 
+def list_dates(mirror_path: str = None, source_path: str = None):
+    """시트3에 있는 날짜 목록 출력"""
+    # A열만 읽으면 되므로 범위 조회 모드 사용
+    reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID, date_search=True, mirror_path=mirror_path,
+                              source_path=source_path)
+    reader.connect()
+    for date in reader.get_available_dates():
+        print(date)
+
+
+def export_json(cards, target_date: str, json_path: str) -> str:
+    """카드 데이터를 렌더러와 같은 형식의 JSON으로 저장"""
+    renderer = HtmlRendererTheme(BASE_DIR)
+    payload = {
+        'date': target_date,
+        'cards': [renderer._card_to_dict(c) for c in cards]
+    }
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"💾 JSON 저장 완료: {json_path}")
+    return json_path
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='장중 강세테마 동향 이미지 자동 생성')
     parser.add_argument('--date', type=str, help='조회할 날짜 (예: 2025.12.03)')
+    parser.add_argument('--from', dest='date_from', type=str, help='구간 일괄 생성 시작 날짜 (없으면 시트의 첫 날짜부터)')
+    parser.add_argument('--to', dest='date_to', type=str, help='구간 일괄 생성 끝 날짜 (없으면 시트의 최신 날짜까지)')
+    parser.add_argument('--watch', action='store_true', help='장중 감시 모드 (시트3이 수정되면 바뀐 페이지만 다시 생성)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help=f'--watch 수정 확인 주기 (초, 기본 {DEFAULT_INTERVAL:.0f})')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE, help=f'--watch 편집이 멈춘 뒤 기다릴 시간 (초, 기본 {DEFAULT_DEBOUNCE:.0f})')
+    parser.add_argument('--market-hours', type=str, default=DEFAULT_MARKET_HOURS, help=f'--watch 감시 시간 (한국 시간, 기본 {DEFAULT_MARKET_HOURS})')
     parser.add_argument('--test', action='store_true', help='테스트 데이터로 실행')
+    parser.add_argument('--profile-memory', action='store_true', help='단계별/페이지별 메모리 프로파일 출력')
+    parser.add_argument('--metrics-file', type=str, help='Prometheus 지표 파일 경로 (textfile collector)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    parser.add_argument('--deadline', type=float, help='전체 제한 시간 (초). 초과 시 완료된 페이지만 저장')
+    parser.add_argument('--deadline-split', type=parse_shares, help='단계별 시간 배분 (예: fetch=0.4,group=0.1,render=0.5)')
+    parser.add_argument('--list-dates', action='store_true', help='시트3에 있는 날짜 목록만 출력')
+    parser.add_argument('--export-json', type=str, help='이미지 대신 카드 데이터를 JSON 파일로 저장')
+    parser.add_argument('--profile-startup', action='store_true', help='시작 시 임포트 시간 상세 출력')
+    parser.add_argument('--tail-rows', type=int, help='헤더 + 마지막 N행만 조회 (전체 기록을 받지 않음)')
+    parser.add_argument('--cache-dir', type=str, help='시트 값 로컬 캐시 폴더 (시트가 수정되지 않았으면 다시 받지 않음)')
+    parser.add_argument('--mirror', type=str, help='구글 시트 대신 로컬 SQLite 미러에서 읽기 (main_sync.py 로 생성)')
+    parser.add_argument('--source', type=str, help='구글 시트 대신 로컬 CSV/XLSX 파일(또는 워크시트 이름별 파일 폴더)에서 읽기')
+    parser.add_argument('--date-search', action='store_true', help='A열에서 대상 날짜 구간을 찾아 그 행들만 조회')
+    parser.add_argument('--record', type=str, help='API 응답을 카세트 폴더에 녹화')
+    parser.add_argument('--replay', type=str, help='카세트 폴더의 녹화된 응답으로 실행 (네트워크 없음)')
+    parser.add_argument('--replay-latency', type=str, help="재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)")
     args = parser.parse_args()
 
+    # 카세트 녹화/재생 (--record / --replay 일 때만)
+    cassette = use_cassette(args.record, args.replay, args.replay_latency)
+
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        profile_startup('main_theme', BASE_DIR)
+        return
+
+    if args.list_dates:
+        list_dates(args.mirror, args.source)
+        return
+
+    metrics = PipelineMetrics('강세테마')
+    output_files = None
+    try:
+        if args.watch:
+            output_files = run_watch(args, metrics)
+        elif args.date_from or args.date_to:
+            output_files = run_range(args, metrics)
+        else:
+            output_files = run(args, metrics)
+        return output_files
+    finally:
+        if cassette is not None:
+            cassette.report()
+        metrics.record_requests(get_governor().stats())
+        metrics.finish(success=bool(output_files))
+        metrics.export(args.metrics_file, args.metrics_push)
+
+
+def run_watch(args, metrics: PipelineMetrics):
+    """--watch 장중 감시 (수정 시각 폴링 → 바뀐 날짜/페이지만 다시 생성, 브라우저 유지)"""
+    print("=" * 50)
+    print("👀 강세테마 장중 감시 시작")
+    print("=" * 50)
+
+    try:
+        market_hours = parse_market_hours(args.market_hours)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # 매 주기 새 값을 받아야 하므로 로컬 캐시(실행당 수정 시각 1회 확인)/미러는 사용하지 않음
+    reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID, tail_rows=args.tail_rows,
+                              source_path=args.source)
+    renderer = HtmlRendererTheme(BASE_DIR)
+    watcher = SheetWatcher(reader, renderer, os.path.join(OUTPUT_DIR, '강세테마'),
+                           interval=args.interval, debounce=args.debounce, market_hours=market_hours)
+    print(f"⏱️ 확인 주기 {args.interval:.0f}초, 디바운스 {args.debounce:.0f}초, 감시 시간 {args.market_hours}")
+
+    try:
+        with metrics.stage('watch'):
+            watcher.run()
+    except KeyboardInterrupt:
+        print("\n👋 감시를 중단합니다")
+    except Exception as e:
+        if is_throttled(e):
+            print(f"❌ 구글 시트 요청 한도 초과 (재시도 후 실패): {e}")
+        else:
+            print(f"❌ 감시 실패: {e}")
+    metrics.record_rows(reader.rows_fetched)
+    metrics.record_outputs(watcher.output_files)
+    metrics.set('watch_cycles', watcher.cycles)
+
+    print("\n" + "=" * 50)
+    print(f"✅ 감시 종료: 변경 {watcher.cycles}회, {len(watcher.output_files)}개 이미지 생성")
+    print("=" * 50)
+    for f in watcher.output_files:
+        print(f"   📁 {f}")
+    print("\n")
+
+    return watcher.output_files
+
+
+def run_range(args, metrics: PipelineMetrics):
+    """--from / --to 날짜 구간 일괄 생성 (시트 1회 조회 + 브라우저 1회 실행, 생성된 날짜는 건너뜀)"""
+    print("=" * 50)
+    print("🚀 강세테마 구간 일괄 생성 시작")
+    print("=" * 50)
+
+    try:
+        start, end = parse_range(args.date_from, args.date_to)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+
+    # 날짜마다 다시 조회하지 않도록 범위 조회(--date-search) 없이 전체 스냅샷 1회
+    reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining(),
+                              tail_rows=args.tail_rows, cache_dir=args.cache_dir,
+                              mirror_path=args.mirror, source_path=args.source)
+    renderer = HtmlRendererTheme(BASE_DIR, deadline=deadline)
+
+    print("\n📡 구글 시트 시트3에서 데이터 가져오는 중 (브라우저 실행과 동시에)...")
+    try:
+        with metrics.stage('backfill'):
+            rendered, skipped = run_backfill(reader, renderer, start, end, os.path.join(OUTPUT_DIR, '강세테마'))
+    except Exception as e:
+        if is_throttled(e):
+            print(f"❌ 구글 시트 요청 한도 초과 (재시도 후 실패): {e}")
+        else:
+            print(f"❌ 구간 생성 실패: {e}")
+        return None
+    metrics.record_rows(reader.rows_fetched)
+
+    # 건너뛴 날짜의 기존 이미지는 이번 실행의 렌더링 결과에서 제외
+    output_files = [f for files in rendered.values() for f in files]
+    metrics.record_outputs(output_files)
+    metrics.set('backfill_dates', len(rendered), status='rendered')
+    metrics.set('backfill_dates', len(skipped), status='skipped')
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
+
+    print("\n" + "=" * 50)
+    print(f"✅ 구간 생성 완료: {len(rendered)}일, {len(output_files)}개 이미지 생성"
+          + (f" / 이미 생성된 {len(skipped)}일 건너뜀" if skipped else ""))
+    print("=" * 50)
+    for label, files in rendered.items():
+        print(f"   📅 {label}: {len(files)}페이지")
+    print("\n")
+
+    deadline.report()
+
+    return output_files
+
+
+def run(args, metrics: PipelineMetrics):
+    """데이터 조회 → 그룹화 → 이미지 생성"""
     print("=" * 50)
     print("🚀 장중 강세테마 동향 자동화 시작")
     print("=" * 50)
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+    profiler = MemoryProfiler(enabled=args.profile_memory)
+    profiler.start()
+
+    # 마감 시간 (--deadline 일 때만 적용)
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+
     if args.test:
         print("\n🧪 테스트 모드: 더미 데이터 사용")
         cards = create_test_data()
@@ -149,14 +356,20 @@ def main():
     else:
         print("\n📡 구글 시트 시트3에서 데이터 가져오는 중...")
         try:
-            reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID)
-            reader.connect()
+            reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining(),
+                                    tail_rows=args.tail_rows, date_search=args.date_search,
+                                    cache_dir=args.cache_dir, mirror_path=args.mirror,
+                                    source_path=args.source)
+            with metrics.stage('connect'):
+                deadline.call('fetch', reader.connect)
 
             target_date = args.date if args.date else None
-            raw_data = reader.get_today_data(target_date)
+            with profiler.stage('fetch'), metrics.stage('fetch'):
+                raw_data = deadline.call('fetch', reader.get_today_data, target_date)
 
-            if target_date is None:
-                target_date = reader.get_latest_date()
+                if target_date is None:
+                    target_date = deadline.call('fetch', reader.get_latest_date)
+            metrics.record_rows(reader.rows_fetched)
 
             print(f"📅 대상 날짜: {target_date}")
 
@@ -166,23 +379,44 @@ def main():
                 cards = create_test_data()
                 target_date = "2025.12.03"
             else:
-                cards = reader.group_data(raw_data)
+                with profiler.stage('group'), metrics.stage('group'):
+                    cards = deadline.call('group', reader.group_data, raw_data)
 
+        except StageTimeout as e:
+            # 마감 시간 초과: 더미 데이터로 대체하지 않고 중단
+            print(f"⏰ {e}")
+            metrics.set('deadline_exceeded', 1, stage=e.stage)
+            deadline.report()
+            return None
         except Exception as e:
+            if is_throttled(e):
+                # 재시도 후에도 요청 한도 초과: 더미 데이터로 대체하지 않고 중단
+                print(f"❌ 구글 시트 요청 한도 초과 (재시도 후 실패): {e}")
+                return None
             print(f"❌ 구글 시트 연결 실패: {e}")
             print("   테스트 모드로 전환합니다...")
             cards = create_test_data()
             target_date = "2025.12.03"
 
     print(f"\n📦 총 {len(cards)}개의 카드 생성 예정")
+    metrics.set('cards_produced', len(cards))
+    metrics.set('groups_produced', len({c.group_name for c in cards}))
+
+    # JSON 내보내기 모드 (이미지 생성 생략)
+    if args.export_json:
+        return [export_json(cards, target_date, args.export_json)]
 
     print("\n🎨 이미지 생성 중 (HTML → 스크린샷)...")
-    renderer = HtmlRendererTheme(BASE_DIR)
+    renderer = HtmlRendererTheme(BASE_DIR, profiler=profiler, deadline=deadline)
 
     date_short = target_date.replace(".", "")
     output_path = os.path.join(OUTPUT_DIR, f"강세테마_{date_short}")
 
-    output_files = renderer.generate(cards, target_date, output_path)
+    with metrics.stage('render'):
+        output_files = renderer.generate(cards, target_date, output_path)
+    metrics.record_outputs(output_files)
+    if deadline.blown_stage:
+        metrics.set('deadline_exceeded', 1, stage=deadline.blown_stage)
 
     print("\n" + "=" * 50)
     print("✅ 이미지 생성 완료!")
@@ -191,6 +425,9 @@ def main():
         print(f"   📁 {f}")
     print("\n")
 
+    profiler.report()
+    deadline.report()
+
     return output_files
 
 
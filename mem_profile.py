@@ -0,0 +1,289 @@
+"""
+메모리 프로파일링 모듈
+- tracemalloc으로 단계별(읽기/그룹화 등) 파이썬 메모리 할당 기록
+- 페이지 렌더링 중 Chromium 브라우저/렌더러 프로세스 RSS 샘플링
+- 단계별/페이지별 최대 메모리 리포트
+
+psutil이 설치되어 있으면 사용하고, 없으면 리눅스의 /proc 에서 직접 읽음
+(둘 다 불가능한 환경에서는 Chromium 샘플링만 생략)
+"""
+
+import os
+import tracemalloc
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+SAMPLE_INTERVAL = 0.1  # Chromium RSS 샘플링 간격 (초)
+TOP_ALLOCATIONS = 5    # 단계별로 기록할 상위 할당 위치 수
+
+# 프로파일러 자체의 할당은 리포트에서 제외
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclass
+class StageMemory:
+    """단계별 파이썬 메모리 기록"""
+    name: str
+    peak_bytes: int = 0          # 단계 중 tracemalloc 최대치
+    delta_bytes: int = 0         # 단계 전후 차이
+    top_allocations: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PageMemory:
+    """페이지별 Chromium 메모리 기록"""
+    label: str
+    peak_total_rss: int = 0      # Chromium 전체 프로세스 RSS 합계 최대치
+    peak_browser_rss: int = 0    # 브라우저 프로세스 RSS 최대치
+    peak_renderer_rss: int = 0   # 렌더러 프로세스 중 RSS 최대치
+    process_count: int = 0       # 관측된 최대 Chromium 프로세스 수
+    samples: int = 0
+
+
+def _format_bytes(num: int) -> str:
+    """바이트를 MB 단위 문자열로 변환"""
+    return f"{num / (1024 * 1024):.1f}MB"
+
+
+def _is_chromium(name: str, cmdline: str) -> bool:
+    """Chromium 계열 프로세스인지 확인"""
+    text = f"{name} {cmdline}".lower()
+    return 'chrom' in text or 'headless_shell' in text
+
+
+def _process_role(cmdline: str) -> str:
+    """Chromium 프로세스 역할 (--type= 인자가 없으면 브라우저 본체)"""
+    for arg in cmdline.split():
+        if arg.startswith('--type='):
+            return arg.split('=', 1)[1]
+    return 'browser'
+
+
+def _chromium_processes_psutil() -> List[Tuple[str, int]]:
+    """psutil로 현재 프로세스 하위의 Chromium 프로세스 (역할, RSS) 목록"""
+    result = []
+    try:
+        children = psutil.Process(os.getpid()).children(recursive=True)
+    except psutil.Error:
+        return result
+    for child in children:
+        try:
+            cmdline = ' '.join(child.cmdline())
+            if _is_chromium(child.name(), cmdline):
+                result.append((_process_role(cmdline), child.memory_info().rss))
+        except psutil.Error:
+            continue
+    return result
+
+
+def _chromium_processes_proc() -> List[Tuple[str, int]]:
+    """/proc 에서 현재 프로세스 하위의 Chromium 프로세스 (역할, RSS) 목록"""
+    parents: Dict[int, int] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            # 프로세스 이름에 공백이 있을 수 있으므로 마지막 ')' 기준으로 분리
+            ppid = int(stat.rsplit(')', 1)[1].split()[1])
+            parents[int(entry)] = ppid
+        except (OSError, IndexError, ValueError):
+            continue
+
+    # 현재 프로세스의 자손만 추림
+    root = os.getpid()
+    descendants = set()
+    for pid in parents:
+        current = pid
+        while current in parents and current not in (0, 1):
+            current = parents[current]
+            if current == root:
+                descendants.add(pid)
+                break
+
+    result = []
+    for pid in descendants:
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ').decode('utf-8', 'replace')
+            with open(f'/proc/{pid}/comm', 'r') as f:
+                name = f.read().strip()
+            if not _is_chromium(name, cmdline):
+                continue
+            rss = 0
+            with open(f'/proc/{pid}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        rss = int(line.split()[1]) * 1024
+                        break
+            result.append((_process_role(cmdline), rss))
+        except (OSError, ValueError):
+            continue
+    return result
+
+
+def chromium_processes() -> List[Tuple[str, int]]:
+    """현재 프로세스가 띄운 Chromium 프로세스들의 (역할, RSS) 목록"""
+    if psutil is not None:
+        return _chromium_processes_psutil()
+    if os.path.isdir('/proc'):
+        return _chromium_processes_proc()
+    return []
+
+
+class MemoryProfiler:
+    """단계별 파이썬 할당 + 페이지별 Chromium RSS 프로파일러"""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Args:
+            enabled: False면 모든 측정이 아무 일도 하지 않음
+        """
+        self.enabled = enabled
+        self.stages: List[StageMemory] = []
+        self.pages: List[PageMemory] = []
+        self._started_tracemalloc = False
+        self._warned_no_sampler = False
+
+    def start(self):
+        """tracemalloc 추적 시작"""
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        """직접 시작한 tracemalloc 추적 종료"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        파이썬 메모리 할당 측정 구간
+
+        사용법:
+            with profiler.stage('fetch'):
+                raw_data = reader.get_today_data()
+        """
+        if not self.enabled:
+            yield
+            return
+
+        self.start()
+        before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        current_before, _ = tracemalloc.get_traced_memory()
+        # 3.9+ 에서는 단계별 최대치를 분리해서 측정
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            stats = after.compare_to(before, 'lineno')
+            record = StageMemory(
+                name=name,
+                peak_bytes=peak,
+                delta_bytes=current_after - current_before,
+                top_allocations=[str(s) for s in stats[:TOP_ALLOCATIONS]]
+            )
+            self.stages.append(record)
+            print(f"  🧠 [{name}] 파이썬 최대 {_format_bytes(record.peak_bytes)}"
+                  f" (증가 {_format_bytes(record.delta_bytes)})")
+
+    @asynccontextmanager
+    async def page(self, label: str):
+        """
+        페이지 렌더링 중 Chromium 프로세스 RSS를 주기적으로 샘플링
+
+        사용법:
+            async with profiler.page('page_1'):
+                await page.goto(...)
+        """
+        if not self.enabled:
+            yield
+            return
+
+        import asyncio
+
+        record = PageMemory(label=label)
+        task = asyncio.ensure_future(self._sample_loop(record))
+        try:
+            yield
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            # 마지막 상태도 한 번 더 기록
+            self._sample(record)
+            self.pages.append(record)
+            print(f"  🧠 [{label}] Chromium 최대 {_format_bytes(record.peak_total_rss)}"
+                  f" (프로세스 {record.process_count}개)")
+
+    async def _sample_loop(self, record: PageMemory):
+        """샘플링 루프 (페이지 구간 동안 실행)"""
+        import asyncio
+
+        while True:
+            self._sample(record)
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+    def _sample(self, record: PageMemory):
+        """Chromium 프로세스 RSS 1회 샘플링"""
+        processes = chromium_processes()
+        if not processes:
+            if psutil is None and not os.path.isdir('/proc') and not self._warned_no_sampler:
+                print("  ⚠️ psutil이 없어 Chromium 메모리를 측정할 수 없습니다 (pip install psutil)")
+                self._warned_no_sampler = True
+            return
+
+        total = sum(rss for _, rss in processes)
+        browser = max((rss for role, rss in processes if role == 'browser'), default=0)
+        renderer = max((rss for role, rss in processes if role == 'renderer'), default=0)
+
+        record.samples += 1
+        record.peak_total_rss = max(record.peak_total_rss, total)
+        record.peak_browser_rss = max(record.peak_browser_rss, browser)
+        record.peak_renderer_rss = max(record.peak_renderer_rss, renderer)
+        record.process_count = max(record.process_count, len(processes))
+
+    def report(self) -> Optional[str]:
+        """단계별/페이지별 최대 메모리 요약 출력"""
+        if not self.enabled:
+            return None
+
+        lines = ["", "🧠 메모리 프로파일 요약", "-" * 50]
+        if self.stages:
+            lines.append("[파이썬 단계별]")
+            for s in self.stages:
+                lines.append(f"  • {s.name}: 최대 {_format_bytes(s.peak_bytes)},"
+                             f" 증가 {_format_bytes(s.delta_bytes)}")
+                for alloc in s.top_allocations:
+                    lines.append(f"      {alloc}")
+        if self.pages:
+            lines.append("[Chromium 페이지별]")
+            for p in self.pages:
+                lines.append(f"  • {p.label}: 전체 {_format_bytes(p.peak_total_rss)},"
+                             f" 브라우저 {_format_bytes(p.peak_browser_rss)},"
+                             f" 렌더러 {_format_bytes(p.peak_renderer_rss)}"
+                             f" ({p.samples}회 샘플)")
+        lines.append("-" * 50)
+
+        text = "\n".join(lines)
+        print(text)
+        self.stop()
+        return text
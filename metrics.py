@@ -0,0 +1,192 @@
+"""
+파이프라인 실행 지표 모듈 (Prometheus 텍스트 포맷)
+- 워크시트별 읽은 행 수, 카드/그룹 수, 렌더링 페이지 수
+- 단계별 소요 시간, 저장된 바이트 수, 오류 수
+- 소스별 API 요청/재시도 수, 속도 제한 대기 시간
+- node_exporter textfile collector 경로에 파일로 기록하거나 Pushgateway로 전송
+
+모든 지표에는 report 라벨 (급등이슈/등락률상위/강세테마/답안지)이 붙음
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+METRIC_PREFIX = "issue_automation"
+PUSH_JOB = "issue_automation"
+PUSH_TIMEOUT = 10  # Pushgateway 전송 타임아웃 (초)
+
+# 지표 이름 → (타입, 설명)
+METRIC_HELP = {
+    'rows_fetched': ('gauge', '워크시트(테이블)에서 읽은 행 수'),
+    'cards_produced': ('gauge', '생성된 카드 수'),
+    'groups_produced': ('gauge', '생성된 그룹 수'),
+    'pages_rendered': ('gauge', '렌더링된 이미지 페이지 수'),
+    'bytes_written': ('gauge', '저장된 이미지 파일 크기 합계 (바이트)'),
+    'stage_duration_seconds': ('gauge', '단계별 소요 시간 (초)'),
+    'errors_total': ('counter', '단계별 오류 수'),
+    'http_requests_total': ('counter', '소스별 API 요청 수 (재시도 포함)'),
+    'http_retries_total': ('counter', '소스별 429/5xx 응답 재시도 수'),
+    'http_throttled_seconds_total': ('counter', '소스별 속도 제한/백오프로 대기한 시간 (초)'),
+    'deadline_exceeded': ('gauge', '마감 시간 예산을 초과한 단계 (1=초과)'),
+    'backfill_dates': ('gauge', '구간 생성에서 처리한 날짜 수 (status=rendered 생성 / skipped 이미 있어 건너뜀)'),
+    'watch_cycles': ('gauge', '감시 모드에서 변경을 감지해 다시 조회한 횟수'),
+    'run_duration_seconds': ('gauge', '전체 실행 시간 (초)'),
+    'run_success': ('gauge', '마지막 실행 성공 여부 (1=성공)'),
+    'last_run_timestamp_seconds': ('gauge', '마지막 실행 종료 시각 (유닉스 시간)'),
+}
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class PipelineMetrics:
+    """리포트 1회 실행의 지표 모음"""
+
+    def __init__(self, report: str):
+        """
+        Args:
+            report: 리포트 이름 (급등이슈, 등락률상위, 강세테마, 답안지)
+        """
+        self.report = report
+        self.started_at = time.time()
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def _key(self, name: str, labels: Dict[str, str]):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def set(self, name: str, value: float, **labels):
+        """게이지 값 설정"""
+        self._values[self._key(name, labels)] = float(value)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        key = self._key(name, labels)
+        self._values[key] = self._values.get(key, 0.0) + value
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        단계 소요 시간 측정 (예외 발생 시 errors_total 증가 후 다시 던짐)
+
+        사용법:
+            with metrics.stage('fetch'):
+                raw_data = reader.get_today_data()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.inc('errors_total', stage=name)
+            raise
+        finally:
+            self.set('stage_duration_seconds', time.perf_counter() - start, stage=name)
+
+    def record_rows(self, rows_fetched: Dict[str, int]):
+        """리더가 기록한 워크시트별 행 수 반영"""
+        for worksheet, count in rows_fetched.items():
+            self.set('rows_fetched', count, worksheet=worksheet)
+
+    def record_requests(self, request_stats: Dict[str, Dict[str, float]]):
+        """요청 조절기(RequestGovernor.stats())의 소스별 요청/재시도/대기 시간 반영"""
+        for source, stats in request_stats.items():
+            self.set('http_requests_total', stats.get('requests', 0), source=source)
+            self.set('http_retries_total', stats.get('retries', 0), source=source)
+            self.set('http_throttled_seconds_total', stats.get('throttled_seconds', 0.0), source=source)
+
+    def record_outputs(self, output_files: List[str]):
+        """렌더링된 페이지 수와 파일 크기 반영"""
+        existing = [f for f in output_files if os.path.exists(f)]
+        self.set('pages_rendered', len(existing))
+        self.set('bytes_written', sum(os.path.getsize(f) for f in existing))
+
+    def finish(self, success: bool):
+        """실행 종료 지표 기록"""
+        now = time.time()
+        self.set('run_duration_seconds', now - self.started_at)
+        self.set('run_success', 1 if success else 0)
+        self.set('last_run_timestamp_seconds', now)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 문자열 생성"""
+        by_name: Dict[str, List[Tuple[Tuple[Tuple[str, str], ...], float]]] = {}
+        for (name, labels), value in self._values.items():
+            by_name.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name in sorted(by_name):
+            metric_type, help_text = METRIC_HELP.get(name, ('gauge', name))
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for labels, value in sorted(by_name[name]):
+                all_labels = (('report', self.report),) + labels
+                label_str = ','.join(f'{k}="{_escape_label(v)}"' for k, v in all_labels)
+                lines.append(f"{full_name}{{{label_str}}} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> str:
+        """
+        textfile collector용 .prom 파일 기록 (임시 파일 → rename 으로 원자적 교체)
+
+        Args:
+            path: .prom 파일 경로 또는 디렉토리 (디렉토리면 리포트별 파일명 사용)
+        """
+        import tempfile
+
+        if os.path.isdir(path):
+            path = os.path.join(path, f"{METRIC_PREFIX}_{self.report}.prom")
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            # mkstemp 는 0600 으로 만들므로 node_exporter 등 다른 사용자가 읽을 수 있게 권한 조정
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return path
+
+    def push(self, url: str):
+        """
+        Pushgateway 호환 엔드포인트로 전송 (PUT /metrics/job/<job>/report/<report>)
+
+        Args:
+            url: Pushgateway 주소 (예: http://localhost:9091)
+        """
+        import urllib.parse
+        import urllib.request
+
+        target = (f"{url.rstrip('/')}/metrics/job/{PUSH_JOB}"
+                  f"/report/{urllib.parse.quote(self.report, safe='')}")
+        request = urllib.request.Request(
+            target,
+            data=self.render().encode('utf-8'),
+            method='PUT',
+            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+        )
+        with urllib.request.urlopen(request, timeout=PUSH_TIMEOUT) as response:
+            response.read()
+
+    def export(self, textfile_path: str = None, push_url: str = None):
+        """설정된 대상으로 지표 내보내기 (내보내기 실패는 실행 결과에 영향 없음)"""
+        if textfile_path:
+            try:
+                written = self.write_textfile(textfile_path)
+                print(f"📈 지표 기록 완료: {written}")
+            except OSError as e:
+                print(f"⚠️ 지표 파일 기록 실패: {e}")
+        if push_url:
+            try:
+                self.push(push_url)
+                print(f"📈 지표 전송 완료: {push_url}")
+            except OSError as e:
+                print(f"⚠️ 지표 전송 실패: {e}")
@@ -0,0 +1,140 @@
+"""
+값 정규화 모듈 (날짜 / 등락률 / 거래대금)
+- 정규식은 모듈 로드 시 한 번만 컴파일
+- 같은 문자열이 수백 행 반복되는 날짜/등락률 파싱은 lru_cache 로 메모이즈
+- 모든 리더가 같은 등락률/거래대금 표시 형식을 사용
+
+    format_rate(29.97)          → '29.97%'
+    format_rate('+5')           → '5.00%'
+    format_rate('상한가')        → '상한가'   (숫자가 아닌 셀은 원래 글자 그대로)
+    format_rate(29.97, False)   → '29.97'   (등락률상위: 템플릿에서 % 표시)
+    format_volume(38679.0)      → '38,679'
+    format_volume('1.2조')       → '1.2조'    (단위가 붙은 값은 그대로)
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+
+# 년도(2자리 또는 4자리).월.일 (예: 2025.12.04, 2025.12.4, 25.12.4, 2025-12-04)
+_FULL_DATE = re.compile(r'^(20)?(\d{2})[.\-/](\d{1,2})[.\-/](\d{1,2})$')
+# 월.일 (연도 없음)
+_SHORT_DATE = re.compile(r'^(\d{1,2})[.\-/](\d{1,2})$')
+# "29.97%", "+1,234", "38,679" 에서 숫자 부분
+_NUMBER = re.compile(r'[-+]?\d*\.?\d+')
+# 숫자만 있는 값 (쉼표/부호/소수점 허용)
+_PLAIN_NUMBER = re.compile(r'^[-+]?[\d,]*\.?\d+$')
+# 등락률 값 (부호/소수점/끝의 '%' 허용, 쉼표 없음)
+_RATE = re.compile(r'^[-+]?\d*\.?\d+\s*%?$')
+
+_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def split_date(text: str) -> Optional[Tuple[Optional[int], int, int]]:
+    """
+    날짜 문자열 → (연도, 월, 일)
+
+    Returns:
+        연도 없는 MM.DD 는 (None, 월, 일), 날짜 형식이 아니면 None
+        (월/일 범위는 검사하지 않음)
+    """
+    text = text.strip()
+    match = _FULL_DATE.match(text)
+    if match:
+        return 2000 + int(match.group(2)), int(match.group(3)), int(match.group(4))
+    match = _SHORT_DATE.match(text)
+    if match:
+        return None, int(match.group(1)), int(match.group(2))
+    return None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_number_text(text: str) -> Optional[float]:
+    match = _NUMBER.search(text.replace(',', ''))
+    return float(match.group()) if match else None
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """셀 값에서 숫자 추출 (숫자 셀은 그대로, 없으면 None)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return _parse_number_text(str(value))
+
+
+def format_rate(value: Union[float, str, None], percent: bool = True) -> str:
+    """
+    등락률 표시 문자열 (소수 둘째 자리, 양수 '+' 없음)
+
+    숫자로 읽히지 않는 셀('상한가', '1,234', 빈 칸 등)은 0 등으로 바꾸지 않고 원래 글자를 그대로 사용
+
+    Args:
+        value: 숫자 또는 셀 문자열
+        percent: True면 '%' 붙임
+    """
+    if not isinstance(value, (int, float)):
+        text = str(value if value is not None else '').strip()
+        if not _RATE.match(text):
+            return text
+        value = parse_number(text)
+    text = f"{value:.2f}"
+    return text + '%' if percent else text
+
+
+def format_volume(value: Union[float, str, None]) -> str:
+    """
+    거래대금 표시 문자열 (천 단위 쉼표, 소수점 버림)
+
+    문자열에 단위(억/조 등)가 붙어 있으면 앞뒤 공백만 정리해서 그대로 사용
+    """
+    if isinstance(value, (int, float)):
+        return f"{int(value):,}"
+    text = str(value or '').strip()
+    if not _PLAIN_NUMBER.match(text):
+        return text
+    return f"{int(float(text.replace(',', ''))):,}"
+
+
+def date_prefix(year: int, month: int, day: int) -> str:
+    """오늘이 아닌 행의 내용 앞에 붙이는 날짜 (예: [25.12.04])"""
+    return f"[{year % 100:02d}.{month:02d}.{day:02d}]"
+
+
+if __name__ == "__main__":
+    # 마이크로 벤치마크: 10만 행 (날짜/등락률은 소수의 값이 반복됨)
+    import random
+    import time
+
+    assert split_date('2025.12.4') == (2025, 12, 4) and split_date('12.04') == (None, 12, 4)
+    assert split_date('합계') is None
+    assert format_rate('+29.97%') == '29.97%' and format_rate('-3.1 %') == '-3.10%' and format_rate(5, False) == '5.00'
+    assert format_rate('상한가') == '상한가' and format_rate('1,234') == '1,234' and format_rate('') == ''
+    assert format_volume('38679') == '38,679' and format_volume('1.2조') == '1.2조' and format_volume(1234.9) == '1,234'
+    assert date_prefix(2025, 12, 4) == '[25.12.04]'
+
+    rng = random.Random(0)
+    dates = [f"2025.{m}.{d}" for m in (11, 12) for d in range(1, 29)]
+    rows = [(rng.choice(dates), f"{rng.choice('+-')}{rng.randint(0, 3000) / 100}%", f"{rng.randint(1, 99999):,}")
+            for _ in range(100_000)]
+
+    def uncached(row):
+        # 이전 방식: 호출마다 re 임포트/컴파일 + float 변환
+        import re as re_module
+        date_text, rate_text, volume_text = row
+        match = re_module.match(r'^(20)?(\d{2})[.\-/](\d{1,2})[.\-/](\d{1,2})$', date_text.strip())
+        parts = (2000 + int(match.group(2)), int(match.group(3)), int(match.group(4))) if match else None
+        rate = float(re_module.search(r'[-+]?\d*\.?\d+', rate_text.replace(',', '')).group())
+        volume = float(re_module.search(r'[-+]?\d*\.?\d+', volume_text.replace(',', '')).group())
+        return parts, rate, volume
+
+    def cached(row):
+        date_text, rate_text, volume_text = row
+        return split_date(date_text), parse_number(rate_text), parse_number(volume_text)
+
+    for name, func in (('이전 방식', uncached), ('normalize', cached)):
+        start = time.perf_counter()
+        results = [func(row) for row in rows]
+        print(f"  {name:10s}: {(time.perf_counter() - start) * 1000:7.1f}ms ({len(results):,}행)")
+    assert [uncached(r) for r in rows[:1000]] == [cached(r) for r in rows[:1000]]
+    print(f"  캐시 적중: 날짜 {split_date.cache_info().hits:,}회, 숫자 {_parse_number_text.cache_info().hits:,}회")
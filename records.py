@@ -0,0 +1,56 @@
+"""
+레코드 클래스 공용 도구
+- 행마다 만들어지는 데이터 클래스(StockItem, CardData, RankingStock ...)에 __slots__ 적용
+  → 인스턴스별 __dict__ 가 없어져 행당 메모리 감소, 속성 접근도 약간 빨라짐
+- Python 3.10 의 @dataclass(slots=True) 와 같은 효과 (requirements: Python 3.8+)
+
+사용법:
+    @slotted
+    @dataclass
+    class StockItem:
+        name: str
+        rate_value: float = 0.0
+"""
+
+import dataclasses
+
+
+def slotted(cls):
+    """
+    dataclass 를 __slots__ 를 가진 같은 이름의 클래스로 다시 만듦
+
+    기본값은 dataclass 가 생성한 __init__ 에 들어 있으므로 클래스 속성에서는 제거
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+if __name__ == "__main__":
+    import sys
+    from typing import List
+
+    @dataclasses.dataclass
+    class Plain:
+        name: str
+        rate: float = 0.0
+        tags: List[str] = dataclasses.field(default_factory=list)
+
+    @slotted
+    @dataclasses.dataclass
+    class Slotted:
+        name: str
+        rate: float = 0.0
+        tags: List[str] = dataclasses.field(default_factory=list)
+
+    item = Slotted('삼성전자', 29.97)
+    assert item == Slotted('삼성전자', 29.97) and item.tags == [] and not hasattr(item, '__dict__')
+    plain = Plain('삼성전자', 29.97)
+    print(f"✅ slotted 점검 통과: {item}")
+    print(f"   인스턴스 크기: 일반 {sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)}B"
+          f" → slots {sys.getsizeof(item)}B")
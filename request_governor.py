@@ -0,0 +1,234 @@
+"""
+요청 속도 조절 모듈 (구글 시트 / Airtable 공용)
+- 소스별 토큰 버킷으로 초당 요청 수 제한
+  (구글 시트: 사용자당 분당 60회 읽기, Airtable: 베이스당 초당 5회)
+- 429 / 5xx 응답은 지터를 섞은 지수 백오프로 재시도 (Retry-After 헤더 우선)
+- 전체 동시 요청 수 상한 (여러 리포트/리더가 동시에 조회할 때)
+- 재시도 횟수, 대기 시간을 소스별로 집계 → 지표로 내보냄
+
+gspread / pyairtable 의 requests 세션에 어댑터로 붙이므로 리더 코드는 그대로 사용
+카세트(cassette.py)가 장착되면 응답을 녹화하거나, 네트워크 대신 녹화된 응답을 재생
+
+사용법:
+    governor = get_governor()
+    governor.mount(session, 'sheets')      # requests.Session
+    metrics.record_requests(governor.stats())
+"""
+
+import time
+import random
+import threading
+from typing import Callable, Dict, Tuple
+
+
+# 소스 → (초당 요청 수, 버킷 크기)
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    'sheets': (1.0, 10),     # 분당 60회, 순간 10회까지 허용
+    'airtable': (5.0, 5),    # 초당 5회
+}
+DEFAULT_MAX_CONCURRENT = 4     # 전체 동시 요청 수
+DEFAULT_MAX_RETRIES = 5        # 429 / 5xx 재시도 횟수
+BACKOFF_BASE = 1.0             # 첫 재시도 대기 (초)
+BACKOFF_MAX = 32.0             # 재시도 대기 상한 (초)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (순간 허용 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 사용 (없으면 채워질 때까지 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def backoff_delay(attempt: int, retry_after: float = None) -> float:
+    """
+    재시도 대기 시간 (full jitter 지수 백오프)
+
+    Args:
+        attempt: 재시도 번호 (0부터)
+        retry_after: 서버가 알려준 대기 시간 (초). 있으면 그 이상 대기
+    """
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, BACKOFF_MAX))
+    return delay
+
+
+def _retry_after(response) -> float:
+    """Retry-After 헤더 (초 단위만 지원, 없으면 None)"""
+    value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_throttled(error: BaseException) -> bool:
+    """재시도 후에도 속도 제한/서버 오류로 실패한 예외인지 (gspread APIError, requests HTTPError)"""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in RETRY_STATUSES
+
+
+class RequestGovernor:
+    """소스별 속도 제한 + 재시도 + 전체 동시 요청 수 제한"""
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]] = None,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_retries: int = DEFAULT_MAX_RETRIES):
+        """
+        Args:
+            limits: {소스: (초당 요청 수, 버킷 크기)} (기본값 DEFAULT_LIMITS)
+            max_concurrent: 전체 동시 요청 수 상한
+            max_retries: 429 / 5xx 응답 재시도 횟수
+        """
+        self.buckets = {source: TokenBucket(rate, capacity)
+                        for source, (rate, capacity) in (limits or DEFAULT_LIMITS).items()}
+        self.max_retries = max_retries
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self.cassette = None  # cassette.Cassette (녹화/재생 모드일 때)
+
+    def _count(self, source: str, **deltas):
+        with self._lock:
+            stats = self._stats.setdefault(source, {'requests': 0, 'retries': 0, 'throttled_seconds': 0.0})
+            for name, value in deltas.items():
+                stats[name] += value
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """소스별 {'requests', 'retries', 'throttled_seconds'} 복사본"""
+        with self._lock:
+            return {source: dict(values) for source, values in self._stats.items()}
+
+    def send(self, source: str, send: Callable[[], object]):
+        """
+        속도 제한 안에서 요청 실행, 429 / 5xx 면 백오프 후 재시도
+
+        Args:
+            source: 소스 이름 ('sheets', 'airtable')
+            send: 요청 1회를 보내고 응답(status_code 속성)을 반환하는 함수
+
+        Returns:
+            마지막 응답 (재시도를 다 써도 실패하면 실패 응답 그대로 → 호출한 라이브러리가 예외 처리)
+        """
+        bucket = self.buckets.get(source)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                waited = bucket.acquire()
+                if waited:
+                    self._count(source, throttled_seconds=waited)
+            with self._slots:
+                response = send()
+            self._count(source, requests=1)
+
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                return response
+
+            delay = backoff_delay(attempt, _retry_after(response))
+            print(f"  ⏳ {source} {response.status_code} 응답 → {delay:.1f}초 후 재시도 "
+                  f"({attempt + 1}/{self.max_retries})")
+            response.close()
+            self._count(source, retries=1, throttled_seconds=delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def mount(self, session, source: str):
+        """requests 세션의 모든 https 요청이 이 조절기를 거치도록 어댑터 장착"""
+        session.mount('https://', _adapter_class()(self, source))
+        return session
+
+
+_adapter = None
+
+
+def _adapter_class():
+    """requests 어댑터 클래스 (requests 는 네트워크가 필요할 때만 로드)"""
+    global _adapter
+    if _adapter is None:
+        from requests.adapters import HTTPAdapter
+
+        class GovernedAdapter(HTTPAdapter):
+            """RequestGovernor 를 거쳐 요청을 보내는 어댑터"""
+
+            def __init__(self, governor: RequestGovernor, source: str, **kwargs):
+                super().__init__(**kwargs)
+                self.governor = governor
+                self.source = source
+
+            def send(self, request, **kwargs):
+                cassette = self.governor.cassette
+                if cassette is not None and cassette.replaying:
+                    # 재생: 네트워크/속도 제한 없이 녹화된 응답
+                    return cassette.replay(request)
+                response = self.governor.send(self.source, lambda: super(GovernedAdapter, self).send(request, **kwargs))
+                if cassette is not None:
+                    try:
+                        cassette.record(request, response)
+                    except OSError as e:
+                        print(f"⚠️ 카세트 녹화 실패: {e}")
+                return response
+
+        _adapter = GovernedAdapter
+    return _adapter
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_governor() -> RequestGovernor:
+    """프로세스 공용 조절기 (모든 리더/리포트가 같은 버킷을 사용)"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RequestGovernor()
+        return _default
+
+
+if __name__ == "__main__":
+    # 간단 점검: 503 두 번 뒤 200 을 돌려주는 가짜 요청
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {'Retry-After': '0'}
+
+        def close(self):
+            pass
+
+    statuses = iter([503, 429, 200])
+    BACKOFF_BASE = 0.01
+    governor = RequestGovernor({'test': (100.0, 1)}, max_retries=3)
+    response = governor.send('test', lambda: FakeResponse(next(statuses)))
+    assert response.status_code == 200
+    stats = governor.stats()['test']
+    assert stats['requests'] == 3 and stats['retries'] == 2
+    print(f"✅ 재시도 점검 통과: {stats}")
@@ -0,0 +1,293 @@
+"""
+전체 리포트 통합 실행 (급등이슈 / 등락률상위 / 강세테마 / 답안지)
+============================================
+
+- 선택한 리포트를 한 프로세스, 한 이벤트 루프에서 동시에 실행
+- 구글 시트: SpreadsheetLoader 로 인증 1회 + 필요한 워크시트(시트1/2/3)를 일괄 조회 1회
+- Airtable: 구글 시트 조회와 동시에 스레드에서 조회
+- 브라우저: Chromium 1개를 데이터 조회와 동시에 실행해 모든 리포트 렌더링에 공유
+- 리포트별 결과 요약 + 전체 소요 시간 출력 (지표는 리포트별로 따로 기록)
+
+사용법:
+    python run_all.py                              # 4개 리포트 모두
+    python run_all.py --reports 급등이슈 강세테마     # 선택한 리포트만
+    python run_all.py --date 2025.12.03            # 급등이슈/강세테마 날짜 지정
+    python run_all.py --deadline 300 --metrics-file ./metrics/  # 전체 5분 제한 + 리포트별 지표 기록
+    python run_all.py --replay cassettes/run1      # 녹화된 응답으로 오프라인 실행
+"""
+
+import os
+import time
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from airtable_reader import AirtableReader
+from cassette import use_cassette
+from concurrent_fetch import fetch_sources
+from deadline import RunDeadline, StageTimeout, parse_shares
+from html_renderer import HtmlRenderer
+from html_renderer_answersheet import HtmlRendererAnswerSheet
+from html_renderer_ranking import HtmlRendererRanking
+from html_renderer_theme import HtmlRendererTheme
+from main import BASE_DIR, CREDENTIALS_PATH, SPREADSHEET_ID, OUTPUT_DIR
+from main_answersheet import AIRTABLE_API_KEY, AIRTABLE_BASE_ID, AIRTABLE_TABLE_ID
+from metrics import PipelineMetrics
+from request_governor import get_governor, is_throttled
+from sheet_reader import SheetReader
+from sheet_reader_ranking import SheetReaderRanking
+from sheet_reader_theme import SheetReaderTheme
+from spreadsheet_loader import SpreadsheetLoader
+
+
+# 리포트 이름 (실행/요약 순서)
+REPORTS = ['급등이슈', '등락률상위', '강세테마', '답안지']
+AIRTABLE_REPORT = '답안지'
+
+
+@dataclass
+class ReportResult:
+    """리포트 1개의 실행 결과"""
+    name: str
+    output_files: List[str] = field(default_factory=list)
+    error: Optional[str] = None     # 실패 사유 (성공이면 None)
+    seconds: float = 0.0            # 그룹화 + 렌더링 시간 (공유 조회 제외)
+
+
+def create_readers(names: List[str], deadline: RunDeadline) -> Dict[str, object]:
+    """리포트별 리더 생성 (연결/조회는 fetch_calls 함수에서)"""
+    timeout = deadline.remaining()
+    factories = {
+        '급등이슈': lambda: SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=timeout),
+        '등락률상위': lambda: SheetReaderRanking(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=timeout),
+        '강세테마': lambda: SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=timeout),
+        '답안지': lambda: AirtableReader(AIRTABLE_API_KEY, AIRTABLE_BASE_ID, AIRTABLE_TABLE_ID, timeout=timeout),
+    }
+    return {name: factories[name]() for name in names}
+
+
+def fetch_calls(readers: Dict[str, object], deadline: RunDeadline) -> Dict[str, Callable[[], None]]:
+    """
+    소스별 조회 함수 (구글 시트 리더들은 연결 1회 + 일괄 조회 1회를 공유)
+
+    Returns:
+        {'구글 시트' / 'Airtable': 인자 없는 함수}
+    """
+    calls = {}
+    sheet_readers = [r for name, r in readers.items() if name != AIRTABLE_REPORT]
+    if sheet_readers:
+        def load_sheets():
+            loader = SpreadsheetLoader(CREDENTIALS_PATH, SPREADSHEET_ID, timeout=deadline.remaining())
+            loader.connect()
+            loader.attach(*sheet_readers)
+        calls['구글 시트'] = load_sheets
+    if AIRTABLE_REPORT in readers:
+        calls['Airtable'] = readers[AIRTABLE_REPORT].prefetch
+    return calls
+
+
+def source_of(name: str) -> str:
+    """리포트가 사용하는 소스 (fetch_calls 키)"""
+    return 'Airtable' if name == AIRTABLE_REPORT else '구글 시트'
+
+
+def prepare_report(name: str, reader, renderer, target_date: str = None):
+    """
+    조회된 데이터로 그룹화하고 렌더링 함수를 반환 (추가 API 호출 없음)
+
+    Returns:
+        (browser → 렌더링 코루틴) 함수. 표시할 데이터가 없으면 None
+    """
+    today = datetime.now()
+    if name in ('급등이슈', '강세테마'):
+        raw_data = reader.get_today_data(target_date)
+        date_str = target_date or reader.get_latest_date()
+        if not raw_data:
+            return None
+        cards = reader.group_data(raw_data)
+        output_path = os.path.join(OUTPUT_DIR, f"{name}_{date_str.replace('.', '')}")
+        return lambda browser: renderer.generate_async(cards, date_str, output_path, browser=browser)
+    if name == '등락률상위':
+        stocks = reader.get_ranking_data()
+        groups = reader.group_by_material(stocks) if stocks else []
+        if not groups:
+            return None
+        output_path = os.path.join(OUTPUT_DIR, f"등락률상위_{today.strftime('%Y%m%d')}")
+        return lambda browser: renderer.generate_async(groups, output_path, browser=browser)
+    data = reader.get_grouped_data()
+    if not data or not any(data.get(t) for t in reader.TYPES):
+        return None
+    output_path = os.path.join(OUTPUT_DIR, f"답안지_{today.strftime('%Y%m%d')}")
+    return lambda browser: renderer.generate_async(data, today.strftime("%Y.%m.%d"), output_path, browser=browser)
+
+
+async def run_report(name: str, reader, deadline: RunDeadline, browser, metrics: PipelineMetrics,
+                     target_date: str = None) -> ReportResult:
+    """리포트 1개: 그룹화(스레드) → 공유 브라우저로 렌더링"""
+    import asyncio
+
+    result = ReportResult(name)
+    renderer_class = {
+        '급등이슈': HtmlRenderer,
+        '등락률상위': HtmlRendererRanking,
+        '강세테마': HtmlRendererTheme,
+        '답안지': HtmlRendererAnswerSheet,
+    }[name]
+    renderer = renderer_class(BASE_DIR, deadline=deadline)
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_event_loop()
+        with metrics.stage('group'):
+            render = await deadline.wait_for(
+                'group', loop.run_in_executor(None, prepare_report, name, reader, renderer, target_date))
+        if render is None:
+            result.error = '표시할 데이터 없음'
+        else:
+            with metrics.stage('render'):
+                result.output_files = await render(browser)
+            if not result.output_files:
+                result.error = '렌더링된 페이지 없음'
+    except StageTimeout as e:
+        metrics.set('deadline_exceeded', 1, stage=e.stage)
+        result.error = str(e)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+async def run_all_async(names: List[str], args, metrics: Dict[str, PipelineMetrics]) -> Dict[str, ReportResult]:
+    """공유 조회 + 브라우저 실행을 동시에 시작하고, 조회가 끝나면 리포트들을 동시에 진행"""
+    import asyncio
+
+    # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+    from playwright.async_api import async_playwright
+
+    deadline = RunDeadline(args.deadline, args.deadline_split)
+    readers = create_readers(names, deadline)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    async with async_playwright() as p:
+        # 데이터 조회(스레드)와 브라우저 실행을 동시에
+        print("\n📡 데이터 조회 + 브라우저 실행 중...")
+        launch = asyncio.ensure_future(p.chromium.launch())
+        try:
+            fetched = await fetch_sources(fetch_calls(readers, deadline), deadline=deadline)
+        except StageTimeout as e:
+            fetched = {source_of(name): e for name in names}
+        except BaseException:
+            # 조회 중 예기치 못한 실패/중단: 이미 실행 중인 브라우저를 기다려 닫고 원래 오류를 전달
+            browser = (await asyncio.gather(launch, return_exceptions=True))[0]
+            if not isinstance(browser, BaseException):
+                await browser.close()
+            raise
+        browser = await launch
+
+        try:
+            results = {}
+            tasks = {}
+            for name in names:
+                error = fetched.get(source_of(name))
+                if isinstance(error, BaseException):
+                    if is_throttled(error):
+                        reason = f"요청 한도 초과 (재시도 후 실패): {error}"
+                    else:
+                        reason = f"{source_of(name)} 조회 실패: {error}"
+                    results[name] = ReportResult(name, error=reason)
+                    continue
+                metrics[name].record_rows(readers[name].rows_fetched)
+                tasks[name] = run_report(name, readers[name], deadline, browser, metrics[name], args.date)
+
+            for name, result in zip(tasks, await asyncio.gather(*tasks.values())):
+                results[name] = result
+        finally:
+            await browser.close()
+
+    deadline.report()
+    return {name: results[name] for name in names}
+
+
+def metrics_path(path: str, name: str, shared: bool) -> str:
+    """
+    리포트별 지표 파일 경로
+
+    폴더면 그대로 (write_textfile 이 리포트별 파일명 사용).
+    파일 경로를 여러 리포트가 같이 쓰면 서로 덮어쓰므로 파일명에 리포트 이름을 붙임
+    (예: metrics.prom → metrics_급등이슈.prom)
+    """
+    if not path or not shared or os.path.isdir(path):
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{name}{ext or '.prom'}"
+
+
+def print_summary(results: Dict[str, ReportResult], elapsed: float):
+    """리포트별 결과 요약 + 전체 소요 시간"""
+    print("\n" + "=" * 50)
+    print("📋 리포트별 결과")
+    print("=" * 50)
+    for result in results.values():
+        if result.error is None:
+            print(f"  ✅ {result.name}: {len(result.output_files)}페이지 ({result.seconds:.1f}초)")
+            for f in result.output_files:
+                print(f"     📁 {f}")
+        else:
+            print(f"  ❌ {result.name}: {result.error}")
+    succeeded = sum(1 for r in results.values() if r.error is None)
+    print(f"\n⏱️ 전체 소요 시간: {elapsed:.1f}초 ({succeeded}/{len(results)}개 리포트 성공)")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='전체 리포트 이미지 동시 생성')
+    parser.add_argument('--reports', nargs='+', choices=REPORTS, default=REPORTS,
+                        help='실행할 리포트 (기본: 전체)')
+    parser.add_argument('--date', type=str, help='급등이슈/강세테마 조회 날짜 (예: 2025.12.03, 기본: 시트 최신 날짜)')
+    parser.add_argument('--metrics-file', type=str,
+                        help='Prometheus 지표 폴더 또는 파일 (textfile collector, 리포트별 파일. '
+                             '파일이면 이름 뒤에 _<리포트> 를 붙임)')
+    parser.add_argument('--metrics-push', type=str, help='Prometheus Pushgateway 주소 (예: http://localhost:9091)')
+    parser.add_argument('--deadline', type=float, help='전체 제한 시간 (초). 모든 리포트가 같은 예산을 공유')
+    parser.add_argument('--deadline-split', type=parse_shares, help='단계별 시간 배분 (예: fetch=0.4,group=0.1,render=0.5)')
+    parser.add_argument('--record', type=str, help='API 응답을 카세트 폴더에 녹화')
+    parser.add_argument('--replay', type=str, help='카세트 폴더의 녹화된 응답으로 실행 (네트워크 없음)')
+    parser.add_argument('--replay-latency', type=str, help="재생 시 응답마다 넣을 지연 (초, 'recorded' 면 녹화 당시 응답 시간)")
+    args = parser.parse_args()
+
+    # 중복 제거 (실행 순서는 REPORTS 기준)
+    names = [name for name in REPORTS if name in args.reports]
+
+    # 카세트 녹화/재생 (--record / --replay 일 때만)
+    cassette = use_cassette(args.record, args.replay, args.replay_latency)
+
+    print("=" * 50)
+    print(f"🚀 통합 실행 시작: {', '.join(names)}")
+    print("=" * 50)
+
+    import asyncio
+
+    metrics = {name: PipelineMetrics(name) for name in names}
+    results: Dict[str, ReportResult] = {}
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(run_all_async(names, args, metrics))
+        print_summary(results, time.perf_counter() - start)
+        return results
+    finally:
+        if cassette is not None:
+            cassette.report()
+        request_stats = get_governor().stats()
+        for name in names:
+            result = results.get(name)
+            # 공유 연결이므로 요청 지표는 리포트가 사용한 소스 것만 기록
+            source = 'airtable' if name == AIRTABLE_REPORT else 'sheets'
+            metrics[name].record_requests({k: v for k, v in request_stats.items() if k == source})
+            if result is not None:
+                metrics[name].record_outputs(result.output_files)
+            metrics[name].finish(success=bool(result and result.error is None))
+            metrics[name].export(metrics_path(args.metrics_file, name, len(names) > 1), args.metrics_push)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+워크시트 로컬 캐시 모듈
+- 스프레드시트의 Drive modifiedTime(메타데이터만 조회)을 먼저 확인
+- 마지막 조회 이후 수정이 없으면 디스크에 저장된 값을 그대로 사용
+- 수정된 경우에만 워크시트를 다시 받아 캐시 갱신
+
+같은 PC에서 여러 프로세스(급등이슈/강세테마/등락률상위)가 동시에 실행돼도 안전하도록
+- 워크시트별 잠금 파일로 "확인 → 조회 → 저장" 구간을 한 프로세스만 실행
+- 캐시 파일은 임시 파일에 쓴 뒤 os.replace 로 원자적으로 교체
+"""
+
+import os
+import json
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from sheet_snapshot import SheetSnapshot
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+CACHE_VERSION = 1
+
+
+@contextmanager
+def file_lock(path: str):
+    """프로세스 간 배타 잠금 (POSIX: fcntl.flock, Windows: msvcrt.locking)"""
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK 은 10초 동안 재시도 후 실패하므로 계속 대기
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SheetCache:
+    """Drive modifiedTime 기준 워크시트 값 캐시"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: 캐시 파일을 저장할 폴더 (없으면 생성)
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._modified_times = {}  # 스프레드시트 ID → modifiedTime (실행 중 1회만 조회)
+
+    def _entry_path(self, spreadsheet_id: str, worksheet_index: int) -> str:
+        return os.path.join(self.cache_dir, f"{spreadsheet_id}_{worksheet_index}.json")
+
+    def modified_time(self, sheet) -> str:
+        """스프레드시트 최종 수정 시각 (Drive 메타데이터)"""
+        if sheet.id not in self._modified_times:
+            self._modified_times[sheet.id] = sheet.get_lastUpdateTime()
+        return self._modified_times[sheet.id]
+
+    def read(self, path: str, modified_time: str) -> Optional[SheetSnapshot]:
+        """캐시 파일이 같은 modifiedTime 으로 저장된 것이면 스냅샷 반환"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_VERSION or entry.get('modified_time') != modified_time:
+            return None
+        return SheetSnapshot(entry['header'], entry['rows'], start_row=entry.get('start_row', 2))
+
+    def write(self, path: str, modified_time: str, snapshot: SheetSnapshot):
+        """캐시 파일 기록 (임시 파일 → os.replace 로 원자적 교체)"""
+        import tempfile
+
+        entry = {
+            'version': CACHE_VERSION,
+            'modified_time': modified_time,
+            'header': snapshot.header,
+            'rows': snapshot.rows,
+            'start_row': snapshot.start_row,
+        }
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.sheet_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def load(self, sheet, worksheet_index: int, fetch: Callable[[], SheetSnapshot]) -> SheetSnapshot:
+        """
+        캐시가 최신이면 캐시에서, 아니면 fetch() 로 조회 후 캐시 갱신
+
+        Args:
+            sheet: gspread Spreadsheet
+            worksheet_index: 워크시트 번호 (0-indexed)
+            fetch: 워크시트 전체를 조회하는 함수
+        """
+        modified_time = self.modified_time(sheet)
+        path = self._entry_path(sheet.id, worksheet_index)
+
+        with file_lock(path + '.lock'):
+            snapshot = self.read(path, modified_time)
+            if snapshot is not None:
+                print(f"💾 캐시 사용 (수정 없음: {modified_time}): {len(snapshot)}행")
+                return snapshot
+
+            snapshot = fetch()
+            try:
+                self.write(path, modified_time, snapshot)
+            except OSError as e:
+                print(f"⚠️ 캐시 저장 실패: {e}")
+            return snapshot
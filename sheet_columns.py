@@ -0,0 +1,77 @@
+"""
+열 단위 데이터 변환 모듈
+- 헤더 → 열 위치 매핑을 워크시트당 한 번만 계산 (헤더가 없으면 열 문자 위치 사용)
+- 필요한 필드만 열 배열로 추출 (텍스트는 strip, 숫자 열은 float 로 한 번만 파싱)
+- 행마다 row.get('헤더', row.get('A', '')) / 정규식 파싱을 반복하지 않음
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+from normalize import parse_number
+
+
+class ColumnSpec(NamedTuple):
+    """필드 정의"""
+    header: str              # 1행 헤더 이름 (예: '등락률')
+    letter: str              # 헤더를 못 찾을 때 사용할 열 문자 (예: 'E')
+    numeric: bool = False    # True면 '<필드>_value' 숫자 열도 생성
+
+
+def column_position(letter: str) -> int:
+    """열 문자 → 0부터 시작하는 위치 (A → 0, AA → 26)"""
+    position = 0
+    for ch in letter.upper():
+        position = position * 26 + (ord(ch) - ord('A') + 1)
+    return position - 1
+
+
+def resolve_columns(header: List[str], specs: Dict[str, ColumnSpec]) -> Dict[str, int]:
+    """필드 → 열 위치 매핑 (헤더 이름 우선, 없으면 열 문자)"""
+    lookup = {name: i for i, name in enumerate(header)}
+    return {
+        field: lookup.get(spec.header, column_position(spec.letter))
+        for field, spec in specs.items()
+    }
+
+
+class SheetColumns:
+    """필드별 열 배열"""
+
+    def __init__(self, columns: Dict[str, list], length: int):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_rows(cls, header: List[str], rows: List[List[Any]], specs: Dict[str, ColumnSpec],
+                  positions: Iterable[int] = None) -> 'SheetColumns':
+        """
+        행 목록에서 필요한 필드만 열 배열로 추출
+
+        Args:
+            header: 1행 헤더
+            rows: 데이터 행
+            specs: 필드 정의 {필드: ColumnSpec}
+            positions: 추출할 행 위치 (기본값 전체)
+        """
+        mapping = resolve_columns(header, specs)
+        selected = [rows[i] for i in positions] if positions is not None else rows
+
+        columns: Dict[str, list] = {}
+        for field, spec in specs.items():
+            index = mapping[field]
+            texts = [str(row[index]).strip() if index < len(row) else '' for row in selected]
+            columns[field] = texts
+            if spec.numeric:
+                columns[f'{field}_value'] = [parse_number(text) for text in texts]
+        return cls(columns, len(selected))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, field: str) -> list:
+        return self.columns[field]
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """행 dict 목록으로 변환 (기존 raw_data 형식과 호환)"""
+        fields = list(self.columns)
+        return [dict(zip(fields, values)) for values in zip(*(self.columns[f] for f in fields))]
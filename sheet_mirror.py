@@ -0,0 +1,171 @@
+"""
+스프레드시트 로컬 미러 모듈 (SQLite)
+- 워크시트 행을 로컬 SQLite DB에 복제 (main_sync.py 로 실행)
+- 지난 동기화 이후 새로 추가된 행만 받아서 추가
+- (워크시트, 날짜, 타입, 그룹) 인덱스로 과거 날짜 재실행/감사를 오프라인으로 처리
+
+이미 받은 행의 A열이 바뀌었거나 행 수가 줄었으면 (덮어쓰기/삭제)
+해당 워크시트는 전체를 다시 받음
+"""
+
+import json
+import sqlite3
+from datetime import date, datetime
+from typing import List, Optional
+
+from date_index import parse_sheet_date
+from sheet_snapshot import SheetSnapshot, fetch_rows
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS worksheets (
+    worksheet INTEGER PRIMARY KEY,
+    title TEXT,
+    header TEXT NOT NULL,
+    last_row INTEGER NOT NULL,
+    last_date TEXT,
+    synced_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sheet_rows (
+    worksheet INTEGER NOT NULL,
+    row_num INTEGER NOT NULL,
+    raw_date TEXT NOT NULL,
+    date TEXT,
+    type TEXT,
+    grp TEXT,
+    cells TEXT NOT NULL,
+    PRIMARY KEY (worksheet, row_num)
+);
+CREATE INDEX IF NOT EXISTS idx_sheet_rows_date ON sheet_rows (worksheet, date, type, grp);
+"""
+
+
+class SheetMirror:
+    """워크시트 행을 SQLite에 복제/조회"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite DB 파일 경로 (없으면 생성)
+        """
+        self.path = path
+        # 여러 프로세스가 동시에 쓰면 잠금이 풀릴 때까지 대기
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def sync(self, sheet, worksheet_index: int, full: bool = False) -> int:
+        """
+        워크시트 하나를 미러에 동기화
+
+        Args:
+            sheet: gspread Spreadsheet
+            worksheet_index: 워크시트 번호 (0-indexed)
+            full: True면 기존 행을 지우고 전체를 다시 받음
+
+        Returns:
+            새로 추가된 행 수
+        """
+        worksheet = sheet.get_worksheet(worksheet_index)
+        date_column = worksheet.col_values(1)
+
+        state = self.conn.execute(
+            "SELECT last_row, last_date FROM worksheets WHERE worksheet = ?", (worksheet_index,)
+        ).fetchone()
+        last_row, last_date = state if state else (1, None)
+
+        if not full and state:
+            stored = [r[0] for r in self.conn.execute(
+                "SELECT raw_date FROM sheet_rows WHERE worksheet = ? ORDER BY row_num", (worksheet_index,)
+            )]
+            # 추가만 된 경우에는 기존 행의 A열이 그대로여야 함
+            if len(date_column) < last_row or stored != [str(v) for v in date_column[1:last_row]]:
+                print(f"  ⚠️ {worksheet.title}: 기존 행이 변경되어 전체를 다시 받습니다")
+                full = True
+
+        if full:
+            last_row, last_date = 1, None
+
+        new_last_row = len(date_column)
+        if new_last_row > last_row:
+            snapshot = fetch_rows(worksheet, last_row + 1, new_last_row)
+        else:
+            snapshot = SheetSnapshot(self.header(worksheet_index) or date_column[:1], [])
+
+        previous = date.fromisoformat(last_date) if last_date else None
+        entries = []
+        for i, row in enumerate(snapshot.rows):
+            record = snapshot.record(i)
+            raw_date = str(row[0]).strip() if row else ''
+            parsed = parse_sheet_date(raw_date, previous)
+            if parsed is not None:
+                previous = parsed
+            entries.append((
+                worksheet_index,
+                snapshot.start_row + i,
+                str(row[0]) if row else '',
+                parsed.isoformat() if parsed else None,
+                str(record.get('타입', '')).strip(),
+                str(record.get('그룹명', record.get('재료', ''))).strip(),
+                json.dumps(list(row), ensure_ascii=False),
+            ))
+
+        with self.conn:
+            if full:
+                self.conn.execute("DELETE FROM sheet_rows WHERE worksheet = ?", (worksheet_index,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sheet_rows"
+                " (worksheet, row_num, raw_date, date, type, grp, cells) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                entries
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO worksheets"
+                " (worksheet, title, header, last_row, last_date, synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (worksheet_index, worksheet.title, json.dumps(snapshot.header, ensure_ascii=False),
+                 max(last_row, new_last_row), previous.isoformat() if previous else None,
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+
+        print(f"  🔄 {worksheet.title}: {len(entries)}행 추가 (전체 {max(last_row, new_last_row) - 1}행)")
+        return len(entries)
+
+    def header(self, worksheet_index: int) -> Optional[List[str]]:
+        """저장된 헤더 (동기화 전이면 None)"""
+        row = self.conn.execute(
+            "SELECT header FROM worksheets WHERE worksheet = ?", (worksheet_index,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def date_values(self, worksheet_index: int) -> List[str]:
+        """행 순서대로 파싱된 날짜 (ISO 형식, 날짜가 없는 행은 빈 문자열)"""
+        return [r[0] or '' for r in self.conn.execute(
+            "SELECT date FROM sheet_rows WHERE worksheet = ? ORDER BY row_num", (worksheet_index,)
+        )]
+
+    def snapshot(self, worksheet_index: int, day: date = None) -> SheetSnapshot:
+        """
+        미러에서 스냅샷 조회
+
+        Args:
+            worksheet_index: 워크시트 번호 (0-indexed)
+            day: 지정하면 해당 날짜 행만 (인덱스 사용)
+        """
+        header = self.header(worksheet_index)
+        if header is None:
+            raise LookupError(f"미러에 워크시트 {worksheet_index + 1}번이 없습니다 (main_sync.py 를 먼저 실행하세요)")
+
+        if day is None:
+            cursor = self.conn.execute(
+                "SELECT row_num, cells FROM sheet_rows WHERE worksheet = ? ORDER BY row_num",
+                (worksheet_index,)
+            )
+        else:
+            cursor = self.conn.execute(
+                "SELECT row_num, cells FROM sheet_rows WHERE worksheet = ? AND date = ? ORDER BY row_num",
+                (worksheet_index, day.isoformat())
+            )
+        fetched = cursor.fetchall()
+        start_row = fetched[0][0] if fetched else 2
+        return SheetSnapshot(header, [json.loads(cells) for _, cells in fetched], start_row=start_row)
@@ -0,0 +1,216 @@
+"""
+구글 시트 리더 공통 모듈
+- 연결 / 스냅샷 조회(파일·미러·마지막 N행·캐시·전체) / A열 날짜 인덱스 / 날짜별 행 조회
+- 워크시트별 리더(급등이슈·등락률상위·강세테마)는 WORKSHEET_INDEX, WORKSHEET_LABEL, COLUMNS 만 지정하고
+  카드/종목 변환만 따로 구현
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+
+from date_index import DateIndex, format_date, parse_sheet_date
+from sheet_cache import SheetCache
+from sheet_columns import ColumnSpec
+from sheet_snapshot import SheetSnapshot, fetch_rows, fetch_tail
+
+
+class BaseSheetReader:
+    """구글 시트 워크시트 1개 리더 (공통 조회 로직)"""
+
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets.readonly',
+        'https://www.googleapis.com/auth/drive.readonly'
+    ]
+    WORKSHEET_INDEX = 0       # 워크시트 번호 (0-indexed, 하위 클래스에서 지정)
+    WORKSHEET_LABEL = '시트1'  # 지표/스냅샷 키
+    # 필드 → (헤더 이름, 헤더가 없을 때의 열, 숫자 여부)
+    COLUMNS: Dict[str, ColumnSpec] = {}
+
+    def __init__(self, credentials_path: str, spreadsheet_id: str, timeout: float = None,
+                 tail_rows: int = None, date_search: bool = False, cache_dir: str = None,
+                 mirror_path: str = None, source_path: str = None):
+        """
+        Args:
+            credentials_path: 서비스 계정 JSON 파일 경로
+            spreadsheet_id: 구글 시트 ID
+            timeout: 구글 API 요청 타임아웃 (초). None이면 제한 없음
+            tail_rows: 지정하면 헤더 + 마지막 N행만 조회
+            date_search: True면 A열(날짜)에서 대상 날짜 구간을 찾아 그 행들만 조회
+            cache_dir: 지정하면 시트가 수정되지 않은 동안 로컬 캐시 사용
+            mirror_path: 지정하면 구글 시트 대신 로컬 SQLite 미러(main_sync.py)에서 읽음
+            source_path: 지정하면 구글 시트 대신 로컬 CSV/XLSX 파일(file_source.py)에서 읽음
+        """
+        self.credentials_path = credentials_path
+        self.spreadsheet_id = spreadsheet_id
+        self.timeout = timeout
+        self.tail_rows = tail_rows
+        self.date_search = date_search
+        self.cache = SheetCache(cache_dir) if cache_dir else None
+        self.mirror = None
+        if mirror_path:
+            from sheet_mirror import SheetMirror  # 미러 사용 시에만 로드
+            self.mirror = SheetMirror(mirror_path)
+        self.file_source = None
+        if source_path:
+            from file_source import FileSource  # 파일 사용 시에만 로드
+            self.file_source = FileSource(source_path)
+            # 파일은 한 번에 전체를 읽으므로 부분 조회 옵션은 사용하지 않음
+            self.tail_rows = None
+            self.date_search = False
+        self.client = None
+        self.sheet = None
+        self.worksheet = None
+        self.date_column: List[str] = None  # A열(날짜) 값 (범위 조회용, 1행=헤더)
+        self._column_index: DateIndex = None  # A열 기준 날짜 인덱스 (미러/범위 조회용)
+        self.snapshot: SheetSnapshot = None  # 워크시트 스냅샷 (실행당 1회 조회)
+        self.rows_fetched: Dict[str, int] = {}  # 워크시트별 읽은 행 수 (지표용)
+
+    def connect(self):
+        """구글 시트에 연결 (미러/파일 사용 시 생략)"""
+        if self.mirror is not None:
+            print(f"✅ 로컬 미러 사용: {self.mirror.path}")
+            return
+        if self.file_source is not None:
+            print(f"✅ 로컬 파일 사용: {self.file_source.path}")
+            return
+
+        # 네트워크가 필요한 경우에만 로드 (--test 등 시작 속도 개선)
+        # 인증 토큰/HTTP 세션/스프레드시트는 같은 프로세스의 리더들이 공유
+        from gsheet_client import open_spreadsheet
+
+        self.client, self.sheet = open_spreadsheet(
+            self.credentials_path, self.spreadsheet_id, self.SCOPES, timeout=self.timeout
+        )
+        print(f"✅ 구글 시트 연결 성공: {self.sheet.title}")
+
+    def prefetch(self):
+        """연결 + 워크시트 조회 (concurrent_fetch 에서 다른 소스와 동시에 실행)"""
+        if self.sheet is None and self.mirror is None and self.file_source is None:
+            self.connect()
+        if self.date_search and self.mirror is None:
+            # 범위 조회 모드는 대상 날짜를 정하는 A열까지만 미리 조회
+            self.load_date_column()
+        else:
+            self.load_snapshot()
+
+    def use_snapshot(self, snapshot: SheetSnapshot):
+        """외부(SpreadsheetLoader 등)에서 받아온 스냅샷 주입"""
+        self.snapshot = snapshot
+        self.rows_fetched[self.WORKSHEET_LABEL] = len(snapshot)
+
+    def load_snapshot(self, refresh: bool = False) -> SheetSnapshot:
+        """
+        워크시트 전체를 한 번만 조회하여 스냅샷으로 보관
+
+        Args:
+            refresh: True면 캐시된 스냅샷과 A열 값/날짜 인덱스를 버리고 다시 조회
+                     (--tail-rows 는 A열 길이로 마지막 행을 정하므로 A열도 다시 읽어야 새 행이 보임)
+        """
+        if refresh:
+            self.date_column = None
+            self._column_index = None
+        if self.snapshot is None or refresh:
+            if self.file_source is not None:
+                snapshot = self.file_source.snapshot(self.WORKSHEET_INDEX, self.WORKSHEET_LABEL)
+            elif self.mirror is not None:
+                snapshot = self.mirror.snapshot(self.WORKSHEET_INDEX)
+            elif self.tail_rows:
+                snapshot = fetch_tail(self.get_worksheet(), self.tail_rows, self.load_date_column())
+            elif self.cache is not None:
+                snapshot = self.cache.load(self.sheet, self.WORKSHEET_INDEX, self._fetch_all)
+            else:
+                snapshot = self._fetch_all()
+            self.use_snapshot(snapshot)
+        return self.snapshot
+
+    def _fetch_all(self) -> SheetSnapshot:
+        """워크시트 전체 값 조회"""
+        return SheetSnapshot.from_values(self.get_worksheet().get_all_values())
+
+    def get_worksheet(self):
+        """워크시트 (최초 1회만 조회)"""
+        if self.worksheet is None:
+            self.worksheet = self.sheet.get_worksheet(self.WORKSHEET_INDEX)
+        return self.worksheet
+
+    def load_date_column(self) -> List[str]:
+        """A열(날짜) 값만 조회 (범위 조회 위치 계산용, load_snapshot(refresh=True) 전까지 재사용)"""
+        if self.date_column is None:
+            self.date_column = self.get_worksheet().col_values(1)
+        return self.date_column
+
+    def load_date_snapshot(self, day: date) -> Tuple[SheetSnapshot, List[int]]:
+        """
+        A열 날짜 인덱스로 day 구간을 찾아 헤더 + 해당 행들만 조회
+
+        Returns:
+            (범위 스냅샷, 스냅샷 안에서 day 에 해당하는 행 위치 목록)
+        """
+        positions = self.get_date_index().rows_for(day)
+        if not positions:
+            return SheetSnapshot(self.load_date_column()[:1], []), []
+        # 인덱스 위치는 헤더 제외 0부터이므로 시트 행 번호는 +2
+        first_row, last_row = positions[0] + 2, positions[-1] + 2
+        snapshot = fetch_rows(self.get_worksheet(), first_row, last_row)
+        self.rows_fetched[self.WORKSHEET_LABEL] = len(snapshot)
+        print(f"📥 {format_date(day)} 범위만 조회: {first_row}~{last_row}행")
+        return snapshot, [p - positions[0] for p in positions]
+
+    def get_date_index(self) -> DateIndex:
+        """날짜 인덱스 (미러/범위 조회 모드면 A열 기준, 아니면 스냅샷 기준)"""
+        if self.mirror is not None:
+            if self._column_index is None:
+                self._column_index = DateIndex(self.mirror.date_values(self.WORKSHEET_INDEX))
+            return self._column_index
+        if self.date_search and self.snapshot is None:
+            if self._column_index is None:
+                self._column_index = DateIndex(self.load_date_column()[1:])
+            return self._column_index
+        return self.load_snapshot().date_index
+
+    def get_available_dates(self) -> List[str]:
+        """워크시트에 있는 날짜 목록 (최신순)"""
+        return [format_date(d) for d in reversed(self.get_date_index().dates)]
+
+    def get_latest_date(self) -> str:
+        """워크시트에서 가장 최근 날짜를 찾아 반환"""
+        latest = self.get_date_index().latest()
+        if latest is not None:
+            print(f"📅 {self.WORKSHEET_LABEL} 최신 날짜: {format_date(latest)}")
+            return format_date(latest)
+        return datetime.now().strftime("%Y.%m.%d")
+
+    def get_today_data(self, target_date: str = None) -> List[Dict[str, Any]]:
+        """
+        워크시트에서 지정된 날짜의 데이터를 가져옴
+
+        Args:
+            target_date: 조회할 날짜 (예: "2025.12.03", "12.03"). None이면 시트의 최신 날짜
+
+        Returns:
+            해당 날짜의 모든 행 데이터 리스트 (COLUMNS 필드 기준)
+        """
+        if target_date is None:
+            target_date = self.get_latest_date()
+
+        day = parse_sheet_date(target_date)
+        if day is None:
+            print(f"⚠️ 날짜 형식을 알 수 없습니다: {target_date}")
+            return []
+
+        # 날짜 인덱스로 해당 날짜 행만 바로 찾음 (범위 조회 모드면 해당 날짜 행만 조회)
+        if self.mirror is not None:
+            # 미러는 (워크시트, 날짜) 인덱스로 해당 날짜 행만 조회
+            snapshot = self.mirror.snapshot(self.WORKSHEET_INDEX, day)
+            positions = range(len(snapshot))
+        elif self.date_search and self.snapshot is None:
+            snapshot, positions = self.load_date_snapshot(day)
+        else:
+            snapshot = self.load_snapshot()
+            positions = snapshot.date_index.rows_for(day)
+
+        # 필요한 열만 한 번에 추출 (헤더 매핑 1회, 숫자 열 변환 포함)
+        today_data = snapshot.columns(self.COLUMNS, positions).to_rows()
+
+        print(f"📊 {target_date} 데이터: {len(today_data)}개 행")
+        return today_data
@@ -3,26 +3,42 @@
 시트2에서 재료별 종목 데이터를 읽어옴
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+import heapq
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict
 from dataclasses import dataclass
 from collections import Counter
 
+from date_index import format_date
+from normalize import date_prefix, format_rate, format_volume, split_date
+from records import slotted
+from sheet_columns import ColumnSpec
+from sheet_reader_base import BaseSheetReader
 
+
+@slotted
 @dataclass
 class RankingStock:
-    """등락률 순위 종목 데이터"""
+    """등락률 순위 종목 데이터 (표시용 문자열은 렌더링할 때만 계산)"""
     date: str           # 날짜
     material: str       # 재료
     stock_name: str     # 종목명
     change_rate: float  # 등락률 (숫자)
-    change_rate_str: str  # 등락률 (표시용)
-    volume: str         # 거래대금
+    volume_value: float  # 거래대금 (백만, 숫자)
     content: str        # 내용
+    
+    @property
+    def change_rate_str(self) -> str:
+        """등락률 (표시용, 예: 29.97)"""
+        return format_rate(self.change_rate, percent=False)
+    
+    @property
+    def volume(self) -> str:
+        """거래대금 (표시용, 예: 38,679)"""
+        return format_volume(self.volume_value)
 
 
+@slotted
 @dataclass
 class MaterialGroup:
     """재료별 그룹"""
@@ -32,13 +48,25 @@ class MaterialGroup:
     is_single: bool     # 단일 종목 여부 (회색 처리)
 
 
-class SheetReaderRanking:
+class SheetReaderRanking(BaseSheetReader):
     """구글 시트 데이터 리더 - 등락률 순위용"""
     
-    SCOPES = [
-        'https://www.googleapis.com/auth/spreadsheets.readonly',
-        'https://www.googleapis.com/auth/drive.readonly'
-    ]
+    WORKSHEET_INDEX = 1       # 시트2 (등락률상위, 0-indexed)
+    WORKSHEET_LABEL = '시트2'  # 지표/스냅샷 키
+    # 필드 → (헤더 이름, 헤더가 없을 때의 열, 숫자 여부)
+    COLUMNS = {
+        'date': ColumnSpec('날짜', 'A'),
+        'material': ColumnSpec('재료', 'B'),
+        'stock_name': ColumnSpec('종목명', 'C'),
+        'change': ColumnSpec('등락률(%)', 'D', numeric=True),
+        'volume': ColumnSpec('거래대금(백만)', 'E', numeric=True),
+        'content': ColumnSpec('내용', 'F'),
+    }
+    # 상위 K 기준 (--top-by) → 숫자 열
+    TOP_BY_COLUMNS = {
+        'change': 'change_value',   # 등락률
+        'volume': 'volume_value',   # 거래대금
+    }
     
     # 재료별 색상 (파스텔톤)
     MATERIAL_COLORS = [
@@ -56,35 +84,24 @@ class SheetReaderRanking:
     
     SINGLE_COLOR = '#E0E0E0'  # 회색 (단일 종목용)
     
-    def __init__(self, credentials_path: str, spreadsheet_id: str):
-        """
-        Args:
-            credentials_path: 서비스 계정 JSON 파일 경로
-            spreadsheet_id: 구글 시트 ID
-        """
-        self.credentials_path = credentials_path
-        self.spreadsheet_id = spreadsheet_id
-        self.client = None
-        self.sheet = None
-        
-    def connect(self):
-        """구글 시트에 연결"""
-        credentials = Credentials.from_service_account_file(
-            self.credentials_path,
-            scopes=self.SCOPES
-        )
-        self.client = gspread.authorize(credentials)
-        self.sheet = self.client.open_by_key(self.spreadsheet_id)
-        print(f"✅ 구글 시트 연결 성공: {self.sheet.title}")
-        
-    def get_ranking_data(self) -> List[RankingStock]:
+    def get_ranking_data(self, days: int = None, top_k: int = None, top_by: str = 'change') -> List[RankingStock]:
         """
-        시트2에서 등락률 순위 데이터를 가져옴 (모든 데이터)
+        시트2에서 등락률 순위 데이터를 가져옴 (기본: 모든 데이터)
         A열의 날짜가 오늘이 아니면 내용 앞에 [년.월.일] 형식으로 추가
         
+        Args:
+            days: 지정하면 A열 기준 최근 N거래일(시트에 있는 날짜) 행만 사용 (1 = 최신 날짜)
+            top_k: 지정하면 top_by 기준 상위 K개 종목만 선택 (힙으로 선택, 시트 순서 유지)
+            top_by: 'change' (등락률) 또는 'volume' (거래대금)
+        
         Returns:
             등락률 순위 데이터 리스트
         """
+        if top_by not in self.TOP_BY_COLUMNS:
+            raise ValueError(f"알 수 없는 상위 기준: {top_by} (change/volume)")
+        if (days is not None and days <= 0) or (top_k is not None and top_k <= 0):
+            raise ValueError(f"days/top_k 는 1 이상이어야 합니다: days={days}, top_k={top_k}")
+        
         # 오늘 날짜
         today = datetime.now()
         today_year = today.year
@@ -93,42 +110,48 @@ class SheetReaderRanking:
         
         print(f"📅 오늘 날짜: {today_year}.{today_month}.{today_day}")
         
-        # 시트2 데이터 가져오기
-        worksheet = self.sheet.get_worksheet(1)  # 시트2
-        all_records = worksheet.get_all_records()
+        snapshot = self.load_snapshot()
+        
+        # 날짜 범위: 최근 N거래일 행 위치만 (날짜 인덱스는 스냅샷당 1회 생성)
+        positions = None
+        if days:
+            window = snapshot.date_index.dates[-days:]
+            if window:
+                positions = snapshot.date_index.rows_between(window[0], window[-1])
+                print(f"📆 최근 {len(window)}거래일: {format_date(window[0])} ~ {format_date(window[-1])}"
+                      f" ({len(positions)}개 행)")
+            else:
+                print("⚠️ A열에서 날짜를 찾지 못해 전체 행을 사용합니다")
+        
+        # 시트2 데이터 가져오기 (필요한 열만, 등락률/거래대금은 숫자로 한 번만 변환)
+        columns = snapshot.columns(self.COLUMNS, positions)
+        
+        # 표시 가능한 행 (등락률/종목명/재료가 있는 행)
+        selected = [i for i in range(len(columns))
+                    if columns['change'][i] and columns['stock_name'][i] and columns['material'][i]]
         
-        # 모든 데이터 가져오기
+        # 상위 K개: 전체 정렬 대신 힙으로 선택 (같은 값은 시트 앞쪽 행 우선)
+        if top_k and len(selected) > top_k:
+            values = columns[self.TOP_BY_COLUMNS[top_by]]
+            selected = sorted(heapq.nlargest(top_k, selected, key=lambda i: values[i] or 0.0))
+            label = '등락률' if top_by == 'change' else '거래대금'
+            print(f"🏆 {label} 상위 {top_k}개 선택")
+        
+        # 선택된 행만 종목으로 생성
         ranking_data = []
-        for row in all_records:
-            # 등락률 숫자 추출
-            change_rate_str = str(row.get('등락률(%)', row.get('D', ''))).strip()
-            if not change_rate_str:
-                continue
-                
-            change_rate_num = self._extract_number(change_rate_str)
-            
-            # A열에서 날짜 가져오기
-            date_str = str(row.get('날짜', row.get('A', ''))).strip()
-            
-            # 내용 가져오기
-            content = str(row.get('내용', row.get('F', ''))).strip()
-            
+        for i in selected:
             # 날짜가 오늘이 아니면 내용 앞에 [년.월.일] 추가
-            content = self._add_date_prefix(date_str, content, today_year, today_month, today_day)
+            content = self._add_date_prefix(columns['date'][i], columns['content'][i],
+                                            today_year, today_month, today_day)
             
-            stock = RankingStock(
-                date=date_str,
-                material=str(row.get('재료', row.get('B', ''))).strip(),
-                stock_name=str(row.get('종목명', row.get('C', ''))).strip(),
-                change_rate=change_rate_num,
-                change_rate_str=self._format_change_rate(change_rate_str),
-                volume=self._format_volume(str(row.get('거래대금(백만)', row.get('E', ''))).strip()),
+            ranking_data.append(RankingStock(
+                date=columns['date'][i],
+                material=columns['material'][i],
+                stock_name=columns['stock_name'][i],
+                change_rate=columns['change_value'][i] or 0.0,
+                volume_value=columns['volume_value'][i] or 0.0,
                 content=content
-            )
-            
-            # 빈 데이터 제외
-            if stock.stock_name and stock.material:
-                ranking_data.append(stock)
+            ))
                     
         print(f"📊 시트2 데이터: {len(ranking_data)}개 행")
         return ranking_data
@@ -145,36 +168,18 @@ class SheetReaderRanking:
         Returns:
             처리된 내용
         """
-        import re
-        
         if not date_str or not content:
             return content
         
-        # 날짜 파싱 (2025.12.4, 2025.12.04, 25.12.4 등 지원)
-        # 패턴: 년도(2자리 또는 4자리).월.일
-        match = re.match(r'^(20)?(\d{2})[.\-/](\d{1,2})[.\-/](\d{1,2})$', date_str.strip())
-        
-        if not match:
+        # 날짜 파싱 (같은 날짜 문자열이 반복되므로 캐시됨, 연도 없는 값은 그대로)
+        parts = split_date(date_str)
+        if parts is None or parts[0] is None:
             return content
         
-        # 날짜 추출
-        year = int(match.group(2))  # 2자리 년도 (예: 25)
-        month = int(match.group(3))
-        day = int(match.group(4))
-        
-        # 4자리 년도로 변환 (25 -> 2025)
-        full_year = 2000 + year if year < 100 else year
-        
-        # 오늘 날짜인지 확인
-        is_today = (full_year == today_year and month == today_month and day == today_day)
-        
-        if is_today:
-            # 오늘이면 그대로 반환
+        # 오늘이면 그대로, 아니면 [년.월.일] 형식으로 앞에 추가
+        if parts == (today_year, today_month, today_day):
             return content
-        else:
-            # 오늘이 아니면 [년.월.일] 형식으로 앞에 추가
-            date_prefix = f"[{year:02d}.{month:02d}.{day:02d}]"
-            return f"{date_prefix} {content}"
+        return f"{date_prefix(*parts)} {content}"
     
     def group_by_material(self, stocks: List[RankingStock]) -> List[MaterialGroup]:
         """
@@ -246,37 +251,6 @@ class SheetReaderRanking:
             print(f"  • {group.material}: {len(group.stocks)}종목 ({color_name})")
         
         return groups
-    
-    def _extract_number(self, value: str) -> float:
-        """문자열에서 숫자 추출"""
-        import re
-        # 숫자와 소수점만 추출
-        match = re.search(r'[-+]?\d*\.?\d+', value.replace(',', ''))
-        if match:
-            return float(match.group())
-        return 0.0
-    
-    def _format_change_rate(self, rate: str) -> str:
-        """등락률 포맷 정리"""
-        rate = rate.strip()
-        if not rate:
-            return "0.00"
-            
-        # 숫자만 추출
-        num = self._extract_number(rate)
-        return f"{num:.2f}"
-    
-    def _format_volume(self, volume: str) -> str:
-        """거래대금 포맷 정리"""
-        volume = volume.strip()
-        if not volume:
-            return "0"
-            
-        # 숫자만 추출
-        num = self._extract_number(volume)
-        
-        # 천 단위 콤마 추가
-        return f"{int(num):,}"
 
 
 # 테스트용
@@ -0,0 +1,100 @@
+"""
+워크시트 스냅샷 모듈
+- 워크시트 전체 값을 한 번만 받아와서 메모리에 보관
+- 최신 날짜 조회, 날짜 필터링 등 모든 조회를 같은 스냅샷에서 처리
+- 범위 조회: 날짜순으로 추가만 되는 시트에서 헤더 + 마지막 N행,
+  또는 A열(날짜)로 찾은 대상 날짜 구간만 조회 (누적 행 수와 무관한 조회 비용)
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from date_index import DateIndex
+from sheet_columns import ColumnSpec, SheetColumns
+
+
+class SheetSnapshot:
+    """워크시트 1회 조회 결과 (헤더 + 데이터 행)"""
+
+    def __init__(self, header: List[str], rows: List[List[Any]], start_row: int = 2):
+        """
+        Args:
+            header: 1행 헤더 (예: ['날짜', '타입', '그룹명', ...])
+            rows: 데이터 행
+            start_row: rows[0] 의 시트 행 번호 (전체 조회면 2)
+        """
+        self.header = [str(h).strip() for h in header]
+        self.rows = rows
+        self.start_row = start_row
+        self._records = None
+        self._date_index = None
+
+    @classmethod
+    def from_values(cls, values: List[List[Any]]) -> 'SheetSnapshot':
+        """worksheet.get_all_values() 결과(1행=헤더)로 스냅샷 생성"""
+        if not values:
+            return cls([], [])
+        return cls(values[0], values[1:])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """rows[position] 한 행만 헤더 키 dict 로 변환 (전체 records 를 만들지 않음)"""
+        if self._records is not None:
+            return self._records[position]
+        row = list(self.rows[position])
+        return dict(zip(self.header, row + [''] * (len(self.header) - len(row))))
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """헤더를 키로 하는 행 dict 리스트 (get_all_records 와 같은 형태)"""
+        if self._records is None:
+            width = len(self.header)
+            self._records = [
+                dict(zip(self.header, list(row) + [''] * (width - len(row))))
+                for row in self.rows
+            ]
+        return self._records
+
+    def columns(self, specs: Dict[str, ColumnSpec], positions: Iterable[int] = None) -> SheetColumns:
+        """필요한 필드만 열 배열로 추출 (헤더 매핑은 호출당 1회)"""
+        return SheetColumns.from_rows(self.header, self.rows, specs, positions)
+
+    @property
+    def date_index(self) -> DateIndex:
+        """A열(날짜) 인덱스 (최초 사용 시 1회 생성, 위치는 rows 기준)"""
+        if self._date_index is None:
+            self._date_index = DateIndex([row[0] if row else '' for row in self.rows])
+        return self._date_index
+
+
+def fetch_rows(worksheet, first_row: int, last_row: int) -> SheetSnapshot:
+    """
+    헤더(1행) + first_row~last_row 행만 조회 (batch_get 1회)
+
+    Args:
+        worksheet: gspread Worksheet
+        first_row, last_row: 시트 행 번호 (1-based, 헤더 제외)
+    """
+    header_range, body_range = worksheet.batch_get(['1:1', f'{first_row}:{last_row}'])
+    header = header_range[0] if header_range else []
+    return SheetSnapshot(header, list(body_range), start_row=first_row)
+
+
+def fetch_tail(worksheet, tail_rows: int, date_column: List[str] = None) -> SheetSnapshot:
+    """
+    헤더 + 마지막 tail_rows 행만 조회
+
+    Args:
+        worksheet: gspread Worksheet
+        tail_rows: 가져올 마지막 행 수
+        date_column: 이미 조회한 A열 값 (없으면 col_values(1) 로 조회)
+    """
+    if date_column is None:
+        date_column = worksheet.col_values(1)
+    last_row = len(date_column)
+    if last_row < 2:
+        return SheetSnapshot(date_column[:1], [])
+    first_row = max(2, last_row - tail_rows + 1)
+    return fetch_rows(worksheet, first_row, last_row)
+
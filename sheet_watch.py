@@ -0,0 +1,286 @@
+"""
+시트 변경 감시 모듈 (강세테마 --watch)
+- 폴링: 스프레드시트 최종 수정 시각(Drive 메타데이터, 가벼운 요청 1회)만 주기적으로 확인
+  (--source 파일이면 파일 수정 시각)
+- 수정 시각이 바뀌면 편집이 잠잠해질 때까지 기다린 뒤(디바운스) 워크시트를 다시 조회
+- 날짜별 행 해시를 비교해 바뀐 날짜만 다시 그룹화
+- 페이지별 카드 해시를 비교해 바뀐 페이지만 다시 렌더링 (브라우저는 감시 내내 유지)
+- 장 시간(기본 평일 09:00~15:30, 한국 시간)에만 감시하고 장 마감 후 종료
+
+리더는 connect / load_snapshot / get_today_data / group_data,
+렌더러는 generate_async(browser=..., page_numbers=...) / page_paths / CARDS_PER_PAGE 를 제공해야 함
+
+사용법:
+    watcher = SheetWatcher(reader, renderer, 'output/강세테마')
+    watcher.run()
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from date_index import format_date
+
+
+KST = timezone(timedelta(hours=9))
+DEFAULT_INTERVAL = 30.0              # 수정 시각 확인 주기 (초)
+DEFAULT_DEBOUNCE = 10.0              # 마지막 편집 후 이 시간 동안 변화가 없으면 조회 (초)
+DEBOUNCE_MAX_WAIT = 120.0            # 편집이 계속돼도 이 시간이 지나면 조회 (초)
+DEFAULT_MARKET_HOURS = '09:00-15:30'
+
+
+def parse_market_hours(text: str) -> Tuple[dtime, dtime]:
+    """
+    장 시간 문자열 파싱
+
+    Args:
+        text: 예) "09:00-15:30"
+
+    Raises:
+        ValueError: 형식이 잘못됐거나 시작이 끝보다 늦을 때
+    """
+    try:
+        start, end = (datetime.strptime(part.strip(), "%H:%M").time() for part in text.split('-'))
+    except ValueError:
+        raise ValueError(f"장 시간 형식을 알 수 없습니다: {text} (예: 09:00-15:30)") from None
+    if start >= end:
+        raise ValueError(f"장 시작이 마감보다 늦습니다: {text}")
+    return start, end
+
+
+def market_state(now: datetime, hours: Tuple[dtime, dtime]) -> str:
+    """'open' (장중), 'before' (오늘 장 시작 전), 'closed' (장 마감 후 / 주말)"""
+    if now.weekday() >= 5:
+        return 'closed'
+    current = now.time()
+    if current < hours[0]:
+        return 'before'
+    if current > hours[1]:
+        return 'closed'
+    return 'open'
+
+
+def rows_digest(rows: Iterable[List]) -> str:
+    """행 목록 해시 (셀 값 기준)"""
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def date_digests(snapshot, skip_oldest: bool = False) -> Dict[date, str]:
+    """
+    날짜별 행 해시
+
+    Args:
+        snapshot: SheetSnapshot
+        skip_oldest: True면 가장 오래된 날짜 제외 (--tail-rows 처럼 앞부분이 잘린 스냅샷용)
+    """
+    index = snapshot.date_index
+    dates = index.dates[1:] if skip_oldest else index.dates
+    return {d: rows_digest(snapshot.rows[p] for p in index.rows_for(d)) for d in dates}
+
+
+def page_digest(page_cards: List, date_str: str) -> str:
+    """페이지 1장의 카드 해시 (카드 dataclass repr 기준)"""
+    return hashlib.sha1(repr((date_str, page_cards)).encode('utf-8')).hexdigest()
+
+
+def source_version(reader) -> str:
+    """데이터 원본의 수정 시각 (바뀌었을 때만 다시 조회)"""
+    if reader.file_source is not None:
+        return str(os.path.getmtime(reader.file_source.resolve(reader.WORKSHEET_LABEL)))
+    return reader.sheet.get_lastUpdateTime()
+
+
+class SheetWatcher:
+    """장중 시트 감시 → 바뀐 페이지만 다시 렌더링"""
+
+    def __init__(self, reader, renderer, output_prefix: str, interval: float = DEFAULT_INTERVAL,
+                 debounce: float = DEFAULT_DEBOUNCE, market_hours: Tuple[dtime, dtime] = None,
+                 clock: Callable[[], datetime] = None):
+        """
+        Args:
+            reader: 시트 리더 (연결 전이어도 됨)
+            renderer: HTML 렌더러
+            output_prefix: 출력 경로 앞부분 (예: output/강세테마 → output/강세테마_20251203.png)
+            interval: 수정 시각 확인 주기 (초)
+            debounce: 편집이 멈춘 뒤 기다릴 시간 (초)
+            market_hours: (장 시작, 장 마감) 한국 시간 (기본 09:00~15:30)
+            clock: 현재 시각 함수 (기본 한국 시간)
+        """
+        self.reader = reader
+        self.renderer = renderer
+        self.output_prefix = output_prefix
+        self.interval = interval
+        self.debounce = debounce
+        self.market_hours = market_hours or parse_market_hours(DEFAULT_MARKET_HOURS)
+        self.clock = clock or (lambda: datetime.now(KST))
+        self.output_files: List[str] = []        # 감시 중 생성한 이미지 (중복 없이)
+        self.cycles = 0                          # 변경을 감지해 다시 조회한 횟수
+        self._digests: Dict[date, str] = {}      # 날짜 → 행 해시
+        self._pages: Dict[str, str] = {}         # 이미지 경로 → 렌더링한 카드 해시
+        self._paths: Dict[str, List[str]] = {}   # 날짜 → 마지막으로 만든 이미지 경로들
+
+    async def run_async(self):
+        """감시 실행 (장 마감 또는 중단될 때까지)"""
+        import asyncio
+
+        # 렌더링할 때만 로드 (Playwright 임포트가 무거움)
+        from playwright.async_api import async_playwright
+
+        loop = asyncio.get_event_loop()
+        # 리더는 스레드 안전하지 않으므로 작업 스레드 1개에서 순서대로 실행
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='watch')
+
+        def call(func, *args):
+            return loop.run_in_executor(executor, func, *args)
+
+        def load(refresh: bool):
+            if self.reader.sheet is None and self.reader.file_source is None:
+                self.reader.connect()
+            version = source_version(self.reader)
+            return version, self.reader.load_snapshot(refresh=refresh)
+
+        try:
+            async with async_playwright() as p:
+                # 첫 조회와 브라우저 실행을 동시에
+                launch = asyncio.ensure_future(p.chromium.launch())
+                try:
+                    version, snapshot = await call(load, False)
+                except BaseException:
+                    # 첫 조회 실패: 이미 실행 중인 브라우저를 기다려 닫고 원래 오류를 전달
+                    browser = (await asyncio.gather(launch, return_exceptions=True))[0]
+                    if not isinstance(browser, BaseException):
+                        await browser.close()
+                    raise
+                browser = await launch
+
+                try:
+                    # 시작 시 최신 날짜를 한 번 생성 (이후 변경 비교의 기준)
+                    self._digests = date_digests(snapshot, skip_oldest=bool(self.reader.tail_rows))
+                    latest = snapshot.date_index.latest()
+                    if latest is not None:
+                        await self._render_date(latest, browser, call)
+
+                    while True:
+                        now = self.clock()
+                        state = market_state(now, self.market_hours)
+                        if state == 'closed':
+                            print(f"🔔 장 시간이 아닙니다 ({now:%H:%M}) - 감시를 종료합니다")
+                            break
+                        if state == 'before':
+                            opens_at = datetime.combine(now.date(), self.market_hours[0], tzinfo=now.tzinfo)
+                            wait = (opens_at - now).total_seconds()
+                            print(f"💤 장 시작 전 - {wait / 60:.0f}분 대기")
+                            await asyncio.sleep(wait)
+                            continue
+
+                        await asyncio.sleep(self.interval)
+                        current = await call(source_version, self.reader)
+                        if current == version:
+                            continue
+
+                        # 디바운스: 연속 편집이 멈출 때까지 대기 (최대 DEBOUNCE_MAX_WAIT)
+                        print(f"\n✏️ 시트 수정 감지 - 편집이 멈출 때까지 {self.debounce:.0f}초 대기")
+                        waited = 0.0
+                        while waited < DEBOUNCE_MAX_WAIT:
+                            await asyncio.sleep(self.debounce)
+                            waited += self.debounce
+                            latest_version = await call(source_version, self.reader)
+                            if latest_version == current:
+                                break
+                            current = latest_version
+
+                        version, snapshot = await call(load, True)
+                        self.cycles += 1
+                        digests = date_digests(snapshot, skip_oldest=bool(self.reader.tail_rows))
+                        changed = [d for d, h in digests.items() if self._digests.get(d) != h]
+                        self._digests = digests
+                        if not changed:
+                            print("  변경된 날짜 없음 (다른 워크시트 수정)")
+                            continue
+                        print(f"  변경된 날짜: {', '.join(format_date(d) for d in changed)}")
+                        for day in changed:
+                            await self._render_date(day, browser, call)
+                finally:
+                    await browser.close()
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _render_date(self, day: date, browser, call):
+        """날짜 1개: 그룹화(스레드) → 카드가 바뀐 페이지만 렌더링"""
+        label = format_date(day)
+
+        def prepare():
+            raw_data = self.reader.get_today_data(label)
+            return self.reader.group_data(raw_data) if raw_data else []
+
+        cards = await call(prepare)
+        output_path = f"{self.output_prefix}_{label.replace('.', '')}"
+        paths = self.renderer.page_paths(cards, output_path)
+
+        # 페이지 수가 줄었거나 번호 형식이 바뀌어 남은 이전 이미지 삭제
+        for stale in set(self._paths.get(label, [])) - set(paths):
+            if os.path.exists(stale):
+                os.remove(stale)
+                print(f"🗑️ 이전 페이지 삭제: {stale}")
+            self._pages.pop(stale, None)
+        self._paths[label] = paths
+
+        per_page = self.renderer.CARDS_PER_PAGE
+        digests = [page_digest(cards[n * per_page:(n + 1) * per_page], label) for n in range(len(paths))]
+        changed = {n for n, path in enumerate(paths)
+                   if self._pages.get(path) != digests[n] or not os.path.exists(path)}
+        if not changed:
+            print(f"  {label}: 카드 변경 없음")
+            return
+
+        print(f"🎨 {label}: {len(changed)}/{len(paths)}페이지 다시 생성")
+        rendered = await self.renderer.generate_async(cards, label, output_path, browser=browser,
+                                                      page_numbers=changed)
+        for path in rendered:
+            self._pages[path] = digests[paths.index(path)]
+            if path not in self.output_files:
+                self.output_files.append(path)
+
+    def run(self):
+        """동기 래퍼"""
+        import asyncio
+        asyncio.run(self.run_async())
+
+
+# 자체 점검: --tail-rows 감시 중 시트 끝에 행이 추가되면 다시 조회한 스냅샷에 새 행이 포함되는지
+if __name__ == "__main__":
+    from sheet_reader_theme import SheetReaderTheme
+
+    class FakeWorksheet:
+        """col_values / batch_get 만 흉내내는 워크시트"""
+
+        def __init__(self, values):
+            self.values = values
+
+        def col_values(self, col):
+            return [row[col - 1] for row in self.values]
+
+        def batch_get(self, ranges):
+            first, last = (int(n) for n in ranges[1].split(':'))
+            return [self.values[:1], self.values[first - 1:last]]
+
+    header = ['날짜', '타입', '그룹명', '종목명', '등락률', '거래대금', '이슈내용']
+    worksheet = FakeWorksheet([header, ['2025.12.03', '테마', '2차전지', '에코프로', '12.5%', '1000', '수주']])
+    reader = SheetReaderTheme('', '', tail_rows=5)
+    reader.sheet = type('FakeSheet', (), {'get_worksheet': lambda self, index: worksheet})()
+
+    before = date_digests(reader.load_snapshot(), skip_oldest=True)
+    worksheet.values.append(['2025.12.04', '테마', '반도체', '한미반도체', '8.1%', '800', '실적'])
+    after = date_digests(reader.load_snapshot(refresh=True), skip_oldest=True)
+
+    assert len(reader.snapshot) == 2, "다시 조회한 스냅샷에 추가된 행이 없습니다"
+    assert date(2025, 12, 4) in after and date(2025, 12, 4) not in before
+    assert [row['stock'] for row in reader.get_today_data('2025.12.04')] == ['한미반도체']
+    print("✅ 행 추가 후 다시 조회 시 새 행 포함")
@@ -0,0 +1,135 @@
+"""
+스프레드시트 일괄 로더 모듈
+- 급등이슈(시트1) / 등락률상위(시트2) / 강세테마(시트3)는 같은 스프레드시트에 있음
+- 리더마다 따로 인증/열기/조회하지 않고, 필요한 워크시트를
+  values_batch_get 한 번으로 받아 각 리더에 스냅샷으로 나눠줌
+- 워크시트 제목은 열 때 받은 메타데이터를 사용 (요청: 열기 1회 + 값 일괄 조회 1회)
+
+사용법:
+    loader = SpreadsheetLoader(CREDENTIALS_PATH, SPREADSHEET_ID)
+    loader.connect()
+    loader.attach(issue_reader, ranking_reader, theme_reader)
+    raw_data = issue_reader.get_today_data()   # 추가 API 호출 없음
+"""
+
+from typing import Dict, List
+
+from sheet_snapshot import SheetSnapshot
+
+
+class SpreadsheetLoader:
+    """한 스프레드시트의 여러 워크시트를 한 번에 읽는 로더"""
+
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets.readonly',
+        'https://www.googleapis.com/auth/drive.readonly'
+    ]
+
+    def __init__(self, credentials_path: str, spreadsheet_id: str, timeout: float = None):
+        """
+        Args:
+            credentials_path: 서비스 계정 JSON 파일 경로
+            spreadsheet_id: 구글 시트 ID
+            timeout: 구글 API 요청 타임아웃 (초). None이면 제한 없음
+        """
+        self.credentials_path = credentials_path
+        self.spreadsheet_id = spreadsheet_id
+        self.timeout = timeout
+        self.client = None
+        self.sheet = None
+        self._titles: List[str] = None
+
+    def connect(self):
+        """구글 시트에 연결 (인증 1회)"""
+        # 인증 토큰/HTTP 세션/스프레드시트는 같은 프로세스의 리더들과 공유
+        from gsheet_client import open_spreadsheet
+
+        self.client, self.sheet = open_spreadsheet(
+            self.credentials_path, self.spreadsheet_id, self.SCOPES, timeout=self.timeout
+        )
+        print(f"✅ 구글 시트 연결 성공: {self.sheet.title}")
+
+    def worksheet_titles(self) -> List[str]:
+        """
+        워크시트 제목 목록 (시트 순서대로)
+
+        connect() 에서 스프레드시트를 열 때 받은 메타데이터를 사용하므로 추가 요청 없음
+        (메타데이터를 보관하지 않은 Spreadsheet 가 주입된 경우에만 1회 조회)
+        """
+        if self._titles is None:
+            sheets = getattr(self.sheet, 'worksheet_properties', None)
+            if sheets is None:
+                metadata = self.sheet.fetch_sheet_metadata(
+                    params={'fields': 'sheets.properties(index,title)'}
+                )
+                sheets = [s['properties'] for s in metadata.get('sheets', [])]
+            sheets = sorted(sheets, key=lambda p: p.get('index', 0))
+            self._titles = [p['title'] for p in sheets]
+        return self._titles
+
+    def load(self, indexes: List[int]) -> Dict[int, SheetSnapshot]:
+        """
+        여러 워크시트를 values_batch_get 한 번으로 조회
+
+        Args:
+            indexes: 워크시트 번호 목록 (0-indexed)
+
+        Returns:
+            {워크시트 번호: SheetSnapshot}
+        """
+        titles = self.worksheet_titles()
+        indexes = sorted(set(indexes))
+        ranges = []
+        for index in indexes:
+            if index >= len(titles):
+                raise IndexError(f"워크시트 {index + 1}번이 없습니다 (전체 {len(titles)}개)")
+            # 작은따옴표는 두 번 써서 이스케이프 (A1 표기법)
+            ranges.append("'{}'".format(titles[index].replace("'", "''")))
+
+        response = self.sheet.values_batch_get(ranges)
+        value_ranges = response.get('valueRanges', [])
+
+        snapshots = {}
+        for index, value_range in zip(indexes, value_ranges):
+            snapshots[index] = SheetSnapshot.from_values(value_range.get('values', []))
+        print(f"📥 워크시트 {len(snapshots)}개 일괄 조회: "
+              + ", ".join(f"{titles[i]}({len(s)}행)" for i, s in snapshots.items()))
+        return snapshots
+
+    def attach(self, *readers):
+        """
+        리더들이 필요로 하는 워크시트를 한 번에 읽어 각 리더에 주입
+
+        리더는 WORKSHEET_INDEX 속성과 use_snapshot() 메서드를 가져야 함
+        (SheetReader, SheetReaderRanking, SheetReaderTheme)
+        """
+        snapshots = self.load([r.WORKSHEET_INDEX for r in readers])
+        for reader in readers:
+            reader.client = self.client
+            reader.sheet = self.sheet
+            reader.use_snapshot(snapshots[reader.WORKSHEET_INDEX])
+        return snapshots
+
+
+if __name__ == "__main__":
+    import os
+
+    from sheet_reader import SheetReader
+    from sheet_reader_ranking import SheetReaderRanking
+    from sheet_reader_theme import SheetReaderTheme
+
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    CREDENTIALS_PATH = os.path.join(BASE_DIR, "service_account.json.json")
+    SPREADSHEET_ID = "1dX8Diej7AQixm7fBrnrdUybxW2Au9QzyATYRBKZN_jk"
+
+    issue_reader = SheetReader(CREDENTIALS_PATH, SPREADSHEET_ID)
+    ranking_reader = SheetReaderRanking(CREDENTIALS_PATH, SPREADSHEET_ID)
+    theme_reader = SheetReaderTheme(CREDENTIALS_PATH, SPREADSHEET_ID)
+
+    loader = SpreadsheetLoader(CREDENTIALS_PATH, SPREADSHEET_ID)
+    loader.connect()
+    loader.attach(issue_reader, ranking_reader, theme_reader)
+
+    print(f"급등이슈 최신 날짜: {issue_reader.get_latest_date()}")
+    print(f"강세테마 최신 날짜: {theme_reader.get_latest_date()}")
+    print(f"등락률상위 행 수: {len(ranking_reader.get_ranking_data())}")
@@ -0,0 +1,82 @@
+"""
+시작 속도 측정 모듈 (--profile-startup)
+- `python -X importtime` 으로 메인 모듈 임포트 시간을 측정
+- 임포트 시간이 큰 모듈 순으로 출력
+- 무거운 라이브러리(gspread, google-auth, pyairtable, playwright)가
+  시작 시점에 로드되는지 확인
+"""
+
+import os
+import re
+import sys
+import time
+import subprocess
+from typing import List, Tuple
+
+
+# 실제로 필요한 코드 경로에서만 로드되어야 하는 라이브러리
+HEAVY_MODULES = ['gspread', 'google.oauth2', 'pyairtable', 'playwright']
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$')
+
+
+def measure_imports(module_name: str, base_dir: str) -> Tuple[float, List[Tuple[int, int, int, str]]]:
+    """
+    별도 프로세스에서 모듈을 임포트하며 -X importtime 결과 수집
+
+    Args:
+        module_name: 측정할 모듈 이름 (예: 'main')
+        base_dir: 모듈이 있는 폴더
+
+    Returns:
+        (전체 소요 시간(초), [(자체 us, 누적 us, 깊이, 모듈명), ...])
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=base_dir,
+        capture_output=True,
+        text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            entries.append((int(self_us), int(cumulative_us), depth, name))
+    return elapsed, entries
+
+
+def profile_startup(module_name: str, base_dir: str = None, top: int = 15):
+    """임포트 시간 상세 출력"""
+    base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+    elapsed, entries = measure_imports(module_name, base_dir)
+
+    total_us = sum(self_us for self_us, _, _, _ in entries)
+    print(f"⏱️ '{module_name}' 시작 시간: 프로세스 {elapsed * 1000:.1f}ms"
+          f" (임포트 합계 {total_us / 1000:.1f}ms, 모듈 {len(entries)}개)")
+
+    # 메인 모듈이 직접 임포트한 모듈만 누적 시간 순으로 출력
+    # (importtime 출력은 자식 → 부모 순서이므로 메인 모듈 직전의 깊이 1 항목들이 자식)
+    direct, pending = [], []
+    for entry in entries:
+        if entry[2] == 1:
+            pending.append(entry)
+        elif entry[2] == 0:
+            if entry[3] == module_name:
+                direct = pending
+            pending = []
+    direct.sort(key=lambda e: e[1], reverse=True)
+    print(f"\n{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for self_us, cumulative_us, _, name in direct[:top]:
+        print(f"{cumulative_us / 1000:>10.1f} {self_us / 1000:>10.1f}  {name}")
+
+    loaded = {name for _, _, _, name in entries}
+    eager = [m for m in HEAVY_MODULES if any(n == m or n.startswith(m + '.') for n in loaded)]
+    if eager:
+        print(f"\n⚠️ 시작 시점에 로드된 무거운 모듈: {', '.join(eager)}")
+    else:
+        print("\n✅ 무거운 모듈(gspread/google-auth/pyairtable/playwright)은 필요할 때만 로드됩니다")